@@ -0,0 +1,62 @@
+"""Benchmark of delta-stepping against dijkstra_heap on a random weighted graph for an increasing number of workers.
+
+Run from the repository root with:
+    python -m benchmarks.delta_stepping --nodes 200000 --degree 8 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+import numpy as np
+from graphs.datastructures import CSRGraph
+from graphs.delta_stepping import delta_stepping
+from graphs.dijkstra import dijkstra_heap
+
+
+def random_graph(
+    number_nodes: int, degree: int, max_weight: int, seed: int
+) -> CSRGraph:
+    """Build a random directed CSR graph where every node has the same number of outgoing edges.
+
+    Args:
+        number_nodes (int): The number of nodes of the graph.
+        degree (int): The number of outgoing edges of every node.
+        max_weight (int): Weights are drawn uniformly from [1, max_weight].
+        seed (int): Seed of the random generator.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    generator = np.random.default_rng(seed)
+    indptr = np.arange(0, number_nodes * degree + 1, degree, dtype=np.int64)
+    indices = generator.integers(0, number_nodes, number_nodes * degree, dtype=np.int32)
+    weights = generator.integers(1, max_weight + 1, number_nodes * degree).astype(
+        np.float64
+    )
+    return CSRGraph(list(range(number_nodes)), indptr, indices, weights, directed=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--max-weight", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    graph = random_graph(
+        arguments.nodes, arguments.degree, arguments.max_weight, arguments.seed
+    )
+    start = time.perf_counter()
+    expected_distances = dijkstra_heap(graph, 0)
+    print(f"dijkstra_heap: {time.perf_counter() - start:.2f}s")
+    for workers in arguments.workers:
+        start = time.perf_counter()
+        distances = delta_stepping(graph, 0, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert distances == expected_distances
+        print(f"delta_stepping, {workers} worker(s): {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
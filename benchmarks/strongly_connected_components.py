@@ -0,0 +1,61 @@
+"""Benchmark of the strongly connected component algorithms on a random graph and on a ring, whose diameter is the number of nodes.
+
+Run from the repository root with:
+    python -m benchmarks.strongly_connected_components --nodes 200000 --degree 2 --workers 1 2 4
+"""
+
+import argparse
+import time
+import numpy as np
+from graphs.datastructures import CSRGraph
+from graphs.forward_backward import forward_backward_strongly_connected_components
+from graphs.kosaraju import find_strongly_connected_components
+from graphs.tarjan import tarjan_strongly_connected_components
+from benchmarks.delta_stepping import random_graph
+
+
+def ring_graph(number_nodes: int) -> CSRGraph:
+    """Build a directed ring, in which every node has a single edge to the next one.
+
+    Args:
+        number_nodes (int): The number of nodes of the ring.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    indptr = np.arange(number_nodes + 1, dtype=np.int64)
+    indices = ((np.arange(number_nodes) + 1) % number_nodes).astype(np.int32)
+    return CSRGraph(list(range(number_nodes)), indptr, indices, directed=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--degree", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    graphs = {
+        "random": random_graph(arguments.nodes, arguments.degree, 1, arguments.seed),
+        "ring": ring_graph(arguments.nodes),
+    }
+    for name, graph in graphs.items():
+        start = time.perf_counter()
+        components, _ = tarjan_strongly_connected_components(graph)
+        print(f"{name}, tarjan: {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        find_strongly_connected_components(graph)
+        print(f"{name}, kosaraju: {time.perf_counter() - start:.2f}s")
+        for workers in arguments.workers:
+            start = time.perf_counter()
+            fw_bw_components, _ = forward_backward_strongly_connected_components(
+                graph, workers=workers
+            )
+            elapsed = time.perf_counter() - start
+            assert len(np.unique(fw_bw_components)) == len(np.unique(components))
+            print(f"{name}, forward-backward, {workers} worker(s): {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,216 @@
-from graphs.datastructures import DirectedGraph
+from collections import deque
+from graphs.datastructures import DirectedGraph, CSRGraph
 import numpy as np
 
-def bellman_ford(graph: DirectedGraph, starting_node: object) -> dict:
+def bellman_ford(graph: DirectedGraph | CSRGraph, starting_node: object) -> dict:
     """
     Compute the single-source distances based on given graph and starting node.
 
     Args:
-        graph (DirectedGraph): The input graph for which the distances should be computed.
+        graph (DirectedGraph | CSRGraph): The input graph for which the distances should be computed.
         starting_node (object): The starting node from which to compute all distances.
 
     Returns:
         dict: A dictionnary containing distances to all nodes from starting node. Is empty in case a negative cycle is detected.
     """
+    # Each round looks up the incoming edges of every node, so a DirectedGraph gets an incoming-edge index.
+    # The index is then maintained by the graph and reused by later calls.
+    if type(graph) == DirectedGraph:
+        graph.enable_incoming_index()
     graph_nodes = graph.get_nodes()
     num_nodes = len(graph_nodes)
-    # Initialize the solution array
-    solution_array = [{node:np.inf for node in graph_nodes} for _ in range(num_nodes + 1) ]
-    solution_array[0][starting_node] = 0
+    # Only the solutions of the previous and current problem sizes are kept, so the memory used is O(n)
+    previous_solution = {node:np.inf for node in graph_nodes}
+    previous_solution[starting_node] = 0
     # Iterate over all problem sizes
     # The size of a problem is defined by the number of hops that are allowed to reach a node
     for problem_size in range(1, num_nodes + 1):
         stable = True # Helper variable to check if there is a negative cycle
+        current_solution = {}
         for node in graph_nodes:
             # Inspect all nodes in the graph
             shortest_path_with_hop = np.inf
-            incoming_nodes = graph.get_incoming_nodes(node)
+            if graph.weighted:
+                incoming_edges = graph.get_incoming_nodes_and_weights(node)
+            else:
+                incoming_edges = [(previous_node, 1) for previous_node in graph.get_incoming_nodes(node)]
             # First finding the minimum distance by adding a hop to reach the inspected node
-            for previous_node in incoming_nodes:
-                distance_with_hop = solution_array[problem_size - 1][previous_node] + graph.get_distance(previous_node, node)
+            for previous_node, weight in incoming_edges:
+                distance_with_hop = previous_solution[previous_node] + weight
                 if distance_with_hop < shortest_path_with_hop:
                     shortest_path_with_hop = distance_with_hop
             # Choosing the solution for the inspected node and given problem size
             # Either adding a hop reduces the distances or we keep the previous solution
-            solution_array[problem_size][node] = min(solution_array[problem_size - 1][node], shortest_path_with_hop)
-            if solution_array[problem_size][node] != solution_array[problem_size - 1][node]:
+            current_solution[node] = min(previous_solution[node], shortest_path_with_hop)
+            if current_solution[node] != previous_solution[node]:
                 stable = False
         # Once a stable solution was found we can return the solution
         if stable:
-            return solution_array[problem_size - 1]
+            return previous_solution
+        previous_solution = current_solution
     # No stable solution has been found
-    return {}
\ No newline at end of file
+    return {}
+
+
+def bellman_ford_queue(graph: DirectedGraph | CSRGraph, starting_node: object, strategy: str = "fifo") -> tuple[dict, list]:
+    """
+    Compute the single-source distances with the queue-based variant of Bellman-Ford (SPFA).
+    Only the outgoing edges of the nodes whose distance changed are relaxed again, and the algorithm stops as soon as the queue is empty.
+    The predecessor graph is checked for a cycle every n relaxations, which can only be a negative cycle.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The input graph for which the distances should be computed.
+        starting_node (object): The starting node from which to compute all distances.
+        strategy (str): "fifo" appends every updated node to the queue. "slf" (small label first) puts it at the front of the queue
+                        when its distance is smaller than the distance of the current front node, which usually settles distances sooner.
+
+    Returns:
+        tuple[dict, list]: A dictionnary containing distances to all nodes from starting node and an empty list.
+                           In case a negative cycle is detected, an empty dictionnary and the nodes of the cycle in edge order.
+    """
+    if type(graph) not in (DirectedGraph, CSRGraph):
+        raise TypeError("Please provide an input graph of type DirectedGraph or CSRGraph")
+    if strategy not in ("fifo", "slf"):
+        raise Exception(f"Unknown queue strategy {strategy} !")
+    if starting_node not in graph:
+        raise TypeError("Starting node not in graph !")
+    graph_nodes = graph.get_nodes()
+    num_nodes = len(graph_nodes)
+    distances = {node:np.inf for node in graph_nodes}
+    distances[starting_node] = 0
+    predecessors = {starting_node: None}
+    queue = deque([starting_node])
+    in_queue = {starting_node}
+    relaxations = 0
+    while queue:
+        node = queue.popleft()
+        in_queue.discard(node)
+        if graph.weighted:
+            outgoing_edges = graph.get_adjacent_nodes_and_weights(node)
+        else:
+            outgoing_edges = [(next_node, 1) for next_node in graph.get_adjacent_nodes(node)]
+        for next_node, weight in outgoing_edges:
+            distance_with_hop = distances[node] + weight
+            if distance_with_hop < distances[next_node]:
+                distances[next_node] = distance_with_hop
+                predecessors[next_node] = node
+                relaxations += 1
+                # Checking every n relaxations keeps the amortized cost of the check at O(1) per relaxation
+                if relaxations % num_nodes == 0:
+                    negative_cycle = find_predecessor_cycle(predecessors)
+                    if negative_cycle:
+                        return {}, negative_cycle
+                if next_node not in in_queue:
+                    in_queue.add(next_node)
+                    if strategy == "slf" and queue and distance_with_hop < distances[queue[0]]:
+                        queue.appendleft(next_node)
+                    else:
+                        queue.append(next_node)
+    return distances, []
+
+
+def find_predecessor_cycle(predecessors: dict) -> list:
+    """
+    Find a cycle in a predecessor graph, where every node points to the node preceding it on its current shortest path.
+    During Bellman-Ford such a cycle is always a negative cycle, and one eventually appears if a negative cycle can be reached.
+
+    Args:
+        predecessors (dict): A dictionnary mapping each reached node to its predecessor. The starting node maps to None.
+
+    Returns:
+        list: The nodes of the cycle in edge order, each node having an edge to the next one and the last one to the first one. Empty if there is no cycle.
+    """
+    # Every walk follows the predecessors until it reaches a node seen by an earlier walk, the starting node or a node of its own walk.
+    walk_of_node = {}
+    for walk, node in enumerate(predecessors):
+        while node is not None and node not in walk_of_node:
+            walk_of_node[node] = walk
+            node = predecessors[node]
+        if node is not None and walk_of_node[node] == walk:
+            cycle = [node]
+            previous_node = predecessors[node]
+            while previous_node != node:
+                cycle.append(previous_node)
+                previous_node = predecessors[previous_node]
+            return cycle[::-1]
+    return []
+
+
+def bellman_ford_vectorized(graph: DirectedGraph | CSRGraph, starting_node: object) -> dict:
+    """
+    Compute the single-source distances with Bellman-Ford, relaxing all edges of a round at once with NumPy.
+    The graph is converted once into source, destination and weight arrays sorted by destination, so that each round
+    takes the minimum candidate distance per destination with np.minimum.reduceat instead of looping over the edges in Python.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The input graph for which the distances should be computed.
+        starting_node (object): The starting node from which to compute all distances.
+
+    Returns:
+        dict: A dictionnary containing distances to all nodes from starting node. Is empty in case a negative cycle is detected.
+    """
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError("Please provide an input graph of type DirectedGraph or CSRGraph")
+    if starting_node not in graph:
+        raise TypeError("Starting node not in graph !")
+    distances = np.full(graph.get_number_nodes(), np.inf)
+    distances[graph.get_node_id(starting_node)] = 0
+    distances = relax_edge_arrays(*edge_arrays(graph), distances, graph.get_number_nodes())
+    if distances is None:
+        # No stable solution has been found
+        return {}
+    return dict(zip(graph.get_nodes(), distances.tolist()))
+
+
+def relax_edge_arrays(sources: np.ndarray, destinations: np.ndarray, weights: np.ndarray, distances: np.ndarray, max_rounds: int) -> np.ndarray | None:
+    """
+    Relax all edges in rounds, starting from the provided distances, until the distances stop changing.
+
+    Args:
+        sources (np.ndarray): The source node id of each edge.
+        destinations (np.ndarray): The destination node id of each edge.
+        weights (np.ndarray): The weight of each edge.
+        distances (np.ndarray): The initial distance of each node id.
+        max_rounds (int): The number of rounds after which the distances are considered unstable.
+
+    Returns:
+        np.ndarray | None: The stable distances, None in case a negative cycle prevents them from stabilizing.
+    """
+    # Edges are grouped by destination so that each group is reduced to its minimum in one call
+    order = np.argsort(destinations, kind="stable")
+    sources, destinations, weights = sources[order], destinations[order], weights[order]
+    group_starts = np.flatnonzero(np.r_[True, destinations[1:] != destinations[:-1]]) if len(destinations) else np.empty(0, dtype=np.int64)
+    group_destinations = destinations[group_starts]
+    if len(group_starts) == 0:
+        return distances
+    for _ in range(max_rounds):
+        shortest_paths_with_hop = np.minimum.reduceat(distances[sources] + weights, group_starts)
+        new_distances = distances.copy()
+        np.minimum(new_distances[group_destinations], shortest_paths_with_hop, out=shortest_paths_with_hop)
+        new_distances[group_destinations] = shortest_paths_with_hop
+        # Once a stable solution was found we can return the solution
+        if np.array_equal(new_distances, distances):
+            return distances
+        distances = new_distances
+    return None
+
+
+def edge_arrays(graph: CSRGraph) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert a CSR graph into flat edge arrays. Unweighted edges have a weight of 1.
+
+    Args:
+        graph (CSRGraph): The input graph.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The source node ids, destination node ids and weights of all edges.
+    """
+    sources = np.repeat(np.arange(graph.get_number_nodes()), np.diff(graph.indptr))
+    destinations = graph.indices.astype(np.int64)
+    if graph.weighted:
+        weights = graph.weights.astype(np.float64)
+    else:
+        weights = np.ones(len(destinations))
+    return sources, destinations, weights
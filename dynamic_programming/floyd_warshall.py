@@ -1,43 +1,211 @@
-from graphs.datastructures import DirectedGraph
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+from graphs.datastructures import DirectedGraph, CSRGraph
+from graphs.shared_memory import share_arrays, attach_arrays, release_blocks
+from dynamic_programming.bellman_ford import edge_arrays
 import numpy as np
 
-def floyd_warhsall(graph: DirectedGraph)-> dict:
+class AllPairsDistances(Mapping):
+    """Read-only view mapping (node1, node2) keys to the distance from node1 to node2, backed by an n x n NumPy matrix.
+    Entries are looked up lazily in the matrix, so the n² tuple keys are never materialized unless the view is iterated.
+    """
+
+    def __init__(self, nodes: list, distances: np.ndarray, next_hops: np.ndarray | None = None) -> None:
+        """Wrap a distance matrix.
+
+        Args:
+            nodes (list): The nodes of the graph. The position of a node in this list is its row and column in the matrices.
+            distances (np.ndarray): The (n x n) distance matrix.
+            next_hops (np.ndarray | None): Optional (n x n) matrix holding the id of the node following node1 on the shortest path to node2, -1 if there is no path.
+        """
+        self.nodes = list(nodes)
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.distances = distances
+        self.next_hops = next_hops
+
+    def __getitem__(self, key: tuple) -> float:
+        node1, node2 = key
+        return float(self.distances[self.node_ids[node1], self.node_ids[node2]])
+
+    def __iter__(self) -> Iterator[tuple]:
+        return ((node1, node2) for node1 in self.nodes for node2 in self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes) ** 2
+
+    def __contains__(self, key: object) -> bool:
+        return type(key) == tuple and len(key) == 2 and key[0] in self.node_ids and key[1] in self.node_ids
+
+    def path(self, node1: object, node2: object) -> list:
+        """Rebuild the shortest path between two nodes from the next-hop matrix in O(path length) time.
+
+        Args:
+            node1 (object): The node from which the path starts.
+            node2 (object): The node at which the path ends.
+
+        Returns:
+            list: The nodes of the path. Empty if node2 can't be reached from node1.
+        """
+        if self.next_hops is None:
+            raise Exception("The next hops were not computed, please call floyd_warhsall with next_hops=True !")
+        node_id = self.node_ids[node1]
+        target_id = self.node_ids[node2]
+        if self.next_hops[node_id, target_id] == -1:
+            return []
+        path = [node1]
+        while node_id != target_id:
+            node_id = int(self.next_hops[node_id, target_id])
+            path.append(self.nodes[node_id])
+        return path
+
+
+def floyd_warhsall(graph: DirectedGraph | CSRGraph, next_hops: bool = False) -> AllPairsDistances | dict:
     """Compute all-pairs shortest paths for a directed input graph.
+    The distances are kept in a single n x n matrix which is updated in place once per intermediate node k, in O(n³) time and O(n²) memory.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The inpt graph for which to compute the shortest paths.
+        next_hops (bool): Whether to also compute the next-hop matrix from which AllPairsDistances.path rebuilds the shortest paths.
+
+    Returns:
+        AllPairsDistances | dict: A mapping with keys being (node1, node2) and values representing the distance from node1 to node2.
+                                  Is an empty dictionnary in case a negative cycle is detected.
+    """
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError("Please provide an input graph of type DirectedGraph or CSRGraph")
+    num_nodes = graph.get_number_nodes()
+    sources, destinations, weights = edge_arrays(graph)
+    # Initialize the solution matrix with the direct edges. A node is at a distance 0 of itself unless it has a negative loop.
+    distances = np.full((num_nodes, num_nodes), np.inf)
+    np.fill_diagonal(distances, 0)
+    np.minimum.at(distances, (sources, destinations), weights)
+    next_hop_matrix = None
+    if next_hops:
+        next_hop_matrix = np.where(np.isfinite(distances), np.arange(num_nodes)[None, :], -1)
+
+    # After the iteration for node k, the distances are those of the shortest paths using only the nodes up to k as intermediate nodes
+    for k in range(num_nodes):
+        distances_with_hop = distances[:, k, None] + distances[None, k, :]
+        if next_hops:
+            # A path improved by going through k starts with the same hop as the path to k
+            improved = distances_with_hop < distances
+            next_hop_matrix = np.where(improved, next_hop_matrix[:, k, None], next_hop_matrix)
+        np.minimum(distances, distances_with_hop, out=distances)
+    # If a negative cycle is present in the graph this results in a negative distance registered from one node to itself.
+    if (np.diagonal(distances) < 0).any():
+        return {}
+
+    return AllPairsDistances(graph.get_nodes(), distances, next_hop_matrix)
+
+
+def floyd_warshall_blocked(graph: DirectedGraph | CSRGraph, block_size: int = 256, workers: int = 1, path: str | None = None) -> AllPairsDistances | dict:
+    """Compute all-pairs shortest paths with the blocked (tiled) Floyd-Warshall algorithm.
+    The matrix is split into block_size x block_size tiles. For each diagonal tile, the algorithm runs in three phases: the diagonal tile itself,
+    then the tiles of its row and column which only depend on it, then all remaining tiles which only depend on the row and column tiles.
+    Each tile update works on a few tiles that fit in cache, and the tiles of the last two phases are independent so they are split across
+    a process pool working on the matrix in shared memory, or in the memory-mapped file.
 
     Args:
-        graph (DirectedGraph): The inpt graph for which to compute the shortest paths.
+        graph (DirectedGraph | CSRGraph): The inpt graph for which to compute the shortest paths.
+        block_size (int): The size of the tiles.
+        workers (int): The number of worker processes updating the tiles. 1 updates them in the current process.
+        path (str | None): Optional .npy file in which the distance matrix is kept as a memory map, for matrices larger than the available memory.
 
     Returns:
-        dict: A dictionnary with keys being (node1, node2) and values representing the distance from node1 to node2
+        AllPairsDistances | dict: A mapping with keys being (node1, node2) and values representing the distance from node1 to node2.
+                                  Is an empty dictionnary in case a negative cycle is detected.
     """
-    graph_nodes = graph.get_nodes()
-    num_nodes = len(graph_nodes)
-    # Initialize the solution array
-    solution_array = [{(node1, node2):np.inf for node1 in graph_nodes for node2 in graph_nodes} for _ in range(num_nodes + 1) ]
-    for node1 in graph_nodes:
-        for node2 in graph_nodes:
-            if node1 == node2:
-                solution_array[0][(node1,node2)] = 0
-            elif graph.get_distance(node1, node2) != np.inf:
-                solution_array[0][(node1, node2)] = graph.get_distance(node1, node2)
-
-    # Iterate over all problem sizes
-    # The size of a problem is defined by the number of hops that are allowed to reach a node
-    for problem_size in range(1, num_nodes + 1):
-        for node1 in graph_nodes:
-            for node2 in graph_nodes:
-                shortest_path_with_hop = np.inf
-                # First finding the minimum distance by adding a hop to reach the inspected node
-                for hop_node in graph_nodes:
-                    distance_with_hop = solution_array[problem_size - 1][(node1,hop_node)] + solution_array[problem_size - 1][(hop_node, node2)]
-                    if distance_with_hop < shortest_path_with_hop:
-                        shortest_path_with_hop = distance_with_hop
-                # Choosing the solution for the inspected node and given problem size
-                # Either adding a hop reduces the distances or we keep the previous solution
-                solution_array[problem_size][(node1, node2)] = min(solution_array[problem_size - 1][(node1, node2)], shortest_path_with_hop)
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError("Please provide an input graph of type DirectedGraph or CSRGraph")
+    num_nodes = graph.get_number_nodes()
+    sources, destinations, weights = edge_arrays(graph)
+    if path is None:
+        distances = np.full((num_nodes, num_nodes), np.inf)
+    else:
+        distances = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(num_nodes, num_nodes))
+        distances[:] = np.inf
+    np.fill_diagonal(distances, 0)
+    np.minimum.at(distances, (sources, destinations), weights)
+    tile_ranges = [(start, min(start + block_size, num_nodes)) for start in range(0, num_nodes, block_size)]
+
+    if workers == 1:
+        _run_blocked_phases(distances, tile_ranges, None)
+    elif path is not None:
+        distances.flush()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_memmap_matrix, initargs=(path,)) as executor:
+            _run_blocked_phases(distances, tile_ranges, executor)
+    else:
+        descriptor, blocks = share_arrays({"distances": distances})
+        try:
+            arrays, attached_blocks = attach_arrays(descriptor)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_matrix, initargs=(descriptor,)) as executor:
+                _run_blocked_phases(arrays["distances"], tile_ranges, executor)
+            distances = arrays["distances"].copy()
+            # The views on the shared memory have to be dropped before the blocks can be closed
+            del arrays
+            for block in attached_blocks:
+                block.close()
+        finally:
+            release_blocks(blocks)
+    if path is not None:
+        distances.flush()
     # If a negative cycle is present in the graph this results in a negative distance registered from one node to itself.
-    for node in graph_nodes:
-        if solution_array[problem_size][(node, node)] <0:
-            return {}
-    
-    return solution_array[problem_size]
\ No newline at end of file
+    if (np.diagonal(distances) < 0).any():
+        return {}
+
+    return AllPairsDistances(graph.get_nodes(), distances)
+
+
+def _run_blocked_phases(distances: np.ndarray, tile_ranges: list[tuple[int, int]], executor: ProcessPoolExecutor | None) -> None:
+    for k_range in tile_ranges:
+        # Phase 1: the diagonal tile only depends on itself
+        _update_tile(distances, k_range, k_range, k_range)
+        # Phase 2: the tiles in the row and column of the diagonal tile depend on themselves and the diagonal tile
+        row_and_column_tiles = [(k_range, tile_range, k_range) for tile_range in tile_ranges if tile_range != k_range]
+        row_and_column_tiles += [(tile_range, k_range, k_range) for tile_range in tile_ranges if tile_range != k_range]
+        _run_tiles(distances, row_and_column_tiles, executor)
+        # Phase 3: the remaining tiles only depend on the row and column tiles
+        remaining_tiles = [(row_range, column_range, k_range) for row_range in tile_ranges for column_range in tile_ranges if k_range not in (row_range, column_range)]
+        _run_tiles(distances, remaining_tiles, executor)
+
+
+def _run_tiles(distances: np.ndarray, tiles: list[tuple], executor: ProcessPoolExecutor | None) -> None:
+    if executor is None:
+        for row_range, column_range, k_range in tiles:
+            _update_tile(distances, row_range, column_range, k_range)
+    else:
+        # The tiles of a phase write disjoint parts of the matrix, so the workers can update them concurrently
+        list(executor.map(_update_worker_tile, tiles))
+
+
+def _update_tile(distances: np.ndarray, row_range: tuple[int, int], column_range: tuple[int, int], k_range: tuple[int, int]) -> None:
+    """Update a tile with the paths going through the intermediate nodes of k_range. The tile is a view so it is updated in place."""
+    tile = distances[row_range[0]:row_range[1], column_range[0]:column_range[1]]
+    left = distances[row_range[0]:row_range[1], k_range[0]:k_range[1]]
+    top = distances[k_range[0]:k_range[1], column_range[0]:column_range[1]]
+    for k in range(k_range[1] - k_range[0]):
+        np.minimum(tile, left[:, k, None] + top[None, k, :], out=tile)
+
+
+# Distance matrix attached by each worker process of floyd_warshall_blocked, from shared memory or from the memory-mapped file
+_worker_matrix = {}
+
+
+def _attach_shared_matrix(descriptor: dict) -> None:
+    arrays, blocks = attach_arrays(descriptor)
+    _worker_matrix.update(arrays)
+    _worker_matrix["blocks"] = blocks
+
+
+def _attach_memmap_matrix(path: str) -> None:
+    # The file is mapped in shared mode, so the writes of every process go to the same pages
+    _worker_matrix["distances"] = np.load(path, mmap_mode="r+")
+
+
+def _update_worker_tile(tile: tuple) -> None:
+    _update_tile(_worker_matrix["distances"], *tile)
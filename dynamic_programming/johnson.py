@@ -0,0 +1,62 @@
+from typing import Iterator
+from graphs.datastructures import DirectedGraph, CSRGraph
+from graphs.dijkstra import dijkstra_rows
+from dynamic_programming.bellman_ford import edge_arrays, relax_edge_arrays
+import numpy as np
+
+def johnson(graph: DirectedGraph | CSRGraph, workers: int = 1) -> Iterator[tuple[object, np.ndarray]]:
+    """
+    Compute all-pairs shortest paths for a sparse directed graph, possibly with negative weights, with Johnson's algorithm.
+    One Bellman-Ford pass from a virtual source linked to every node gives node potentials h. The weights are reweighted
+    to w(u, v) + h(u) - h(v), which are non-negative and keep the same shortest paths, so that a Dijkstra can be run from every node.
+    The Dijkstras run across a process pool and the distances are streamed one source at a time instead of building an n² result.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The input graph for which to compute the shortest paths.
+        workers (int): The number of worker processes running the Dijkstras. 1 runs them in the current process.
+
+    Returns:
+        Iterator[tuple[object, np.ndarray]]: For each node in the order of graph.get_nodes(), the node and its distances to all nodes in the same order.
+                                             Unreachable nodes are at a distance of np.inf.
+    """
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph or not graph.directed:
+        raise TypeError("Please provide an input graph of type DirectedGraph or a directed CSRGraph")
+    sources, destinations, weights = edge_arrays(graph)
+    # Starting every node at 0 is the same as adding a virtual source with a 0 weight edge to every node
+    potentials = relax_edge_arrays(sources, destinations, weights, np.zeros(graph.get_number_nodes()), graph.get_number_nodes() + 1)
+    if potentials is None:
+        raise Exception("The graph contains a negative cycle !")
+    # Rounding errors could make a reweighted edge slightly negative, which Dijkstra doesn't allow
+    reweighted_graph = CSRGraph(graph.get_nodes(), graph.indptr, graph.indices, np.maximum(weights + potentials[sources] - potentials[destinations], 0), directed=True)
+    return _stream_rows(reweighted_graph, potentials, workers)
+
+
+def _stream_rows(reweighted_graph: CSRGraph, potentials: np.ndarray, workers: int) -> Iterator[tuple[object, np.ndarray]]:
+    nodes = reweighted_graph.get_nodes()
+    for source_id, reweighted_distances in enumerate(dijkstra_rows(reweighted_graph, nodes, workers)):
+        # Undoing the reweighting: the potentials of the inner nodes of a path cancel out
+        yield nodes[source_id], reweighted_distances - potentials[source_id] + potentials
+
+
+def johnson_to_memmap(graph: DirectedGraph | CSRGraph, path: str, workers: int = 1) -> np.memmap:
+    """
+    Compute all-pairs shortest paths with Johnson's algorithm and write them row by row into a memory-mapped .npy file,
+    so that the matrix can be larger than the available memory.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The input graph for which to compute the shortest paths.
+        path (str): The .npy file in which the distance matrix is written. It can later be opened with np.load(path, mmap_mode="r").
+        workers (int): The number of worker processes running the Dijkstras. 1 runs them in the current process.
+
+    Returns:
+        np.memmap: The (number of nodes x number of nodes) distance matrix, rows and columns following the order of graph.get_nodes().
+    """
+    rows = johnson(graph, workers)
+    number_nodes = len(graph.get_nodes())
+    distance_matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(number_nodes, number_nodes))
+    for row, (_, distances) in enumerate(rows):
+        distance_matrix[row] = distances
+    distance_matrix.flush()
+    return distance_matrix
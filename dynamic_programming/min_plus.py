@@ -0,0 +1,85 @@
+from graphs.datastructures import DirectedGraph, UndirectedGraph, CSRGraph
+from dynamic_programming.bellman_ford import edge_arrays
+from dynamic_programming.floyd_warshall import AllPairsDistances
+import numpy as np
+
+def min_plus_product(left: np.ndarray, right: np.ndarray, block_size: int = 64) -> np.ndarray:
+    """Compute the min-plus product of two matrices: result[i, j] = min over k of left[i, k] + right[k, j].
+    The rows, the inner dimension and the columns are all processed in blocks, so that each intermediate array of sums is block_size x block_size x block_size
+    whatever the size of the matrices, which is 2 MB with the default block size of 64.
+
+    Args:
+        left (np.ndarray): The (n x m) left matrix.
+        right (np.ndarray): The (m x p) right matrix.
+        block_size (int): The number of rows, inner indices and columns processed at once.
+
+    Returns:
+        np.ndarray: The (n x p) min-plus product.
+    """
+    if left.shape[1] != right.shape[0]:
+        raise Exception("The inner dimensions of the matrices don't match !")
+    result = np.full((left.shape[0], right.shape[1]), np.inf)
+    for row_start in range(0, left.shape[0], block_size):
+        rows = slice(row_start, row_start + block_size)
+        for column_start in range(0, right.shape[1], block_size):
+            columns = slice(column_start, column_start + block_size)
+            result_block = result[rows, columns]
+            for inner_start in range(0, left.shape[1], block_size):
+                inner = slice(inner_start, inner_start + block_size)
+                sums = left[rows, inner, None] + right[None, inner, columns]
+                np.minimum(result_block, sums.min(axis=1), out=result_block)
+    return result
+
+
+def min_plus_power(matrix: np.ndarray, exponent: int, block_size: int = 64) -> np.ndarray:
+    """Raise a square matrix to a power in the min-plus semiring with exponentiation by squaring, which takes O(log exponent) products.
+
+    Args:
+        matrix (np.ndarray): The (n x n) matrix.
+        exponent (int): The non-negative power.
+        block_size (int): The block size used by the min-plus products.
+
+    Returns:
+        np.ndarray: The matrix to the given power. The power 0 is the min-plus identity, with 0 on the diagonal and infinity elsewhere.
+    """
+    if exponent < 0:
+        raise Exception("The exponent should be non-negative !")
+    result = None
+    power = matrix
+    while exponent:
+        if exponent & 1:
+            result = power if result is None else min_plus_product(result, power, block_size)
+        exponent >>= 1
+        if exponent:
+            power = min_plus_product(power, power, block_size)
+    if result is None:
+        result = np.full(matrix.shape, np.inf)
+        np.fill_diagonal(result, 0)
+    return result
+
+
+def hop_bounded_distances(graph: DirectedGraph | UndirectedGraph | CSRGraph, max_hops: int, block_size: int = 64) -> AllPairsDistances:
+    """Compute for every pair of nodes the length of the shortest path using at most max_hops edges.
+    The adjacency matrix with a 0 diagonal holds the shortest paths of at most one hop, so its max_hops-th min-plus power holds those of at most max_hops hops.
+
+    Args:
+        graph (DirectedGraph | UndirectedGraph | CSRGraph): The input graph for which to compute the shortest paths.
+        max_hops (int): The maximum number of edges on a path.
+        block_size (int): The block size used by the min-plus products.
+
+    Returns:
+        AllPairsDistances: A mapping with keys being (node1, node2) and values representing the distance from node1 to node2 in at most max_hops hops.
+    """
+    if type(graph) in (DirectedGraph, UndirectedGraph):
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError("Please provide an input graph of type DirectedGraph, UndirectedGraph or CSRGraph")
+    num_nodes = graph.get_number_nodes()
+    sources, destinations, weights = edge_arrays(graph)
+    adjacency_matrix = np.full((num_nodes, num_nodes), np.inf)
+    np.fill_diagonal(adjacency_matrix, 0)
+    np.minimum.at(adjacency_matrix, (sources, destinations), weights)
+    if len(weights) == 0 or weights.min() >= 0:
+        # Without negative weights a shortest path never needs more than n - 1 hops
+        max_hops = min(max_hops, max(num_nodes - 1, 1))
+    return AllPairsDistances(graph.get_nodes(), min_plus_power(adjacency_matrix, max_hops, block_size))
@@ -0,0 +1,328 @@
+from graphs.datastructures import UndirectedGraph, CSRGraph, MinHeap
+import heapq
+import math
+import os
+import numpy as np
+
+
+class ContractionHierarchy:
+    """Class holding a contraction hierarchy of an undirected weighted graph.
+    Nodes are contracted one after the other by increasing importance. When a node is contracted, shortcut edges are added between
+    its remaining neighbours whenever the path through the node is the only shortest one. Every edge, original or shortcut, is then stored
+    once in CSR form at its lower ranked end, which makes up the upward graph. A shortest path query runs two Dijkstra searches
+    from the source and the target that only follow edges going up in the hierarchy, so they explore a tiny part of the graph.
+    """
+
+    def __init__(
+        self,
+        nodes: list,
+        ranks: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        middles: np.ndarray,
+    ) -> None:
+        """Build a hierarchy directly from its arrays. Use ContractionHierarchy.from_graph to preprocess a graph.
+
+        Args:
+            nodes (list): The nodes of the graph. The position of a node in this list is its integer id.
+            ranks (np.ndarray): The position of each node id in the contraction order.
+            indptr (np.ndarray): Offsets of each node's upward edges in the indices array.
+            indices (np.ndarray): The higher ranked end of each upward edge.
+            weights (np.ndarray): The weight of each upward edge.
+            middles (np.ndarray): The contracted node a shortcut edge goes through, -1 for an original edge.
+        """
+        self.nodes = list(nodes)
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.ranks = ranks
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.middles = middles
+
+    @classmethod
+    def from_graph(
+        cls, graph: UndirectedGraph | CSRGraph, witness_search_limit: int = 500
+    ) -> "ContractionHierarchy":
+        """Preprocess a graph into a contraction hierarchy.
+        The next node to contract is the one with the lowest edge difference (shortcuts added minus edges removed) plus number of
+        already contracted neighbours. Priorities are updated lazily: the popped node is reevaluated and put back if it isn't the minimum anymore.
+
+        Args:
+            graph (UndirectedGraph | CSRGraph): The undirected weighted graph to preprocess.
+            witness_search_limit (int): The maximum number of nodes settled by a witness search. A lower limit speeds up the
+                                        preprocessing at the cost of a few unnecessary shortcuts.
+
+        Returns:
+            ContractionHierarchy: The preprocessed hierarchy.
+        """
+        if type(graph) == UndirectedGraph:
+            graph = CSRGraph.from_graph(graph)
+        if type(graph) != CSRGraph or graph.directed:
+            raise TypeError(
+                "Please provide an input graph of type UndirectedGraph or an undirected CSRGraph"
+            )
+        if not graph.weighted:
+            raise TypeError("Please provide a weighted graph")
+        number_nodes = graph.get_number_nodes()
+        # The remaining graph maps each node to its neighbours with the (weight, middle node) of the shortest edge between them
+        remaining_graph = [{} for _ in range(number_nodes)]
+        for node_id in range(number_nodes):
+            start, end = graph.indptr[node_id], graph.indptr[node_id + 1]
+            for adjacent_id, weight in zip(
+                graph.indices[start:end].tolist(), graph.weights[start:end].tolist()
+            ):
+                if adjacent_id == node_id:
+                    continue
+                if weight < remaining_graph[node_id].get(adjacent_id, (math.inf,))[0]:
+                    remaining_graph[node_id][adjacent_id] = (weight, -1)
+
+        contracted_neighbours = [0] * number_nodes
+        node_order = MinHeap.from_items(
+            (
+                node_id,
+                cls.__priority(
+                    remaining_graph,
+                    node_id,
+                    contracted_neighbours,
+                    witness_search_limit,
+                ),
+            )
+            for node_id in range(number_nodes)
+        )
+        ranks = np.empty(number_nodes, dtype=np.int64)
+        upward_edges = [None] * number_nodes
+        rank = 0
+        while node_order.get_number_nodes() != 0:
+            node_id, priority = node_order.extract_min()
+            # Lazy update: the priority may be outdated since neighbours have been contracted
+            priority = cls.__priority(
+                remaining_graph, node_id, contracted_neighbours, witness_search_limit
+            )
+            if (
+                node_order.get_number_nodes() != 0
+                and priority > node_order.get_node_key(1)
+            ):
+                node_order.insert(node_id, priority)
+                continue
+
+            ranks[node_id] = rank
+            rank += 1
+            # All remaining neighbours are contracted later so the edges towards them go up in the hierarchy
+            upward_edges[node_id] = list(remaining_graph[node_id].items())
+            for start_id, end_id, weight in cls.__find_shortcuts(
+                remaining_graph, node_id, witness_search_limit
+            ):
+                if weight < remaining_graph[start_id].get(end_id, (math.inf,))[0]:
+                    remaining_graph[start_id][end_id] = (weight, node_id)
+                    remaining_graph[end_id][start_id] = (weight, node_id)
+            for adjacent_id in remaining_graph[node_id]:
+                del remaining_graph[adjacent_id][node_id]
+                contracted_neighbours[adjacent_id] += 1
+            remaining_graph[node_id] = {}
+
+        indptr = np.zeros(number_nodes + 1, dtype=np.int64)
+        np.cumsum([len(edges) for edges in upward_edges], out=indptr[1:])
+        number_edges = int(indptr[-1])
+        indices = np.fromiter(
+            (adjacent_id for edges in upward_edges for adjacent_id, _ in edges),
+            dtype=graph.indices.dtype,
+            count=number_edges,
+        )
+        weights = np.fromiter(
+            (weight for edges in upward_edges for _, (weight, _) in edges),
+            dtype=graph.weights.dtype,
+            count=number_edges,
+        )
+        middles = np.fromiter(
+            (middle for edges in upward_edges for _, (_, middle) in edges),
+            dtype=graph.indices.dtype,
+            count=number_edges,
+        )
+        return cls(graph.nodes, ranks, indptr, indices, weights, middles)
+
+    @staticmethod
+    def __witness_search(
+        remaining_graph: list,
+        source: int,
+        excluded_node: int,
+        max_distance: float,
+        witness_search_limit: int,
+    ) -> dict:
+        """Dijkstra search from a node in the remaining graph that avoids the node being contracted.
+        The search stops past the distance that could make a shortcut unnecessary or once enough nodes are settled.
+        """
+        distances = {source: 0}
+        accessible_nodes = [(0, source)]
+        number_settled_nodes = 0
+        while accessible_nodes and number_settled_nodes < witness_search_limit:
+            distance, node_id = heapq.heappop(accessible_nodes)
+            if distance > distances[node_id]:
+                continue
+            if distance > max_distance:
+                break
+            number_settled_nodes += 1
+            for adjacent_id, (weight, _) in remaining_graph[node_id].items():
+                new_distance = distance + weight
+                if adjacent_id != excluded_node and new_distance < distances.get(
+                    adjacent_id, math.inf
+                ):
+                    distances[adjacent_id] = new_distance
+                    heapq.heappush(accessible_nodes, (new_distance, adjacent_id))
+        return distances
+
+    @staticmethod
+    def __find_shortcuts(
+        remaining_graph: list, node_id: int, witness_search_limit: int
+    ) -> list[tuple[int, int, float]]:
+        """Find the shortcuts needed to contract a node: a pair of neighbours needs one if no path avoiding the node is as short as the path through it."""
+        neighbours = list(remaining_graph[node_id].items())
+        shortcuts = []
+        for i, (start_id, (start_weight, _)) in enumerate(neighbours[:-1]):
+            end_neighbours = neighbours[i + 1 :]
+            max_distance = start_weight + max(
+                weight for _, (weight, _) in end_neighbours
+            )
+            witness_distances = ContractionHierarchy.__witness_search(
+                remaining_graph, start_id, node_id, max_distance, witness_search_limit
+            )
+            for end_id, (end_weight, _) in end_neighbours:
+                if witness_distances.get(end_id, math.inf) > start_weight + end_weight:
+                    shortcuts.append((start_id, end_id, start_weight + end_weight))
+        return shortcuts
+
+    @staticmethod
+    def __priority(
+        remaining_graph: list,
+        node_id: int,
+        contracted_neighbours: list,
+        witness_search_limit: int,
+    ) -> int:
+        number_shortcuts = len(
+            ContractionHierarchy.__find_shortcuts(
+                remaining_graph, node_id, witness_search_limit
+            )
+        )
+        edge_difference = number_shortcuts - len(remaining_graph[node_id])
+        return edge_difference + contracted_neighbours[node_id]
+
+    def __find_edge(self, node_id: int, adjacent_id: int) -> int:
+        """Find the position of the upward edge between two nodes. It is stored at the node with the lowest rank."""
+        if self.ranks[node_id] > self.ranks[adjacent_id]:
+            node_id, adjacent_id = adjacent_id, node_id
+        start, end = self.indptr[node_id], self.indptr[node_id + 1]
+        return int(start + np.flatnonzero(self.indices[start:end] == adjacent_id)[0])
+
+    def __unpack_path(self, node_ids: list) -> list:
+        """Replace every shortcut between two consecutive nodes of a path by the edges it stands for."""
+        path = [node_ids[0]]
+        for start_id, end_id in zip(node_ids[:-1], node_ids[1:]):
+            edges_to_unpack = [(start_id, end_id)]
+            while edges_to_unpack:
+                edge_start_id, edge_end_id = edges_to_unpack.pop()
+                middle_id = int(
+                    self.middles[self.__find_edge(edge_start_id, edge_end_id)]
+                )
+                if middle_id == -1:
+                    path.append(edge_end_id)
+                else:
+                    # The first half of the shortcut is unpacked first
+                    edges_to_unpack.append((middle_id, edge_end_id))
+                    edges_to_unpack.append((edge_start_id, middle_id))
+        return path
+
+    def query(self, source: object, target: object) -> tuple[float, list]:
+        """Find the shortest path between two nodes with two Dijkstra searches restricted to upward edges.
+        The searches alternate and each one stops once its smallest tentative distance reaches the best path found,
+        which goes through the highest ranked node of the shortest path.
+
+        Args:
+            source (object): The node from which the path starts
+            target (object): The node at which the path ends
+
+        Returns:
+            tuple[float, list]: The length of the shortest path and the list of nodes on it. (math.inf, []) if the target can't be reached.
+        """
+        if source not in self.node_ids or target not in self.node_ids:
+            raise TypeError("Source or target node not in graph !")
+        source_id = self.node_ids[source]
+        target_id = self.node_ids[target]
+        distances = ({source_id: 0}, {target_id: 0})
+        predecessors = ({source_id: None}, {target_id: None})
+        accessible_nodes = ([(0, source_id)], [(0, target_id)])
+        shortest_distance = math.inf
+        meeting_id = None
+
+        direction = 0
+        while accessible_nodes[0] or accessible_nodes[1]:
+            if not accessible_nodes[direction]:
+                direction = 1 - direction
+            distance, node_id = heapq.heappop(accessible_nodes[direction])
+            if distance > distances[direction][node_id]:
+                continue
+            if distance >= shortest_distance:
+                # No node left in this search can lead to a shorter path
+                accessible_nodes[direction].clear()
+                direction = 1 - direction
+                continue
+            other_distance = distances[1 - direction].get(node_id, math.inf)
+            if distance + other_distance < shortest_distance:
+                shortest_distance = distance + other_distance
+                meeting_id = node_id
+            start, end = self.indptr[node_id], self.indptr[node_id + 1]
+            for adjacent_id, weight in zip(
+                self.indices[start:end].tolist(), self.weights[start:end].tolist()
+            ):
+                new_distance = distance + weight
+                if new_distance < distances[direction].get(adjacent_id, math.inf):
+                    distances[direction][adjacent_id] = new_distance
+                    predecessors[direction][adjacent_id] = node_id
+                    heapq.heappush(
+                        accessible_nodes[direction], (new_distance, adjacent_id)
+                    )
+            direction = 1 - direction
+
+        if meeting_id is None:
+            return math.inf, []
+        node_ids = [meeting_id]
+        while predecessors[0][node_ids[-1]] is not None:
+            node_ids.append(predecessors[0][node_ids[-1]])
+        node_ids.reverse()
+        while predecessors[1][node_ids[-1]] is not None:
+            node_ids.append(predecessors[1][node_ids[-1]])
+        return shortest_distance, [
+            self.nodes[node_id] for node_id in self.__unpack_path(node_ids)
+        ]
+
+    def save(self, directory: str) -> None:
+        """Save the hierarchy to a directory with one .npy file per array so that it can be memory-mapped when loaded.
+
+        Args:
+            directory (str): The directory to which the hierarchy is saved. It is created if needed.
+        """
+        os.makedirs(directory, exist_ok=True)
+        nodes = np.empty(len(self.nodes), dtype=object)
+        for node_id, node in enumerate(self.nodes):
+            nodes[node_id] = node
+        np.save(os.path.join(directory, "nodes.npy"), nodes)
+        for name in ["ranks", "indptr", "indices", "weights", "middles"]:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "ContractionHierarchy":
+        """Load a hierarchy previously saved with save. Only load files from a trusted source as the nodes are unpickled.
+
+        Args:
+            directory (str): The directory from which the hierarchy is loaded.
+            mmap (bool): Whether to memory-map the arrays read-only instead of reading them into memory.
+
+        Returns:
+            ContractionHierarchy: The loaded hierarchy.
+        """
+        mmap_mode = "r" if mmap else None
+        nodes = np.load(os.path.join(directory, "nodes.npy"), allow_pickle=True)
+        arrays = [
+            np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in ["ranks", "indptr", "indices", "weights", "middles"]
+        ]
+        return cls(nodes.tolist(), *arrays)
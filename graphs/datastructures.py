@@ -1,13 +1,25 @@
-from typing import Union, Hashable
+from typing import Union, Hashable, Iterable
+from array import array
 import numpy as np
 
 
 class DirectedGraph:
     """Class that represents a graph using the adjacency list structure"""
 
-    def __init__(self, weighted: bool = False) -> None:
+    def __init__(self, weighted: bool = False, track_incoming: bool = False) -> None:
+        """Initialize an empty graph.
+
+        Args:
+            weighted (bool): Whether the edges of the graph carry a weight.
+            track_incoming (bool): Whether to maintain an incoming-edge index alongside the adjacency list.
+                                   The index makes incoming node lookups proportional to the in-degree of a node instead of the size of the graph.
+        """
         self.adjacency_list = {}
         self.weighted = weighted
+        # Mirror of the adjacency list holding for each node the nodes with an edge leading to it. None when not tracked.
+        self.incoming_list = None
+        if track_incoming:
+            self.incoming_list = {}
 
     def add_node(self, node: object) -> None:
         """Add a node to the graph.
@@ -21,6 +33,8 @@ class DirectedGraph:
             self.adjacency_list[node] = {}
         else:
             self.adjacency_list[node] = []
+        if self.incoming_list is not None:
+            self.incoming_list[node] = {} if self.weighted else []
 
     def add_edge(
         self,
@@ -39,15 +53,19 @@ class DirectedGraph:
             raise Exception(f"Start node {start_node} doesn't exist !")
         elif not end_node in self.adjacency_list.keys():
             raise Exception(f"End node {end_node} doesn't exist !")
-        elif weight:
+        elif weight is not None:
             weight_type = type(weight)
             if weight_type != int and weight_type != float:
                 raise TypeError(
                     f"Please provide a weight that is a number. Current type is {type(weight)}."
                 )
             self.adjacency_list[start_node][end_node] = weight
+            if self.incoming_list is not None:
+                self.incoming_list[end_node][start_node] = weight
         else:
             self.adjacency_list[start_node].append(end_node)
+            if self.incoming_list is not None:
+                self.incoming_list[end_node].append(start_node)
 
     def set_node_and_adjacent_nodes(
         self, start_node: object, adjacent_nodes: list
@@ -56,13 +74,93 @@ class DirectedGraph:
 
         Args:
             start_node: Initial node
-            adjacent_nodes: The adjacent nodes list associated to the initial node.
+            adjacent_nodes: The adjacent nodes list associated to the initial node. For a weighted graph, a dictionnary mapping each adjacent node to the weight of its edge.
 
         """
-        if type(adjacent_nodes) != list:
-            raise Exception("Please provide an element of type list as adjacent nodes.")
+        container_type = dict if self.weighted else list
+        if type(adjacent_nodes) != container_type:
+            raise Exception(
+                f"Please provide an element of type {container_type.__name__} as adjacent nodes."
+            )
+        if self.incoming_list is not None:
+            # The edges previously leaving the node are replaced, so they are removed from the index first
+            for end_node in self.adjacency_list.get(start_node, []):
+                if self.weighted:
+                    self.incoming_list[end_node].pop(start_node)
+                else:
+                    self.incoming_list[end_node].remove(start_node)
+            self.incoming_list.setdefault(start_node, container_type())
+            if self.weighted:
+                for end_node, weight in adjacent_nodes.items():
+                    self.incoming_list.setdefault(end_node, {})[start_node] = weight
+            else:
+                for end_node in adjacent_nodes:
+                    self.incoming_list.setdefault(end_node, []).append(start_node)
         self.adjacency_list[start_node] = adjacent_nodes
 
+    def remove_edge(self, start_node: object, end_node: object) -> None:
+        """Remove a directed edge from the graph.
+
+        Args:
+            start_node : Starting node of the directed edge
+            end_node : End node of the directed edge
+        """
+        if end_node not in self.adjacency_list.get(start_node, []):
+            raise Exception(f"Edge ({start_node}, {end_node}) doesn't exist !")
+        if self.weighted:
+            del self.adjacency_list[start_node][end_node]
+        else:
+            self.adjacency_list[start_node].remove(end_node)
+        if self.incoming_list is not None:
+            if self.weighted:
+                del self.incoming_list[end_node][start_node]
+            else:
+                self.incoming_list[end_node].remove(start_node)
+
+    def enable_incoming_index(self) -> None:
+        """Build the incoming-edge index from the current adjacency list. The index is then kept up to date by add_node and add_edge."""
+        if self.incoming_list is not None:
+            return
+        self.incoming_list = self.__build_incoming_list()
+
+    def __build_incoming_list(self) -> dict:
+        """Build the incoming adjacency of every node in a single pass over the edges."""
+        empty_container = dict if self.weighted else list
+        incoming_list = {node: empty_container() for node in self.adjacency_list}
+        for start_node, adjacent_nodes in self.adjacency_list.items():
+            if self.weighted:
+                for end_node, weight in adjacent_nodes.items():
+                    incoming_list[end_node][start_node] = weight
+            else:
+                for end_node in adjacent_nodes:
+                    incoming_list[end_node].append(start_node)
+        return incoming_list
+
+    def transpose(self, copy: bool = False) -> "DirectedGraph":
+        """Get the transposed graph, in which every edge is reversed and keeps its weight.
+        When the graph tracks incoming edges and copy is False, the transpose is a view sharing the adjacency and incoming lists of the graph
+        with their roles swapped, so it is built without copying and changes made through either graph show up in both.
+        Otherwise the transpose is an independent graph, whose adjacency is copied from the incoming-edge index or built in a single pass.
+
+        Args:
+            copy (bool): Whether to always return an independent graph, even when a view could be returned.
+
+        Returns:
+            DirectedGraph: The transposed graph.
+        """
+        transposed_graph = DirectedGraph(self.weighted)
+        if self.incoming_list is None:
+            transposed_graph.adjacency_list = self.__build_incoming_list()
+        elif copy:
+            transposed_graph.adjacency_list = {
+                node: incoming_nodes.copy()
+                for node, incoming_nodes in self.incoming_list.items()
+            }
+        else:
+            transposed_graph.adjacency_list = self.incoming_list
+            transposed_graph.incoming_list = self.adjacency_list
+        return transposed_graph
+
     def get_nodes(self) -> list:
         """Returns the list of nodes as a list.
 
@@ -90,6 +188,8 @@ class DirectedGraph:
         """
         if not node in self.adjacency_list.keys():
             raise Exception(f"Node {node} doesn't exist !")
+        elif self.incoming_list is not None:
+            return list(self.incoming_list[node])
         elif self.weighted:
             incoming_nodes = [
                 k
@@ -105,6 +205,27 @@ class DirectedGraph:
             ]
             return incoming_nodes
 
+    def get_incoming_nodes_and_weights(self, node: object) -> list[tuple]:
+        """Get incoming nodes and weights on the edges leading to the provided node.
+
+        Args:
+            node: The node for which the incoming nodes should be retrieved.
+
+        Returns:
+            list: The incoming (nodes, weight) list.
+        """
+        if not self.weighted:
+            raise Exception("Graph is not weighted, cannot return a node,weight pair")
+        elif not node in self.adjacency_list.keys():
+            raise Exception(f"Node {node} doesn't exist !")
+        elif self.incoming_list is not None:
+            return list(self.incoming_list[node].items())
+        return [
+            (k, adjacent_nodes[node])
+            for k, adjacent_nodes in self.adjacency_list.items()
+            if node in adjacent_nodes.keys()
+        ]
+
     def get_adjacent_nodes(self, node: object) -> list:
         """Get adjacent nodes to starting node.
 
@@ -180,6 +301,9 @@ class DirectedGraph:
         visited = set()
         return any(self.visit(node, path, visited) for node in self.get_nodes())
 
+    def __contains__(self, node: object) -> bool:
+        return node in self.adjacency_list
+
     def __repr__(self) -> str:
         class_name = type(self).__name__
         return f"{class_name}()"
@@ -240,7 +364,7 @@ class UndirectedGraph:
             raise Exception(f"Start node {start_node} doesn't exist !")
         elif not end_node in self.adjacency_list.keys():
             raise Exception(f"End node {end_node} doesn't exist !")
-        elif weight:
+        elif weight is not None:
             weight_type = type(weight)
             if weight_type != int and weight_type != float:
                 raise TypeError(
@@ -268,6 +392,22 @@ class UndirectedGraph:
             raise Exception("Please provide an element of type list as adjacent nodes.")
         self.adjacency_list[start_node] = adjacent_nodes
 
+    def remove_edge(self, start_node: object, end_node: object) -> None:
+        """Remove an undirected edge from the graph.
+
+        Args:
+            start_node : One end of the edge
+            end_node : The other end of the edge
+        """
+        if end_node not in self.adjacency_list.get(start_node, []):
+            raise Exception(f"Edge ({start_node}, {end_node}) doesn't exist !")
+        if self.weighted:
+            del self.adjacency_list[start_node][end_node]
+            del self.adjacency_list[end_node][start_node]
+        else:
+            self.adjacency_list[start_node].remove(end_node)
+            self.adjacency_list[end_node].remove(start_node)
+
     def get_nodes(self) -> list:
         """Returns the list of nodes as a list.
 
@@ -394,6 +534,9 @@ class UndirectedGraph:
         return False
 
 
+    def __contains__(self, node: object) -> bool:
+        return node in self.adjacency_list
+
     def __repr__(self) -> str:
         class_name = type(self).__name__
         return f"{class_name}()"
@@ -417,12 +560,272 @@ class UndirectedGraph:
         return not self.__eq__(other)
 
 
+class CSRGraph:
+    """Class that represents a frozen graph using the compressed sparse row (CSR) structure.
+    Nodes are interned to contiguous integer ids and the outgoing edges of node i are stored in indices[indptr[i]:indptr[i + 1]] (and weights for a weighted graph).
+    """
+
+    def __init__(
+        self,
+        nodes: list,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray | None = None,
+        directed: bool = True,
+    ) -> None:
+        """Build a CSR graph directly from its arrays. Use CSRGraph.from_graph to convert an existing DirectedGraph or UndirectedGraph.
+
+        Args:
+            nodes (list): The node objects. The position of a node in this list is its integer id.
+            indptr (np.ndarray): Array of size n + 1 holding the offsets of each node's edges in the indices array.
+            indices (np.ndarray): Array of size m holding the integer id of the end node of each edge.
+            weights (np.ndarray | None): Array of size m holding the weight of each edge. None for an unweighted graph.
+            directed (bool): Whether the edges are directed. Undirected graphs store each edge in both directions.
+        """
+        if len(indptr) != len(nodes) + 1:
+            raise Exception(
+                "The indptr array should contain one entry per node plus one."
+            )
+        if weights is not None and len(weights) != len(indices):
+            raise Exception("The weights array should contain one entry per edge.")
+        self.nodes = list(nodes)
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+        self.weighted = weights is not None
+        # The transposed arrays are only built the first time incoming nodes are requested
+        self.reverse_indptr = None
+        self.reverse_indices = None
+        self.reverse_weights = None
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Union[DirectedGraph, UndirectedGraph],
+        weight_dtype: np.dtype = np.float64,
+    ) -> "CSRGraph":
+        """Build a frozen CSR copy of a DirectedGraph or UndirectedGraph.
+
+        Args:
+            graph (DirectedGraph | UndirectedGraph): The graph to convert.
+            weight_dtype (np.dtype): The dtype used for storing the weights. np.float32 halves the memory needed for the weights.
+
+        Returns:
+            CSRGraph: The CSR representation of the input graph.
+        """
+        if type(graph) not in (DirectedGraph, UndirectedGraph):
+            raise TypeError(
+                "Please provide an input graph of type DirectedGraph or UndirectedGraph"
+            )
+        nodes = graph.get_nodes()
+        node_ids = {node: node_id for node_id, node in enumerate(nodes)}
+        adjacencies = [graph.adjacency_list[node] for node in nodes]
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum([len(adjacency) for adjacency in adjacencies], out=indptr[1:])
+        number_edges = int(indptr[-1])
+        # 32 bit ids are enough for all but the very largest graphs and halve the memory of the indices array
+        index_dtype = np.int32 if len(nodes) < 2**31 else np.int64
+        indices = np.fromiter(
+            (node_ids[end_node] for adjacency in adjacencies for end_node in adjacency),
+            dtype=index_dtype,
+            count=number_edges,
+        )
+        weights = None
+        if graph.weighted:
+            weights = np.fromiter(
+                (weight for adjacency in adjacencies for weight in adjacency.values()),
+                dtype=weight_dtype,
+                count=number_edges,
+            )
+        return cls(nodes, indptr, indices, weights, type(graph) == DirectedGraph)
+
+    def get_node_id(self, node: object) -> int:
+        """Get the integer id a node has been interned to.
+
+        Args:
+            node: The node for which the id should be retrieved.
+
+        Returns:
+            int: The node id.
+        """
+        try:
+            return self.node_ids[node]
+        except KeyError:
+            raise Exception(f"Node {node} doesn't exist !")
+
+    def get_number_nodes(self) -> int:
+        return len(self.nodes)
+
+    def get_number_edges(self) -> int:
+        """Returns the number of stored edges. Undirected edges are stored, and therefore counted, in both directions."""
+        return len(self.indices)
+
+    def get_nbytes(self) -> int:
+        """Returns the number of bytes used by the CSR arrays."""
+        nbytes = self.indptr.nbytes + self.indices.nbytes
+        if self.weighted:
+            nbytes += self.weights.nbytes
+        return nbytes
+
+    def get_nodes(self) -> list:
+        """Returns the list of nodes as a list.
+
+        Returns:
+            list: The nodes of the graph.
+        """
+        return list(self.nodes)
+
+    def get_adjacent_nodes(self, node: object) -> list:
+        """Get adjacent nodes to starting node.
+
+        Args:
+            node: The node for which the adjacent nodes should be retrieved.
+
+        Returns:
+            list: The adjacent nodes list.
+        """
+        node_id = self.get_node_id(node)
+        start, end = self.indptr[node_id], self.indptr[node_id + 1]
+        return [self.nodes[end_id] for end_id in self.indices[start:end].tolist()]
+
+    def get_adjacent_nodes_and_weights(self, node: object) -> list[tuple]:
+        """Get adjacent nodes and weights on the edges outgoing from the starting node.
+
+        Args:
+            node: The node for which the adjacent nodes should be retrieved.
+
+        Returns:
+            list: The adjacent (nodes, weight) list.
+        """
+        if not self.weighted:
+            raise Exception("Graph is not weighted, cannot return a node,weight pair")
+        node_id = self.get_node_id(node)
+        start, end = self.indptr[node_id], self.indptr[node_id + 1]
+        return [
+            (self.nodes[end_id], weight)
+            for end_id, weight in zip(
+                self.indices[start:end].tolist(), self.weights[start:end].tolist()
+            )
+        ]
+
+    def __build_reverse_arrays(self) -> None:
+        """Build the CSR arrays of the transposed graph using a stable sort on the end nodes of all edges."""
+        start_ids = np.repeat(
+            np.arange(len(self.nodes), dtype=self.indices.dtype), np.diff(self.indptr)
+        )
+        order = np.argsort(self.indices, kind="stable")
+        reverse_indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.indices, minlength=len(self.nodes)), out=reverse_indptr[1:]
+        )
+        self.reverse_indices = start_ids[order]
+        if self.weighted:
+            self.reverse_weights = self.weights[order]
+        self.reverse_indptr = reverse_indptr
+
+    def transpose(self) -> "CSRGraph":
+        """Get the transposed graph, in which every edge is reversed and keeps its weight.
+        The arrays of the transpose are those used for incoming node lookups, and the arrays of the graph become the incoming arrays of the transpose,
+        so transposing back doesn't build anything.
+
+        Returns:
+            CSRGraph: The transposed graph. An undirected graph is its own transpose.
+        """
+        if not self.directed:
+            return self
+        if self.reverse_indptr is None:
+            self.__build_reverse_arrays()
+        transposed_graph = CSRGraph(
+            self.nodes,
+            self.reverse_indptr,
+            self.reverse_indices,
+            self.reverse_weights,
+            directed=True,
+        )
+        transposed_graph.reverse_indptr = self.indptr
+        transposed_graph.reverse_indices = self.indices
+        transposed_graph.reverse_weights = self.weights
+        return transposed_graph
+
+    def get_incoming_nodes(self, node: object) -> list:
+        """Get incoming nodes to provided node.
+
+        Args:
+            node: The node for which the incoming nodes should be retrieved.
+
+        Returns:
+            list: The incoming nodes list.
+        """
+        if not self.directed:
+            return self.get_adjacent_nodes(node)
+        node_id = self.get_node_id(node)
+        if self.reverse_indptr is None:
+            self.__build_reverse_arrays()
+        start, end = self.reverse_indptr[node_id], self.reverse_indptr[node_id + 1]
+        return [
+            self.nodes[start_id]
+            for start_id in self.reverse_indices[start:end].tolist()
+        ]
+
+    def get_incoming_nodes_and_weights(self, node: object) -> list[tuple]:
+        """Get incoming nodes and weights on the edges leading to the provided node.
+
+        Args:
+            node: The node for which the incoming nodes should be retrieved.
+
+        Returns:
+            list: The incoming (nodes, weight) list.
+        """
+        if not self.weighted:
+            raise Exception("Graph is not weighted, cannot return a node,weight pair")
+        if not self.directed:
+            return self.get_adjacent_nodes_and_weights(node)
+        node_id = self.get_node_id(node)
+        if self.reverse_indptr is None:
+            self.__build_reverse_arrays()
+        start, end = self.reverse_indptr[node_id], self.reverse_indptr[node_id + 1]
+        return [
+            (self.nodes[start_id], weight)
+            for start_id, weight in zip(
+                self.reverse_indices[start:end].tolist(),
+                self.reverse_weights[start:end].tolist(),
+            )
+        ]
+
+    def get_distance(self, start_node, end_node) -> Union[int, float]:
+        start_id = self.get_node_id(start_node)
+        end_id = self.get_node_id(end_node)
+        start, end = self.indptr[start_id], self.indptr[start_id + 1]
+        positions = np.flatnonzero(self.indices[start:end] == end_id)
+        if len(positions) == 0:
+            return np.inf
+        if self.weighted:
+            return self.weights[start + positions[0]].item()
+        return 1
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.node_ids
+
+    def __repr__(self) -> str:
+        class_name = type(self).__name__
+        return f"{class_name}()"
+
+    def __str__(self) -> str:
+        string = "A Graph in compressed sparse row representation.\n"
+        string += f"{len(self.nodes)} nodes and {len(self.indices)} stored edges using {self.get_nbytes()} bytes.\n"
+        return string
+
+
 class MinHeap:
     """Class that implements the minHeap data structure. The two essential methods for this data structure are insert and extract_min."""
 
     def __init__(self) -> None:
         """The nodes list holds the elements and associated keys are stored in the keys list. The keys are the values used for ordering the heap.
-        The last added index is an internal memory used in the extract_min function."""
+        The node positions dict maps every element to its index so that keys can be updated and elements removed in O(log n) time.
+        The last added index is an internal memory used in the get_last_added_node function.
+        """
         self.nodes = []
         self.keys = []
         self.node_positions = {}
@@ -465,8 +868,55 @@ class MinHeap:
             self.keys[index1 - 1],
         )
 
+    def __check_key(self, key: Union[int, float]) -> None:
+        try:
+            key / 1
+        except TypeError:
+            raise TypeError(
+                "Please provide a key that is either an integer or a real number."
+            )
+
+    def __sift_up(self, index: int) -> int:
+        """Move the element at the given index up until its parent has a smaller or equal key.
+
+        Args:
+            index (int): Index of the element to be moved. Index counting starts at 1 in this datastructure.
+
+        Returns:
+            int: The final index of the element.
+        """
+        parent_index = self.__get_parent(index)
+        while self.keys[index - 1] < self.keys[parent_index - 1]:
+            self.__swap(index, parent_index)
+            index = parent_index
+            parent_index = self.__get_parent(index)
+        return index
+
+    def __sift_down(self, index: int) -> int:
+        """Move the element at the given index down until both its children have greater or equal keys.
+        The swap always takes place with the child having the lower key value.
+
+        Args:
+            index (int): Index of the element to be moved. Index counting starts at 1 in this datastructure.
+
+        Returns:
+            int: The final index of the element.
+        """
+        while True:
+            smallest_index = index
+            left_child_index = self.__get_left_child(index)
+            right_child_index = self.__get_right_child(index)
+            if self.keys[left_child_index - 1] < self.keys[smallest_index - 1]:
+                smallest_index = left_child_index
+            if self.keys[right_child_index - 1] < self.keys[smallest_index - 1]:
+                smallest_index = right_child_index
+            if smallest_index == index:
+                return index
+            self.__swap(index, smallest_index)
+            index = smallest_index
+
     def add_node(self, node: object, key: int) -> None:
-        """Add a node to the heap.
+        """Add a node to the heap. The node is appended at the end of the heap without restoring the heap order, use insert for that.
 
         Args:
             node (object): The node to be added. A node represents the object that is stored in the heap.
@@ -475,14 +925,38 @@ class MinHeap:
         Raises:
             TypeError: If a key that is not a number is povided this exception is raised.
         """
+        self.__check_key(key)
+        if node in self.node_positions:
+            raise Exception(f"Node {node} is already in the heap !")
         self.nodes.append(node)
-        try:
-            key / 1
-        except TypeError:
-            raise TypeError(
-                "Please provide a key that is either an integer or a real number."
-            )
         self.keys.append(key)
+        self.node_positions[node] = len(self.nodes)
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[object, float]]) -> "MinHeap":
+        """Build a heap from (node, key) pairs in O(n) time.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be stored in the heap.
+
+        Returns:
+            MinHeap: The heap containing all provided elements.
+        """
+        heap = cls()
+        heap.heapify(items)
+        return heap
+
+    def heapify(self, items: Iterable[tuple[object, float]]) -> None:
+        """Add (node, key) pairs to the heap in bulk. The elements are appended and the heap order is then restored
+        by sifting down every parent, starting from the last one, which runs in O(n) time instead of O(n log n) for n inserts.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be added to the heap.
+        """
+        for node, key in items:
+            self.add_node(node, key)
+        for index in range(self.get_number_nodes() // 2, 0, -1):
+            self.__sift_down(index)
 
     def get_node(self, index: int) -> tuple[object, Union[int, float]]:
         return self.nodes[index - 1], self.keys[index - 1]
@@ -491,9 +965,9 @@ class MinHeap:
         return self.keys[index - 1]
 
     def get_last_added_node(self) -> tuple[object, float]:
-        return self.nodes.pop(self.last_added_index - 1), self.keys.pop(
-            self.last_added_index - 1
-        )
+        last_added_node = self.get_node(self.last_added_index)
+        self.remove(last_added_node[0])
+        return last_added_node
 
     def get_number_nodes(self) -> int:
         return len(self.nodes)
@@ -501,6 +975,28 @@ class MinHeap:
     def get_node_index(self, node) -> int:
         return self.node_positions[node]
 
+    def get_key(self, node: object) -> Union[int, float]:
+        """Get the key currently associated to a node stored in the heap.
+
+        Args:
+            node (object): The element for which the key should be retrieved.
+
+        Returns:
+            Union[int, float]: The key of the element.
+        """
+        return self.keys[self.get_node_index(node) - 1]
+
+    def contains(self, node: object) -> bool:
+        """Check whether a node is currently stored in the heap. Runs in O(1) time.
+
+        Args:
+            node (object): The node to look for.
+
+        Returns:
+            bool: Whether the node is in the heap.
+        """
+        return node in self.node_positions
+
     def insert(self, node: object, key: float) -> None:
         """Insert an element into the heap and rearrange the heap so that the order is maintained correctly.
 
@@ -509,52 +1005,65 @@ class MinHeap:
             key (float): The key associated to the element and that will be used for structuring the heap.
         """
         self.add_node(node, key)
-        node_index = self.get_number_nodes()
-        parent_index = self.__get_parent(node_index)
-        while key < self.get_node_key(parent_index):
-            self.__swap(node_index, parent_index)
-            node_index = parent_index
-            parent_index = self.__get_parent(node_index)
-        self.last_added_index = node_index
-        self.node_positions[node] = node_index
+        self.last_added_index = self.__sift_up(self.get_number_nodes())
+
+    def decrease_key(self, node: object, key: float) -> None:
+        """Lower the key of a node already stored in the heap and move it up to its new position. Runs in O(log n) time.
+
+        Args:
+            node (object): The element for which the key is decreased.
+            key (float): The new key. It can't be greater than the current key.
+        """
+        self.__check_key(key)
+        index = self.get_node_index(node)
+        if key > self.keys[index - 1]:
+            raise Exception("The new key is greater than the current key !")
+        self.keys[index - 1] = key
+        self.__sift_up(index)
+
+    def increase_key(self, node: object, key: float) -> None:
+        """Raise the key of a node already stored in the heap and move it down to its new position. Runs in O(log n) time.
+
+        Args:
+            node (object): The element for which the key is increased.
+            key (float): The new key. It can't be smaller than the current key.
+        """
+        self.__check_key(key)
+        index = self.get_node_index(node)
+        if key < self.keys[index - 1]:
+            raise Exception("The new key is smaller than the current key !")
+        self.keys[index - 1] = key
+        self.__sift_down(index)
+
+    def remove(self, node: object) -> None:
+        """Remove a node from the heap. The last element takes its place and is moved up or down to restore the heap order. Runs in O(log n) time.
+
+        Args:
+            node (object): The element to be removed.
+        """
+        self.bubble_down(self.get_node_index(node))
 
     def bubble_down(self, index: int) -> None:
-        # Getting last element index and switching places with the node situated at index provided as input value
+        """Remove the element at the given index. The last element takes its place and is sifted from that index:
+        down if one of its children has a smaller key, up if its new parent has a greater key. Runs in O(log n) time.
+
+        Args:
+            index (int): Index of the element to be removed. Index counting starts at 1 in this datastructure.
+        """
         if self.get_number_nodes() == 0:
             return
-        if self.get_number_nodes() == 1:
-            self.nodes.pop()
-            self.keys.pop()
-            return
-        last_node = self.nodes.pop()
-        last_key = self.keys.pop()
-        self.nodes[index - 1] = last_node
-        self.keys[index - 1] = last_key
-
-        # Checking which elements are now the children of the last element in the heap
-        last_index = 1
-        left_child_index = self.__get_left_child(last_index)
-        right_child_index = self.__get_right_child(last_index)
-        # If the children have smaller keys, the positions have to be exchanged.
-        while self.get_node_key(last_index) > self.get_node_key(
-            left_child_index
-        ) or self.get_node_key(last_index) > self.get_node_key(right_child_index):
-            # While a children has a lower key value than the last inserted value, the heap is rearranged using bubble down.
-            # The swap takes place with the child having the lower key value.
-            if self.get_node_key(left_child_index) < self.get_node_key(
-                right_child_index
-            ):
-                self.__swap(last_index, left_child_index)
-                last_index = left_child_index
-            else:
-                self.__swap(last_index, right_child_index)
-                last_index = right_child_index
-            left_child_index = self.__get_left_child(last_index)
-            right_child_index = self.__get_right_child(last_index)
+        # Getting last element index and switching places with the node situated at index provided as input value
+        last_index = self.get_number_nodes()
+        if index != last_index:
+            self.__swap(index, last_index)
+        removed_node = self.nodes.pop()
+        self.keys.pop()
+        del self.node_positions[removed_node]
+        if index < last_index:
+            self.__sift_down(self.__sift_up(index))
 
     def delete(self, node: object) -> None:
-        index = self.get_node_index(node)
-        self.bubble_down(index)
+        self.remove(node)
 
     def extract_min(self) -> object:
         """Extract the element with the minimal key value. After extraction the heap is reordered.
@@ -562,17 +1071,742 @@ class MinHeap:
         Returns:
             object: The element with the minimum key value.
         """
-        # First extracting the min value and then performing bubble down
         min_node, min_key = self.get_node(1)
+        self.remove(min_node)
+        return min_node, min_key
+
+    def __contains__(self, node: object) -> bool:
+        return self.contains(node)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
 
-        self.bubble_down(1)
 
+class DaryMinHeap:
+    """Class that implements an array-backed min heap in which every element has d children instead of two.
+    A wider heap is shallower, which makes insert and decrease_key cheaper at the cost of more comparisons in extract_min.
+    It exposes the same interface as MinHeap, positions are however counted from 0.
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        """Initialize an empty heap.
+
+        Args:
+            arity (int): The number of children of each element. 4 or 8 are good choices for decrease_key heavy workloads.
+        """
+        if type(arity) != int or arity < 2:
+            raise TypeError(
+                "Please provide an arity that is an integer greater than 1."
+            )
+        self.arity = arity
+        self.nodes = []
+        self.keys = []
+        self.node_positions = {}
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[tuple[object, float]], arity: int = 4
+    ) -> "DaryMinHeap":
+        """Build a heap from (node, key) pairs in O(n) time.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be stored in the heap.
+            arity (int): The number of children of each element.
+
+        Returns:
+            DaryMinHeap: The heap containing all provided elements.
+        """
+        heap = cls(arity)
+        heap.heapify(items)
+        return heap
+
+    def __swap(self, index1: int, index2: int) -> None:
+        node1 = self.nodes[index1]
+        node2 = self.nodes[index2]
+        self.node_positions[node1] = index2
+        self.node_positions[node2] = index1
+        self.nodes[index1], self.nodes[index2] = node2, node1
+        self.keys[index1], self.keys[index2] = self.keys[index2], self.keys[index1]
+
+    def __sift_up(self, index: int) -> int:
+        while index > 0:
+            parent_index = (index - 1) // self.arity
+            if self.keys[index] >= self.keys[parent_index]:
+                break
+            self.__swap(index, parent_index)
+            index = parent_index
+        return index
+
+    def __sift_down(self, index: int) -> int:
+        number_nodes = len(self.nodes)
+        while True:
+            first_child_index = index * self.arity + 1
+            if first_child_index >= number_nodes:
+                return index
+            last_child_index = min(first_child_index + self.arity, number_nodes)
+            smallest_index = index
+            for child_index in range(first_child_index, last_child_index):
+                if self.keys[child_index] < self.keys[smallest_index]:
+                    smallest_index = child_index
+            if smallest_index == index:
+                return index
+            self.__swap(index, smallest_index)
+            index = smallest_index
+
+    def add_node(self, node: object, key: Union[int, float]) -> None:
+        """Add a node to the heap. The node is appended at the end of the heap without restoring the heap order, use insert for that.
+
+        Args:
+            node (object): The node to be added.
+            key (Union[int, float]): Associated key used for the internal ordering of the heap.
+        """
+        try:
+            key / 1
+        except TypeError:
+            raise TypeError(
+                "Please provide a key that is either an integer or a real number."
+            )
+        if node in self.node_positions:
+            raise Exception(f"Node {node} is already in the heap !")
+        self.node_positions[node] = len(self.nodes)
+        self.nodes.append(node)
+        self.keys.append(key)
+
+    def heapify(self, items: Iterable[tuple[object, float]]) -> None:
+        """Add (node, key) pairs to the heap in bulk and restore the heap order in O(n) time.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be added to the heap.
+        """
+        for node, key in items:
+            self.add_node(node, key)
+        for index in range((len(self.nodes) - 2) // self.arity, -1, -1):
+            self.__sift_down(index)
+
+    def insert(self, node: object, key: Union[int, float]) -> None:
+        """Insert an element into the heap and rearrange the heap so that the order is maintained correctly.
+
+        Args:
+            node (object): The element to be added to the heap.
+            key (Union[int, float]): The key associated to the element and that will be used for structuring the heap.
+        """
+        self.add_node(node, key)
+        self.__sift_up(len(self.nodes) - 1)
+
+    def get_number_nodes(self) -> int:
+        return len(self.nodes)
+
+    def get_key(self, node: object) -> Union[int, float]:
+        return self.keys[self.node_positions[node]]
+
+    def contains(self, node: object) -> bool:
+        return node in self.node_positions
+
+    def decrease_key(self, node: object, key: Union[int, float]) -> None:
+        """Lower the key of a node already stored in the heap. Runs in O(log_d n) time.
+
+        Args:
+            node (object): The element for which the key is decreased.
+            key (Union[int, float]): The new key. It can't be greater than the current key.
+        """
+        index = self.node_positions[node]
+        if key > self.keys[index]:
+            raise Exception("The new key is greater than the current key !")
+        self.keys[index] = key
+        self.__sift_up(index)
+
+    def increase_key(self, node: object, key: Union[int, float]) -> None:
+        """Raise the key of a node already stored in the heap. Runs in O(d log_d n) time.
+
+        Args:
+            node (object): The element for which the key is increased.
+            key (Union[int, float]): The new key. It can't be smaller than the current key.
+        """
+        index = self.node_positions[node]
+        if key < self.keys[index]:
+            raise Exception("The new key is smaller than the current key !")
+        self.keys[index] = key
+        self.__sift_down(index)
+
+    def remove(self, node: object) -> None:
+        """Remove a node from the heap. The last element takes its place and is sifted up or down from there.
+
+        Args:
+            node (object): The element to be removed.
+        """
+        index = self.node_positions[node]
+        last_index = len(self.nodes) - 1
+        if index != last_index:
+            self.__swap(index, last_index)
+        self.nodes.pop()
+        self.keys.pop()
+        del self.node_positions[node]
+        if index < last_index:
+            self.__sift_down(self.__sift_up(index))
+
+    def extract_min(self) -> tuple[object, Union[int, float]]:
+        """Extract the element with the minimal key value. After extraction the heap is reordered.
+
+        Returns:
+            tuple[object, Union[int, float]]: The element with the minimum key value and its key.
+        """
+        min_node, min_key = self.nodes[0], self.keys[0]
+        self.remove(min_node)
         return min_node, min_key
 
+    def __contains__(self, node: object) -> bool:
+        return self.contains(node)
+
     def __len__(self) -> int:
         return len(self.nodes)
 
 
+class ArrayMinHeap:
+    """Class that implements a binary min heap specialised for integer node ids in [0, capacity) and numeric keys.
+    The heap, the keys and the position of every node id are stored in preallocated typed arrays, so operations
+    don't hash nodes or box keys and the memory used is proportional to the capacity. Positions are counted from 0.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty heap.
+
+        Args:
+            capacity (int): The number of distinct node ids the heap can hold. Node ids must be in [0, capacity).
+        """
+        self.capacity = capacity
+        self.size = 0
+        # The heap array holds the node ids in heap order and the keys array the associated keys
+        self.heap = array("q", bytes(8 * capacity))
+        self.keys = array("d", bytes(8 * capacity))
+        # Position of each node id in the heap, -1 when the node id isn't stored in the heap
+        self.positions = array("q", [-1]) * capacity
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[tuple[int, float]], capacity: int
+    ) -> "ArrayMinHeap":
+        """Build a heap from (node id, key) pairs in O(n) time.
+
+        Args:
+            items (Iterable[tuple[int, float]]): The (node id, key) pairs to be stored in the heap.
+            capacity (int): The number of distinct node ids the heap can hold.
+
+        Returns:
+            ArrayMinHeap: The heap containing all provided elements.
+        """
+        heap = cls(capacity)
+        heap.heapify(items)
+        return heap
+
+    def __check_node_id(self, node_id: int) -> None:
+        if not 0 <= node_id < self.capacity:
+            raise IndexError(
+                f"Node id {node_id} is out of the heap capacity {self.capacity} !"
+            )
+
+    def __sift_up(self, position: int, node_id: int, key: float) -> None:
+        """Place a node id at a position and move it up until its parent has a smaller or equal key.
+        Parents are shifted down into the hole instead of being swapped, which halves the number of writes.
+        """
+        heap, keys, positions = self.heap, self.keys, self.positions
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent_key = keys[parent_position]
+            if key >= parent_key:
+                break
+            parent_id = heap[parent_position]
+            heap[position] = parent_id
+            keys[position] = parent_key
+            positions[parent_id] = position
+            position = parent_position
+        heap[position] = node_id
+        keys[position] = key
+        positions[node_id] = position
+
+    def __sift_down(self, position: int, node_id: int, key: float) -> None:
+        """Place a node id at a position and move it down until both its children have greater or equal keys."""
+        heap, keys, positions, size = self.heap, self.keys, self.positions, self.size
+        child_position = 2 * position + 1
+        while child_position < size:
+            child_key = keys[child_position]
+            right_position = child_position + 1
+            if right_position < size and keys[right_position] < child_key:
+                child_position = right_position
+                child_key = keys[right_position]
+            if key <= child_key:
+                break
+            child_id = heap[child_position]
+            heap[position] = child_id
+            keys[position] = child_key
+            positions[child_id] = position
+            position = child_position
+            child_position = 2 * position + 1
+        heap[position] = node_id
+        keys[position] = key
+        positions[node_id] = position
+
+    def heapify(self, items: Iterable[tuple[int, float]]) -> None:
+        """Add (node id, key) pairs to the heap in bulk and restore the heap order in O(n) time.
+
+        Args:
+            items (Iterable[tuple[int, float]]): The (node id, key) pairs to be added to the heap.
+        """
+        for node_id, key in items:
+            self.__check_node_id(node_id)
+            if self.positions[node_id] != -1:
+                raise Exception(f"Node {node_id} is already in the heap !")
+            self.heap[self.size] = node_id
+            self.keys[self.size] = key
+            self.positions[node_id] = self.size
+            self.size += 1
+        for position in range(self.size // 2 - 1, -1, -1):
+            self.__sift_down(position, self.heap[position], self.keys[position])
+
+    def insert(self, node_id: int, key: float) -> None:
+        """Insert a node id into the heap and rearrange the heap so that the order is maintained correctly.
+
+        Args:
+            node_id (int): The node id to be added to the heap.
+            key (float): The key associated to the node id.
+        """
+        self.__check_node_id(node_id)
+        if self.positions[node_id] != -1:
+            raise Exception(f"Node {node_id} is already in the heap !")
+        self.size += 1
+        self.__sift_up(self.size - 1, node_id, key)
+
+    def get_number_nodes(self) -> int:
+        return self.size
+
+    def get_key(self, node_id: int) -> float:
+        position = self.positions[node_id]
+        if position == -1:
+            raise KeyError(node_id)
+        return self.keys[position]
+
+    def contains(self, node_id: int) -> bool:
+        return 0 <= node_id < self.capacity and self.positions[node_id] != -1
+
+    def decrease_key(self, node_id: int, key: float) -> None:
+        """Lower the key of a node id already stored in the heap. Runs in O(log n) time.
+
+        Args:
+            node_id (int): The node id for which the key is decreased.
+            key (float): The new key. It can't be greater than the current key.
+        """
+        position = self.positions[node_id]
+        if position == -1:
+            raise KeyError(node_id)
+        if key > self.keys[position]:
+            raise Exception("The new key is greater than the current key !")
+        self.__sift_up(position, node_id, key)
+
+    def increase_key(self, node_id: int, key: float) -> None:
+        """Raise the key of a node id already stored in the heap. Runs in O(log n) time.
+
+        Args:
+            node_id (int): The node id for which the key is increased.
+            key (float): The new key. It can't be smaller than the current key.
+        """
+        position = self.positions[node_id]
+        if position == -1:
+            raise KeyError(node_id)
+        if key < self.keys[position]:
+            raise Exception("The new key is smaller than the current key !")
+        self.__sift_down(position, node_id, key)
+
+    def remove(self, node_id: int) -> None:
+        """Remove a node id from the heap. The last element takes its place and is sifted up or down from there.
+
+        Args:
+            node_id (int): The node id to be removed.
+        """
+        position = self.positions[node_id]
+        if position == -1:
+            raise KeyError(node_id)
+        self.positions[node_id] = -1
+        self.size -= 1
+        if position == self.size:
+            return
+        last_id = self.heap[self.size]
+        last_key = self.keys[self.size]
+        if position > 0 and last_key < self.keys[(position - 1) >> 1]:
+            self.__sift_up(position, last_id, last_key)
+        else:
+            self.__sift_down(position, last_id, last_key)
+
+    def extract_min(self) -> tuple[int, float]:
+        """Extract the node id with the minimal key value. After extraction the heap is reordered.
+
+        Returns:
+            tuple[int, float]: The node id with the minimum key value and its key.
+        """
+        if self.size == 0:
+            raise IndexError("extract_min from an empty heap")
+        min_id = self.heap[0]
+        min_key = self.keys[0]
+        self.positions[min_id] = -1
+        self.size -= 1
+        if self.size > 0:
+            self.__sift_down(0, self.heap[self.size], self.keys[self.size])
+        return min_id, min_key
+
+    def __contains__(self, node_id: int) -> bool:
+        return self.contains(node_id)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class PairingHeapNode:
+    """A class representing an element of a pairing heap. The children of an element are stored as a linked list starting at its child attribute.
+    The previous attribute points to the left sibling, or to the parent for the leftmost child.
+    """
+
+    def __init__(self, node: object, key: Union[int, float]) -> None:
+        self.node = node
+        self.key = key
+        self.child = None
+        self.sibling = None
+        self.previous = None
+
+
+class PairingHeap:
+    """Class that implements the pairing heap data structure. Insert, decrease_key and merging two heaps run in O(1) time
+    while extract_min runs in amortized O(log n) time, which suits workloads dominated by inserts and decrease-keys.
+    It exposes the same interface as MinHeap.
+    """
+
+    def __init__(self) -> None:
+        self.root = None
+        self.node_positions = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[object, float]]) -> "PairingHeap":
+        """Build a heap from (node, key) pairs in O(n) time.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be stored in the heap.
+
+        Returns:
+            PairingHeap: The heap containing all provided elements.
+        """
+        heap = cls()
+        heap.heapify(items)
+        return heap
+
+    def __meld(
+        self, first: PairingHeapNode | None, second: PairingHeapNode | None
+    ) -> PairingHeapNode | None:
+        """Merge two heap-ordered trees. The root with the greater key becomes the leftmost child of the other one."""
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second.key < first.key:
+            first, second = second, first
+        second.previous = first
+        second.sibling = first.child
+        if first.child is not None:
+            first.child.previous = second
+        first.child = second
+        return first
+
+    def __combine_siblings(
+        self, first: PairingHeapNode | None
+    ) -> PairingHeapNode | None:
+        """Merge a list of sibling trees into a single tree using the two-pass pairing strategy.
+        The trees are first melded pairwise from left to right and the results are then melded from right to left.
+        """
+        trees = []
+        while first is not None:
+            next_sibling = first.sibling
+            first.previous = None
+            first.sibling = None
+            trees.append(first)
+            first = next_sibling
+        if len(trees) == 0:
+            return None
+        paired_trees = [
+            self.__meld(trees[i], trees[i + 1] if i + 1 < len(trees) else None)
+            for i in range(0, len(trees), 2)
+        ]
+        root = paired_trees[-1]
+        for tree in reversed(paired_trees[:-1]):
+            root = self.__meld(tree, root)
+        return root
+
+    def __detach(self, entry: PairingHeapNode) -> None:
+        """Cut the subtree rooted at the given entry from its parent."""
+        if entry.previous.child is entry:
+            entry.previous.child = entry.sibling
+        else:
+            entry.previous.sibling = entry.sibling
+        if entry.sibling is not None:
+            entry.sibling.previous = entry.previous
+        entry.previous = None
+        entry.sibling = None
+
+    def add_node(self, node: object, key: Union[int, float]) -> None:
+        """Add a node to the heap. A pairing heap has no unordered storage so this is the same as insert.
+
+        Args:
+            node (object): The node to be added.
+            key (Union[int, float]): Associated key used for the internal ordering of the heap.
+        """
+        self.insert(node, key)
+
+    def heapify(self, items: Iterable[tuple[object, float]]) -> None:
+        """Add (node, key) pairs to the heap in bulk. Each insertion runs in O(1) time.
+
+        Args:
+            items (Iterable[tuple[object, float]]): The (node, key) pairs to be added to the heap.
+        """
+        for node, key in items:
+            self.insert(node, key)
+
+    def insert(self, node: object, key: Union[int, float]) -> None:
+        """Insert an element into the heap by melding it with the root. Runs in O(1) time.
+
+        Args:
+            node (object): The element to be added to the heap.
+            key (Union[int, float]): The key associated to the element and that will be used for structuring the heap.
+        """
+        try:
+            key / 1
+        except TypeError:
+            raise TypeError(
+                "Please provide a key that is either an integer or a real number."
+            )
+        if node in self.node_positions:
+            raise Exception(f"Node {node} is already in the heap !")
+        entry = PairingHeapNode(node, key)
+        self.node_positions[node] = entry
+        self.root = self.__meld(self.root, entry)
+
+    def get_number_nodes(self) -> int:
+        return len(self.node_positions)
+
+    def get_key(self, node: object) -> Union[int, float]:
+        return self.node_positions[node].key
+
+    def contains(self, node: object) -> bool:
+        return node in self.node_positions
+
+    def decrease_key(self, node: object, key: Union[int, float]) -> None:
+        """Lower the key of a node already stored in the heap. Its subtree is cut and melded with the root, which runs in O(1) time.
+
+        Args:
+            node (object): The element for which the key is decreased.
+            key (Union[int, float]): The new key. It can't be greater than the current key.
+        """
+        entry = self.node_positions[node]
+        if key > entry.key:
+            raise Exception("The new key is greater than the current key !")
+        entry.key = key
+        if entry is not self.root:
+            self.__detach(entry)
+            self.root = self.__meld(self.root, entry)
+
+    def remove(self, node: object) -> None:
+        """Remove a node from the heap. The children of the removed element are paired and melded back with the root.
+
+        Args:
+            node (object): The element to be removed.
+        """
+        entry = self.node_positions.pop(node)
+        if entry is self.root:
+            self.root = self.__combine_siblings(entry.child)
+        else:
+            self.__detach(entry)
+            self.root = self.__meld(self.root, self.__combine_siblings(entry.child))
+        entry.child = None
+
+    def increase_key(self, node: object, key: Union[int, float]) -> None:
+        """Raise the key of a node already stored in the heap by removing and reinserting it.
+
+        Args:
+            node (object): The element for which the key is increased.
+            key (Union[int, float]): The new key. It can't be smaller than the current key.
+        """
+        if key < self.get_key(node):
+            raise Exception("The new key is smaller than the current key !")
+        self.remove(node)
+        self.insert(node, key)
+
+    def extract_min(self) -> tuple[object, Union[int, float]]:
+        """Extract the element with the minimal key value. The children of the root are then paired to form the new root.
+
+        Returns:
+            tuple[object, Union[int, float]]: The element with the minimum key value and its key.
+        """
+        if self.root is None:
+            raise IndexError("extract_min from an empty heap")
+        min_node, min_key = self.root.node, self.root.key
+        self.remove(min_node)
+        return min_node, min_key
+
+    def __contains__(self, node: object) -> bool:
+        return self.contains(node)
+
+    def __len__(self) -> int:
+        return len(self.node_positions)
+
+
+class BucketQueue:
+    """Class that implements a bucket queue (Dial's algorithm) for non-negative integer keys.
+    Keys are stored in a circular array of max_weight + 1 buckets, which is enough when every key in the queue lies
+    between the current minimum and the current minimum + max_weight, as is the case in Dijkstra with integer weights
+    bounded by max_weight. Insert, decrease_key and remove run in O(1) time and extract_min scans the empty buckets
+    until the next key, so the total scanning cost is bounded by the largest extracted key.
+    It exposes the same interface as MinHeap.
+    """
+
+    def __init__(self, max_weight: int) -> None:
+        """Initialize an empty bucket queue.
+
+        Args:
+            max_weight (int): The largest difference between two keys stored in the queue at the same time.
+        """
+        self.max_weight = max_weight
+        # Each bucket keeps its nodes in a dict so that a node can be removed from its bucket in O(1) time
+        self.buckets = [{} for _ in range(max_weight + 1)]
+        self.node_keys = {}
+        # No key in the queue is smaller than the current key
+        self.current_key = 0
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[tuple[object, int]], max_weight: int
+    ) -> "BucketQueue":
+        """Build a bucket queue from (node, key) pairs in O(n) time.
+
+        Args:
+            items (Iterable[tuple[object, int]]): The (node, key) pairs to be stored in the queue.
+            max_weight (int): The largest difference between two keys stored in the queue at the same time.
+
+        Returns:
+            BucketQueue: The queue containing all provided elements.
+        """
+        queue = cls(max_weight)
+        queue.heapify(items)
+        return queue
+
+    def __bucket(self, key: Union[int, float]) -> dict:
+        return self.buckets[int(key) % len(self.buckets)]
+
+    def __check_key(self, key: Union[int, float]) -> None:
+        if not self.current_key <= key <= self.current_key + self.max_weight:
+            raise Exception(
+                f"The key {key} is out of the bucket range [{self.current_key}, {self.current_key + self.max_weight}] !"
+            )
+
+    def add_node(self, node: object, key: Union[int, float]) -> None:
+        """Add a node to the queue. Buckets have no unordered storage so this is the same as insert.
+
+        Args:
+            node (object): The node to be added to the queue.
+            key (Union[int, float]): The key associated to the node.
+        """
+        self.insert(node, key)
+
+    def heapify(self, items: Iterable[tuple[object, int]]) -> None:
+        """Add (node, key) pairs to the queue in bulk.
+
+        Args:
+            items (Iterable[tuple[object, int]]): The (node, key) pairs to be added to the queue.
+        """
+        items = list(items)
+        if not self.node_keys and items:
+            self.current_key = int(min(key for _, key in items))
+        for node, key in items:
+            self.insert(node, key)
+
+    def insert(self, node: object, key: Union[int, float]) -> None:
+        """Insert a node into the queue.
+
+        Args:
+            node (object): The node to be added to the queue.
+            key (Union[int, float]): The key associated to the node. It must be an integer within max_weight of the current minimum.
+        """
+        if node in self.node_keys:
+            raise Exception(f"Node {node} is already in the heap !")
+        if not self.node_keys and not (
+            self.current_key <= key <= self.current_key + self.max_weight
+        ):
+            # An empty queue can restart from any key
+            self.current_key = int(key)
+        self.__check_key(key)
+        self.__bucket(key)[node] = None
+        self.node_keys[node] = key
+
+    def get_number_nodes(self) -> int:
+        return len(self.node_keys)
+
+    def get_key(self, node: object) -> Union[int, float]:
+        return self.node_keys[node]
+
+    def contains(self, node: object) -> bool:
+        return node in self.node_keys
+
+    def decrease_key(self, node: object, key: Union[int, float]) -> None:
+        """Lower the key of a node already stored in the queue by moving it to another bucket. Runs in O(1) time.
+
+        Args:
+            node (object): The node for which the key is decreased.
+            key (Union[int, float]): The new key. It can't be greater than the current key of the node.
+        """
+        if key > self.node_keys[node]:
+            raise Exception("The new key is greater than the current key !")
+        self.__check_key(key)
+        self.remove(node)
+        self.insert(node, key)
+
+    def increase_key(self, node: object, key: Union[int, float]) -> None:
+        """Raise the key of a node already stored in the queue by moving it to another bucket. Runs in O(1) time.
+
+        Args:
+            node (object): The node for which the key is increased.
+            key (Union[int, float]): The new key. It can't be smaller than the current key of the node.
+        """
+        if key < self.node_keys[node]:
+            raise Exception("The new key is smaller than the current key !")
+        self.__check_key(key)
+        self.remove(node)
+        self.insert(node, key)
+
+    def remove(self, node: object) -> None:
+        """Remove a node from the queue.
+
+        Args:
+            node (object): The node to be removed.
+        """
+        key = self.node_keys.pop(node)
+        del self.__bucket(key)[node]
+
+    def extract_min(self) -> tuple[object, Union[int, float]]:
+        """Extract a node with the minimal key value, scanning forward from the last extracted key.
+
+        Returns:
+            tuple[object, Union[int, float]]: The node with the minimum key value and its key.
+        """
+        if not self.node_keys:
+            raise IndexError("extract_min from an empty heap")
+        bucket = self.__bucket(self.current_key)
+        while not bucket:
+            self.current_key += 1
+            bucket = self.__bucket(self.current_key)
+        node = next(iter(bucket))
+        del bucket[node]
+        return node, self.node_keys.pop(node)
+
+    def __contains__(self, node: object) -> bool:
+        return self.contains(node)
+
+    def __len__(self) -> int:
+        return len(self.node_keys)
+
+
 class BinaryTreeNode:
     """A class that is used for building a binary search tree. NB: this tree will most likely not be balanced."""
 
@@ -0,0 +1,246 @@
+from concurrent.futures import ProcessPoolExecutor
+from graphs.datastructures import UndirectedGraph, CSRGraph
+from graphs.shared_memory import share_arrays, attach_arrays, release_blocks
+import numpy as np
+
+# Below this number of frontier nodes a phase is relaxed in the calling process as the inter-process overhead dominates
+PARALLEL_FRONTIER_SIZE = 1024
+
+
+def delta_stepping(
+    graph: UndirectedGraph | CSRGraph,
+    starting_node: object,
+    delta: float | None = None,
+    workers: int = 1,
+) -> dict:
+    """Find the single source shortest path from a starting node to all other nodes with the delta-stepping algorithm.
+    Tentative distances are kept in buckets of width delta. The nodes of the smallest non-empty bucket are settled together
+    by relaxing their light edges (weight <= delta) until the bucket stays empty, then their heavy edges once.
+    The edges of a phase are relaxed in bulk with NumPy and, for large frontiers, split across a process pool whose
+    workers read the CSR arrays of the graph from shared memory.
+
+    Args:
+        graph (UndirectedGraph | CSRGraph): The graph on which to compute the shortest paths
+        starting_node (object): The starting node from which to computed the shortest paths
+        delta (float | None): The width of the buckets. Defaults to the maximum weight divided by the average degree.
+        workers (int): The number of worker processes. 1 relaxes all edges in the current process.
+
+    Returns:
+        dict: A dictionary containing all the graph nodes as keys with associated distances from the starting node
+    """
+    if type(graph) == UndirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph or CSRGraph"
+        )
+    if not graph.weighted:
+        raise TypeError("Please provide a weighted graph")
+    if starting_node not in graph:
+        raise TypeError("Starting node not in graph !")
+    if delta is None:
+        delta = _default_delta(graph)
+    if delta <= 0:
+        raise Exception("Delta should be positive !")
+
+    if workers == 1:
+        distances = _run_phases(
+            graph, graph.get_node_id(starting_node), delta, None, workers
+        )
+    else:
+        descriptor, blocks = share_arrays(
+            {
+                "indptr": graph.indptr,
+                "indices": graph.indices,
+                "weights": graph.weights,
+            }
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_graph_arrays,
+                initargs=(descriptor,),
+            ) as executor:
+                distances = _run_phases(
+                    graph, graph.get_node_id(starting_node), delta, executor, workers
+                )
+        finally:
+            release_blocks(blocks)
+
+    return dict(zip(graph.nodes, distances.tolist()))
+
+
+def _default_delta(graph: CSRGraph) -> float:
+    if graph.get_number_edges() == 0:
+        return 1.0
+    average_degree = graph.get_number_edges() / graph.get_number_nodes()
+    delta = float(graph.weights.max()) / max(average_degree, 1.0)
+    return delta if delta > 0 else 1.0
+
+
+def _run_phases(
+    graph: CSRGraph,
+    starting_id: int,
+    delta: float,
+    executor: ProcessPoolExecutor | None,
+    workers: int,
+) -> np.ndarray:
+    distances = np.full(graph.get_number_nodes(), np.inf)
+    distances[starting_id] = 0.0
+    # Buckets map the index of a bucket to the ids of the nodes whose tentative distance falls in it
+    buckets = {0: {starting_id}}
+    while buckets:
+        bucket_index = min(buckets)
+        settled_ids = set()
+        # Relaxing light edges can insert nodes back into the current bucket, so it is processed until it stays empty
+        while bucket_index in buckets:
+            frontier = np.fromiter(buckets.pop(bucket_index), dtype=np.int64)
+            settled_ids.update(frontier.tolist())
+            _apply_requests(
+                distances,
+                buckets,
+                delta,
+                *_relax(graph, distances, frontier, delta, True, executor, workers),
+            )
+        settled = np.fromiter(settled_ids, dtype=np.int64, count=len(settled_ids))
+        _apply_requests(
+            distances,
+            buckets,
+            delta,
+            *_relax(graph, distances, settled, delta, False, executor, workers),
+        )
+    return distances
+
+
+def _relax(
+    graph: CSRGraph,
+    distances: np.ndarray,
+    frontier: np.ndarray,
+    delta: float,
+    light: bool,
+    executor: ProcessPoolExecutor | None,
+    workers: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    frontier_distances = distances[frontier]
+    if executor is None or len(frontier) < PARALLEL_FRONTIER_SIZE:
+        return relax_requests(
+            graph.indptr,
+            graph.indices,
+            graph.weights,
+            frontier,
+            frontier_distances,
+            delta,
+            light,
+        )
+    chunks = np.array_split(np.arange(len(frontier)), workers)
+    results = list(
+        executor.map(
+            _relax_chunk,
+            [
+                (frontier[chunk], frontier_distances[chunk], delta, light)
+                for chunk in chunks
+            ],
+        )
+    )
+    return _minimum_per_target(
+        np.concatenate([targets for targets, _ in results]),
+        np.concatenate([candidates for _, candidates in results]),
+    )
+
+
+def _apply_requests(
+    distances: np.ndarray,
+    buckets: dict,
+    delta: float,
+    targets: np.ndarray,
+    candidates: np.ndarray,
+) -> None:
+    improved = candidates < distances[targets]
+    targets = targets[improved]
+    candidates = candidates[improved]
+    old_distances = distances[targets]
+    distances[targets] = candidates
+    for target, old_distance, candidate in zip(
+        targets.tolist(), old_distances.tolist(), candidates.tolist()
+    ):
+        old_index = int(old_distance // delta) if old_distance != np.inf else None
+        # The node may have left its bucket already if it belongs to the bucket being processed
+        if old_index in buckets:
+            buckets[old_index].discard(target)
+            if not buckets[old_index]:
+                del buckets[old_index]
+        buckets.setdefault(int(candidate // delta), set()).add(target)
+
+
+def _minimum_per_target(
+    targets: np.ndarray, candidates: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    order = np.lexsort((candidates, targets))
+    targets = targets[order]
+    candidates = candidates[order]
+    first = np.ones(len(targets), dtype=bool)
+    first[1:] = targets[1:] != targets[:-1]
+    return targets[first], candidates[first]
+
+
+def relax_requests(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    frontier: np.ndarray,
+    frontier_distances: np.ndarray,
+    delta: float,
+    light: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the relaxation requests of the light or heavy edges leaving a set of nodes, in bulk.
+
+    Args:
+        indptr (np.ndarray): Offsets of each node's edges in the indices array.
+        indices (np.ndarray): The end node id of each edge.
+        weights (np.ndarray): The weight of each edge.
+        frontier (np.ndarray): The ids of the nodes whose edges are relaxed.
+        frontier_distances (np.ndarray): The tentative distances of the frontier nodes.
+        delta (float): The width of the buckets. Light edges have a weight <= delta.
+        light (bool): Whether the light or the heavy edges are relaxed.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The ids of the reached nodes and the smallest candidate distance for each of them.
+    """
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    # Positions of all edges of the frontier, built without a Python loop over the nodes
+    offsets = np.cumsum(counts) - counts
+    positions = np.repeat(starts - offsets, counts) + np.arange(counts.sum())
+    edge_weights = weights[positions]
+    selected = edge_weights <= delta if light else edge_weights > delta
+    candidates = (
+        np.repeat(frontier_distances, counts)[selected] + edge_weights[selected]
+    )
+    return _minimum_per_target(
+        indices[positions[selected]].astype(np.int64), candidates
+    )
+
+
+# Graph arrays attached from shared memory by each worker process of delta_stepping
+_worker_graph_arrays = {}
+
+
+def _attach_graph_arrays(descriptor: dict) -> None:
+    arrays, blocks = attach_arrays(descriptor)
+    _worker_graph_arrays.update(arrays)
+    _worker_graph_arrays["blocks"] = blocks
+
+
+def _relax_chunk(
+    task: tuple[np.ndarray, np.ndarray, float, bool],
+) -> tuple[np.ndarray, np.ndarray]:
+    frontier, frontier_distances, delta, light = task
+    return relax_requests(
+        _worker_graph_arrays["indptr"],
+        _worker_graph_arrays["indices"],
+        _worker_graph_arrays["weights"],
+        frontier,
+        frontier_distances,
+        delta,
+        light,
+    )
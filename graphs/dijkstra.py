@@ -1,4 +1,22 @@
-from graphs.datastructures import UndirectedGraph, MinHeap
+import math
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterator
+import numpy as np
+from graphs.datastructures import (
+    DirectedGraph,
+    UndirectedGraph,
+    CSRGraph,
+    MinHeap,
+    ArrayMinHeap,
+    BucketQueue,
+)
+from graphs.shared_memory import share_arrays, attach_arrays, release_blocks
+
+# Upper bound on the size of the distance rows computed by a worker of dijkstra_rows in one chunk
+ROWS_CHUNK_BYTES = 64 * 2**20
 
 
 def dijkstra(graph: UndirectedGraph, starting_node: object) -> dict:
@@ -13,7 +31,7 @@ def dijkstra(graph: UndirectedGraph, starting_node: object) -> dict:
     """
     if type(graph) != UndirectedGraph:
         raise TypeError("Please provide an input graph of type UndirectedGraph")
-    if starting_node not in graph.get_nodes():
+    if starting_node not in graph:
         raise TypeError("Starting node not in graph !")
 
     # Initialising the algorithm by setting all distances to infinity (1e7)
@@ -56,41 +74,611 @@ def dijkstra(graph: UndirectedGraph, starting_node: object) -> dict:
     return distances
 
 
-def dijkstra_heap(graph: UndirectedGraph, starting_node: object) -> dict:
+def dijkstra_heap(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+    starting_node: object,
+    heap_factory: Callable[[], MinHeap] | None = None,
+    return_predecessors: bool = False,
+) -> dict | tuple[dict, dict]:
     """Find the single source shortest path from a starting node to all other nodes in the graph. Uses the dijkstra algorithm with a Heap datastructure for better performance.
 
     Args:
-        graph (UndirectedGraph): The graph on which to compute the shortest paths
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The weighted graph on which to compute the shortest paths
         starting_node (object): The starting node from which to computed the shortest paths
+        heap_factory (Callable[[], MinHeap] | None): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap.
+                                                     By default a bucket queue (Dial's algorithm) is used when all weights are
+                                                     non-negative integers up to BUCKET_QUEUE_MAX_WEIGHT and a MinHeap otherwise.
+                                                     Selecting it scans the weights of a dictionnary based graph, see select_heap_factory.
+        return_predecessors (bool): Whether to also return the predecessor of each node on its shortest path.
 
     Returns:
-        dict: A dictionary containing all the graph nodes as keys with associated distances from the starting node
+        dict | tuple[dict, dict]: A dictionary containing all the graph nodes as keys with associated distances from the starting node,
+                                  math.inf for the nodes that can't be reached. With return_predecessors, also a dictionary mapping
+                                  each reached node to its predecessor (None for the starting node) from which reconstruct_path
+                                  rebuilds a path in O(path length) time.
     """
-    if type(graph) != UndirectedGraph:
-        raise TypeError("Please provide an input graph of type Graph")
-    if starting_node not in graph.get_nodes():
+    if type(graph) not in (UndirectedGraph, DirectedGraph, CSRGraph):
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph, DirectedGraph or CSRGraph"
+        )
+    if starting_node not in graph:
         raise TypeError("Starting node not in graph !")
+    if heap_factory is None:
+        heap_factory = select_heap_factory(graph)
 
-    # Initialising the algorithm by creating a Heap for all accessible nodes and initializing the final distances dict.
-    distances = {}
-    accessible_nodes = MinHeap()
+    # Initialising the algorithm by creating a Heap for all accessible nodes and initializing the distances dict.
+    # The distances dict holds the final distance of the explored nodes and the tentative distance of the nodes still in the heap.
+    distances = {starting_node: 0}
+    predecessors = {starting_node: None}
+    accessible_nodes = heap_factory()
     accessible_nodes.insert(starting_node, 0)
 
     # While there are edges going from explored to unexplored edges there are paths that exist
     while accessible_nodes.get_number_nodes() != 0:
-        # Extracting the node with the shortest path stored in the heap
+        # Extracting the node with the shortest path stored in the heap. Its distance is now final.
         node, distance = accessible_nodes.extract_min()
-        if node in distances.keys():
-            continue
-        distances[node] = distance
         # Updating the heap with the new distances after having explored a new node.
+        # Explored nodes are never updated again as their distance can't be improved with non-negative weights.
         for adjacent_node, weight in graph.get_adjacent_nodes_and_weights(node):
-            if adjacent_node not in distances.keys():
-                accessible_nodes.insert(adjacent_node, distance + weight)
+            new_distance = distance + weight
+            if new_distance < distances.get(adjacent_node, math.inf):
+                distances[adjacent_node] = new_distance
+                predecessors[adjacent_node] = node
+                if accessible_nodes.contains(adjacent_node):
+                    accessible_nodes.decrease_key(adjacent_node, new_distance)
+                else:
+                    accessible_nodes.insert(adjacent_node, new_distance)
 
     # Completing the distances dict so that unexplored (unaccessible nodes have an inifinite distance from the starting node.)
     # Runs in O(n) time so there is no performance loss.
-    for node, weight in graph.get_nodes_and_weights():
-        if node not in distances.keys():
-            distances[node] = 1e7
+    for node in graph.get_nodes():
+        if node not in distances:
+            distances[node] = math.inf
+    if return_predecessors:
+        return distances, predecessors
     return distances
+
+
+def integer_weight_bound(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+) -> int | None:
+    """Find the largest weight of a graph if all its weights are non-negative integers.
+    Infinite weights are skipped as such edges never improve a distance. The bound of a CSRGraph is cached as the graph is frozen.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The weighted graph to inspect
+
+    Returns:
+        int | None: The largest weight, or None if a weight is negative or not an integer.
+    """
+    if not graph.weighted:
+        raise Exception("Graph is not weighted, cannot return a node,weight pair")
+    if type(graph) == CSRGraph:
+        if graph not in _csr_weight_bounds:
+            _csr_weight_bounds[graph] = _csr_integer_weight_bound(graph.weights)
+        return _csr_weight_bounds[graph]
+    max_weight = 0
+    for _, adjacent_nodes in graph.get_nodes_and_weights():
+        for weight in adjacent_nodes.values():
+            if isinstance(weight, float) and math.isinf(weight):
+                continue
+            if not (
+                isinstance(weight, int)
+                or (isinstance(weight, float) and weight.is_integer())
+            ):
+                return None
+            if weight < 0:
+                return None
+            max_weight = max(max_weight, weight)
+    return int(max_weight)
+
+
+# Weight bounds of the CSR graphs already inspected by integer_weight_bound, dropped along with their graph
+_csr_weight_bounds = weakref.WeakKeyDictionary()
+
+
+def _csr_integer_weight_bound(weights: np.ndarray) -> int | None:
+    if weights.dtype.kind == "f":
+        weights = weights[~np.isinf(weights)]
+    if len(weights) == 0:
+        return 0
+    # NaN weights fail the comparison and fall back to None
+    if weights.dtype.kind not in "iu" and not np.all(np.floor(weights) == weights):
+        return None
+    if weights.min() < 0:
+        return None
+    return int(weights.max())
+
+
+# Above this weight the bucket array and the scan over empty buckets cost more than a comparison based heap
+BUCKET_QUEUE_MAX_WEIGHT = 1024
+
+
+def select_heap_factory(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+) -> Callable[[], MinHeap]:
+    """Select the priority queue used by dijkstra_heap from the weight profile of the graph.
+    It scans all the weights of a dictionnary based graph, so when running many searches on the same graph the factory
+    should be selected once and passed to dijkstra_heap as heap_factory.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The weighted graph on which Dijkstra is run
+
+    Returns:
+        Callable[[], MinHeap]: A bucket queue factory when all weights are non-negative integers up to BUCKET_QUEUE_MAX_WEIGHT,
+                               MinHeap otherwise.
+    """
+    max_weight = integer_weight_bound(graph)
+    if max_weight is None or max_weight > BUCKET_QUEUE_MAX_WEIGHT:
+        return MinHeap
+    return lambda: BucketQueue(max_weight)
+
+
+def reconstruct_path(predecessors: dict, target: object) -> list:
+    """Rebuild a shortest path by following the predecessor of each node back from the target.
+
+    Args:
+        predecessors (dict): A dictionary mapping each reached node to the node preceding it on its shortest path. The source maps to None.
+        target (object): The last node of the path.
+
+    Returns:
+        list: The nodes of the path from the source to the target. Empty if the target hasn't been reached.
+    """
+    if target not in predecessors:
+        return []
+    path = [target]
+    while predecessors[path[-1]] is not None:
+        path.append(predecessors[path[-1]])
+    return path[::-1]
+
+
+def dijkstra_path(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+    source: object,
+    target: object,
+    bidirectional: bool = False,
+    heap_factory: Callable[[], MinHeap] = MinHeap,
+) -> tuple[float, list]:
+    """Find the shortest path between two nodes. The search stops as soon as the target is settled instead of exploring the whole graph.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The graph on which to compute the shortest path
+        source (object): The node from which the path starts
+        target (object): The node at which the path ends
+        bidirectional (bool): Whether to search simultaneously from the source and from the target until both searches meet in the middle
+        heap_factory (Callable[[], MinHeap]): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap
+
+    Returns:
+        tuple[float, list]: The length of the shortest path and the list of nodes on it. (math.inf, []) if the target can't be reached.
+    """
+    if type(graph) not in (UndirectedGraph, DirectedGraph, CSRGraph):
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph, DirectedGraph or CSRGraph"
+        )
+    if source not in graph or target not in graph:
+        raise TypeError("Source or target node not in graph !")
+    if bidirectional:
+        return bidirectional_dijkstra_path(graph, source, target, heap_factory)
+
+    distances = {source: 0}
+    predecessors = {source: None}
+    accessible_nodes = heap_factory()
+    accessible_nodes.insert(source, 0)
+    while accessible_nodes.get_number_nodes() != 0:
+        node, distance = accessible_nodes.extract_min()
+        # Once the target is settled its distance is final and the search can stop.
+        if node == target:
+            return distance, reconstruct_path(predecessors, target)
+        for adjacent_node, weight in graph.get_adjacent_nodes_and_weights(node):
+            new_distance = distance + weight
+            if new_distance < distances.get(adjacent_node, math.inf):
+                distances[adjacent_node] = new_distance
+                predecessors[adjacent_node] = node
+                if accessible_nodes.contains(adjacent_node):
+                    accessible_nodes.decrease_key(adjacent_node, new_distance)
+                else:
+                    accessible_nodes.insert(adjacent_node, new_distance)
+    return math.inf, []
+
+
+def bidirectional_dijkstra_path(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+    source: object,
+    target: object,
+    heap_factory: Callable[[], MinHeap] = MinHeap,
+) -> tuple[float, list]:
+    """Find the shortest path between two nodes with two Dijkstra searches: a forward one from the source and a backward one from the target.
+    Both searches settle one node in turn. Each time an edge reaches a node already reached by the other search, a source to target path is found.
+    The search stops once the distances of the last settled nodes of both searches add up to at least the shortest of these paths,
+    as any path that hasn't been found yet would be longer.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The graph on which to compute the shortest path
+        source (object): The node from which the path starts
+        target (object): The node at which the path ends
+        heap_factory (Callable[[], MinHeap]): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap
+
+    Returns:
+        tuple[float, list]: The length of the shortest path and the list of nodes on it. (math.inf, []) if the target can't be reached.
+    """
+    if source == target:
+        return 0, [source]
+    # The backward search follows edges in reverse, which only differs from the forward search for directed graphs.
+    if type(graph) == CSRGraph and graph.directed:
+        get_backward_edges = graph.get_incoming_nodes_and_weights
+    elif type(graph) == DirectedGraph:
+        # Without the incoming index every lookup would scan the whole adjacency list
+        graph.enable_incoming_index()
+        get_backward_edges = graph.get_incoming_nodes_and_weights
+    else:
+        get_backward_edges = graph.get_adjacent_nodes_and_weights
+    # Each search holds its edge getter, tentative distances, predecessors and heap.
+    # The predecessors of the backward search are the next nodes on the way to the target.
+    forward_search = (
+        graph.get_adjacent_nodes_and_weights,
+        {source: 0},
+        {source: None},
+        heap_factory(),
+    )
+    backward_search = (get_backward_edges, {target: 0}, {target: None}, heap_factory())
+    forward_search[3].insert(source, 0)
+    backward_search[3].insert(target, 0)
+    last_settled_distances = [0, 0]
+    shortest_distance = math.inf
+    meeting_node = None
+
+    direction = 0
+    while (
+        forward_search[3].get_number_nodes() != 0
+        and backward_search[3].get_number_nodes() != 0
+    ):
+        get_edges, distances, predecessors, accessible_nodes = (
+            forward_search,
+            backward_search,
+        )[direction]
+        other_distances = (forward_search, backward_search)[1 - direction][1]
+        node, distance = accessible_nodes.extract_min()
+        last_settled_distances[direction] = distance
+        if sum(last_settled_distances) >= shortest_distance:
+            break
+        for adjacent_node, weight in get_edges(node):
+            new_distance = distance + weight
+            if new_distance < distances.get(adjacent_node, math.inf):
+                distances[adjacent_node] = new_distance
+                predecessors[adjacent_node] = node
+                if accessible_nodes.contains(adjacent_node):
+                    accessible_nodes.decrease_key(adjacent_node, new_distance)
+                else:
+                    accessible_nodes.insert(adjacent_node, new_distance)
+            # The other search already reached the adjacent node so both searches meet there
+            if adjacent_node in other_distances:
+                path_distance = (
+                    distances[adjacent_node] + other_distances[adjacent_node]
+                )
+                if path_distance < shortest_distance:
+                    shortest_distance = path_distance
+                    meeting_node = adjacent_node
+        direction = 1 - direction
+
+    if meeting_node is None:
+        return math.inf, []
+    # The forward part of the path is rebuilt from the source and the backward part is followed down to the target.
+    path = reconstruct_path(forward_search[2], meeting_node)
+    backward_predecessors = backward_search[2]
+    while backward_predecessors[path[-1]] is not None:
+        path.append(backward_predecessors[path[-1]])
+    return shortest_distance, path
+
+
+def euclidean_heuristic(coordinates: dict) -> Callable[[object, object], float]:
+    """Build an A* heuristic returning the straight-line distance between two nodes.
+    It is admissible as long as no edge is shorter than the straight line between its two nodes.
+
+    Args:
+        coordinates (dict): A dictionary mapping each node to its (x, y) coordinates.
+
+    Returns:
+        Callable[[object, object], float]: The heuristic taking a node and the target node as arguments.
+    """
+
+    def heuristic(node: object, target: object) -> float:
+        return math.dist(coordinates[node], coordinates[target])
+
+    return heuristic
+
+
+def haversine_heuristic(
+    coordinates: dict, earth_radius: float = 6371.0
+) -> Callable[[object, object], float]:
+    """Build an A* heuristic returning the great-circle distance between two nodes on the surface of the earth.
+
+    Args:
+        coordinates (dict): A dictionary mapping each node to its (latitude, longitude) in degrees.
+        earth_radius (float): The radius of the earth, which sets the unit of the distances. Defaults to kilometers.
+
+    Returns:
+        Callable[[object, object], float]: The heuristic taking a node and the target node as arguments.
+    """
+
+    def heuristic(node: object, target: object) -> float:
+        latitude1, longitude1 = map(math.radians, coordinates[node])
+        latitude2, longitude2 = map(math.radians, coordinates[target])
+        haversine = (
+            math.sin((latitude2 - latitude1) / 2) ** 2
+            + math.cos(latitude1)
+            * math.cos(latitude2)
+            * math.sin((longitude2 - longitude1) / 2) ** 2
+        )
+        return 2 * earth_radius * math.asin(min(1.0, math.sqrt(haversine)))
+
+    return heuristic
+
+
+def a_star(
+    graph: UndirectedGraph | CSRGraph,
+    source: object,
+    target: object,
+    heuristic: Callable[[object, object], float],
+    heap_factory: Callable[[], MinHeap] = MinHeap,
+) -> tuple[float, list, int]:
+    """Find the shortest path between two nodes using the A* algorithm. Nodes are explored by increasing distance from the source
+    plus the heuristic estimate of their distance to the target, which steers the search towards the target.
+    The path is the shortest one if the heuristic never overestimates the remaining distance.
+
+    Args:
+        graph (UndirectedGraph | CSRGraph): The graph on which to compute the shortest path
+        source (object): The node from which the path starts
+        target (object): The node at which the path ends
+        heuristic (Callable[[object, object], float]): Callable returning a lower bound of the distance between a node and the target
+        heap_factory (Callable[[], MinHeap]): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap
+
+    Returns:
+        tuple[float, list, int]: The length of the shortest path, the list of nodes on it and the number of expanded nodes.
+                                 The path is (math.inf, []) if the target can't be reached.
+    """
+    if type(graph) not in (UndirectedGraph, CSRGraph):
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph or CSRGraph"
+        )
+    if source not in graph or target not in graph:
+        raise TypeError("Source or target node not in graph !")
+
+    distances = {source: 0}
+    predecessors = {source: None}
+    accessible_nodes = heap_factory()
+    accessible_nodes.insert(source, heuristic(source, target))
+    number_expanded_nodes = 0
+    while accessible_nodes.get_number_nodes() != 0:
+        node, _ = accessible_nodes.extract_min()
+        number_expanded_nodes += 1
+        if node == target:
+            return (
+                distances[node],
+                reconstruct_path(predecessors, target),
+                number_expanded_nodes,
+            )
+        for adjacent_node, weight in graph.get_adjacent_nodes_and_weights(node):
+            new_distance = distances[node] + weight
+            if new_distance < distances.get(adjacent_node, math.inf):
+                distances[adjacent_node] = new_distance
+                predecessors[adjacent_node] = node
+                estimate = new_distance + heuristic(adjacent_node, target)
+                if accessible_nodes.contains(adjacent_node):
+                    accessible_nodes.decrease_key(adjacent_node, estimate)
+                else:
+                    # An already expanded node is reopened if the heuristic isn't consistent and a shorter path to it is found.
+                    accessible_nodes.insert(adjacent_node, estimate)
+    return math.inf, [], number_expanded_nodes
+
+
+def dijkstra_arrays(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    source_ids: list[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run Dijkstra directly on CSR arrays from one or several sources at once. All sources start at a distance of 0,
+    so each node ends up with its distance to the nearest source.
+
+    Args:
+        indptr (np.ndarray): Offsets of each node's edges in the indices array.
+        indices (np.ndarray): The end node id of each edge.
+        weights (np.ndarray): The weight of each edge.
+        source_ids (list[int]): The ids of the source nodes.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The distance of each node id to its nearest source (np.inf if unreachable)
+                                       and the id of that source (-1 if unreachable).
+    """
+    number_nodes = len(indptr) - 1
+    distances = np.full(number_nodes, np.inf)
+    origins = np.full(number_nodes, -1, dtype=np.int64)
+    # Memory views give fast scalar access to the arrays without copying them
+    indptr_view = memoryview(np.ascontiguousarray(indptr))
+    indices_view = memoryview(np.ascontiguousarray(indices))
+    weights_view = memoryview(np.ascontiguousarray(weights))
+    distances_view = memoryview(distances)
+    origins_view = memoryview(origins)
+
+    accessible_nodes = ArrayMinHeap(number_nodes)
+    for source_id in source_ids:
+        if not accessible_nodes.contains(source_id):
+            distances_view[source_id] = 0.0
+            origins_view[source_id] = source_id
+            accessible_nodes.insert(source_id, 0.0)
+    while accessible_nodes.get_number_nodes() != 0:
+        node_id, distance = accessible_nodes.extract_min()
+        origin = origins_view[node_id]
+        for position in range(indptr_view[node_id], indptr_view[node_id + 1]):
+            adjacent_id = indices_view[position]
+            new_distance = distance + weights_view[position]
+            if new_distance < distances_view[adjacent_id]:
+                distances_view[adjacent_id] = new_distance
+                origins_view[adjacent_id] = origin
+                if accessible_nodes.contains(adjacent_id):
+                    accessible_nodes.decrease_key(adjacent_id, new_distance)
+                else:
+                    accessible_nodes.insert(adjacent_id, new_distance)
+    return distances, origins
+
+
+def dijkstra_multi_source(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph, sources: list
+) -> tuple[dict, dict]:
+    """Find for every node its distance to the nearest of several sources in a single Dijkstra pass.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The graph on which to compute the distances
+        sources (list): The source nodes
+
+    Returns:
+        tuple[dict, dict]: A dictionary with the distance of every node to its nearest source (math.inf if unreachable)
+                           and a dictionary with that nearest source (None if unreachable).
+    """
+    csr_graph = _as_weighted_csr_graph(graph)
+    for source in sources:
+        if source not in csr_graph:
+            raise TypeError(f"Source node {source} not in graph !")
+    distances, origins = dijkstra_arrays(
+        csr_graph.indptr,
+        csr_graph.indices,
+        csr_graph.weights,
+        [csr_graph.get_node_id(source) for source in sources],
+    )
+    nodes = csr_graph.nodes
+    return dict(zip(nodes, distances.tolist())), {
+        node: nodes[origin] if origin != -1 else None
+        for node, origin in zip(nodes, origins.tolist())
+    }
+
+
+def dijkstra_many(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+    sources: list,
+    workers: int = 1,
+) -> np.ndarray:
+    """Compute the distances from many sources to all nodes. With several workers the sources are split across a process pool
+    and every worker reads the same read-only CSR copy of the graph from shared memory.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The graph on which to compute the distances
+        sources (list): The source nodes
+        workers (int): The number of worker processes. 1 runs all searches in the current process.
+
+    Returns:
+        np.ndarray: The dense (number of sources x number of nodes) distance matrix. Columns follow the order of graph.get_nodes()
+                    and unreachable nodes are at a distance of np.inf.
+    """
+    csr_graph = _as_weighted_csr_graph(graph)
+    distance_matrix = np.empty((len(sources), csr_graph.get_number_nodes()))
+    for row, distances in enumerate(dijkstra_rows(csr_graph, sources, workers)):
+        distance_matrix[row] = distances
+    return distance_matrix
+
+
+def dijkstra_rows(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+    sources: list,
+    workers: int = 1,
+) -> Iterator[np.ndarray]:
+    """Compute the distances from many sources to all nodes and yield them one source at a time, in the order of the sources,
+    so that the whole distance matrix never has to be held in memory. Works like dijkstra_many otherwise.
+
+    Args:
+        graph (UndirectedGraph | DirectedGraph | CSRGraph): The graph on which to compute the distances
+        sources (list): The source nodes
+        workers (int): The number of worker processes. 1 runs all searches in the current process.
+
+    Returns:
+        Iterator[np.ndarray]: The distances from each source to all nodes, in the order of graph.get_nodes().
+    """
+    csr_graph = _as_weighted_csr_graph(graph)
+    for source in sources:
+        if source not in csr_graph:
+            raise TypeError(f"Source node {source} not in graph !")
+    source_ids = [csr_graph.get_node_id(source) for source in sources]
+    if workers == 1 or len(source_ids) <= 1:
+        for source_id in source_ids:
+            yield dijkstra_arrays(
+                csr_graph.indptr, csr_graph.indices, csr_graph.weights, [source_id]
+            )[0]
+        return
+
+    descriptor, blocks = share_arrays(
+        {
+            "indptr": csr_graph.indptr,
+            "indices": csr_graph.indices,
+            "weights": csr_graph.weights,
+        }
+    )
+    try:
+        # A few chunks per worker balance the load without paying the inter-process overhead for every source,
+        # and the rows of a chunk are capped so that a chunk result stays within ROWS_CHUNK_BYTES
+        chunk_size = max(
+            1,
+            min(
+                len(source_ids) // (4 * workers),
+                ROWS_CHUNK_BYTES // (8 * csr_graph.get_number_nodes()),
+            ),
+        )
+        chunks = (
+            source_ids[start : start + chunk_size]
+            for start in range(0, len(source_ids), chunk_size)
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_graph_arrays,
+            initargs=(descriptor,),
+        ) as executor:
+            # Only a bounded window of chunks is in flight, a new chunk is submitted each time the oldest one has been consumed,
+            # so that at most 2 * workers chunk results are held in memory whatever the number of sources
+            pending = deque(
+                executor.submit(_dijkstra_rows, chunk)
+                for chunk in islice(chunks, 2 * workers)
+            )
+            while pending:
+                chunk_distances = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(_dijkstra_rows, chunk))
+                yield from chunk_distances
+                del chunk_distances
+    finally:
+        release_blocks(blocks)
+
+
+def _as_weighted_csr_graph(
+    graph: UndirectedGraph | DirectedGraph | CSRGraph,
+) -> CSRGraph:
+    if type(graph) in (UndirectedGraph, DirectedGraph):
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph, DirectedGraph or CSRGraph"
+        )
+    if not graph.weighted:
+        raise TypeError("Please provide a weighted graph")
+    return graph
+
+
+# Graph arrays attached from shared memory by each worker process of dijkstra_rows
+_worker_graph_arrays = {}
+
+
+def _attach_graph_arrays(descriptor: dict) -> None:
+    arrays, blocks = attach_arrays(descriptor)
+    _worker_graph_arrays.update(arrays)
+    _worker_graph_arrays["blocks"] = blocks
+
+
+def _dijkstra_rows(source_ids: list[int]) -> np.ndarray:
+    return np.stack(
+        [
+            dijkstra_arrays(
+                _worker_graph_arrays["indptr"],
+                _worker_graph_arrays["indices"],
+                _worker_graph_arrays["weights"],
+                [source_id],
+            )[0]
+            for source_id in source_ids
+        ]
+    )
@@ -0,0 +1,186 @@
+import math
+from typing import Union
+from graphs.datastructures import DirectedGraph, UndirectedGraph, MinHeap
+from graphs.dijkstra import reconstruct_path
+
+
+class DynamicShortestPaths:
+    """Class maintaining the shortest path distances and tree from a source node while the edge weights of the graph change.
+    Updates are repaired locally in the style of Ramalingam and Reps: a decrease only propagates from the end of the
+    improved edge, and an increase or deletion of a tree edge only recomputes the subtree hanging below that edge,
+    seeding it from the nodes outside the subtree. Nodes that aren't affected by an update are never touched.
+    """
+
+    def __init__(self, graph: DirectedGraph | UndirectedGraph, source: object) -> None:
+        """Compute the shortest path tree from the source. The graph should then only be modified through update_edge and delete_edge.
+
+        Args:
+            graph (DirectedGraph | UndirectedGraph): The weighted graph on which to maintain the shortest paths.
+            source (object): The node from which the shortest paths start.
+        """
+        if type(graph) not in (DirectedGraph, UndirectedGraph):
+            raise TypeError(
+                "Please provide an input graph of type DirectedGraph or UndirectedGraph"
+            )
+        if not graph.weighted:
+            raise TypeError("Please provide a weighted graph")
+        if source not in graph:
+            raise TypeError("Source node not in graph !")
+        if type(graph) == DirectedGraph:
+            # Repairs look up the edges leading to the affected nodes
+            graph.enable_incoming_index()
+        self.graph = graph
+        self.source = source
+        self.distances = {source: 0}
+        self.predecessors = {source: None}
+        # Children of each node in the shortest path tree, used to find the subtree below an edge
+        self.children = {source: set()}
+        heap = MinHeap()
+        heap.insert(source, 0)
+        self.__propagate(heap)
+
+    def get_distance(self, node: object) -> Union[int, float]:
+        """Get the current shortest path distance from the source to a node.
+
+        Args:
+            node (object): The node to which the distance is requested.
+
+        Returns:
+            Union[int, float]: The distance, math.inf if the node can't be reached.
+        """
+        if node not in self.graph:
+            raise TypeError("Node not in graph !")
+        return self.distances.get(node, math.inf)
+
+    def get_path(self, node: object) -> list:
+        """Get the current shortest path from the source to a node.
+
+        Args:
+            node (object): The node at which the path ends.
+
+        Returns:
+            list: The nodes of the path, empty if the node can't be reached.
+        """
+        if self.get_distance(node) == math.inf:
+            return []
+        return reconstruct_path(self.predecessors, node)
+
+    def update_edge(
+        self, start_node: object, end_node: object, weight: Union[int, float]
+    ) -> None:
+        """Set the weight of an edge, adding it if it doesn't exist, and repair the shortest path tree.
+
+        Args:
+            start_node (object): The node at which the edge starts.
+            end_node (object): The node at which the edge ends.
+            weight (Union[int, float]): The new non-negative weight of the edge.
+        """
+        if weight < 0:
+            raise TypeError("Only positive edge weigths are allowed.")
+        old_weight = self.graph.adjacency_list.get(start_node, {}).get(
+            end_node, math.inf
+        )
+        self.graph.add_edge(start_node, end_node, weight)
+        if weight < old_weight:
+            self.__repair_decrease(start_node, end_node, weight)
+            if type(self.graph) == UndirectedGraph:
+                self.__repair_decrease(end_node, start_node, weight)
+        elif weight > old_weight:
+            self.__repair_increase(start_node, end_node)
+
+    def delete_edge(self, start_node: object, end_node: object) -> None:
+        """Remove an edge from the graph and repair the shortest path tree.
+
+        Args:
+            start_node (object): The node at which the edge starts.
+            end_node (object): The node at which the edge ends.
+        """
+        self.graph.remove_edge(start_node, end_node)
+        self.__repair_increase(start_node, end_node)
+
+    def __repair_decrease(
+        self, start_node: object, end_node: object, weight: Union[int, float]
+    ) -> None:
+        new_distance = self.distances.get(start_node, math.inf) + weight
+        if new_distance >= self.distances.get(end_node, math.inf):
+            return
+        self.__set_predecessor(end_node, start_node, new_distance)
+        heap = MinHeap()
+        heap.insert(end_node, new_distance)
+        self.__propagate(heap)
+
+    def __repair_increase(self, start_node: object, end_node: object) -> None:
+        # Only the subtree below a tree edge can get longer paths
+        if (
+            self.predecessors.get(end_node, None) == start_node
+            and end_node in self.distances
+        ):
+            self.__rebuild_subtree(end_node)
+        elif (
+            type(self.graph) == UndirectedGraph
+            and self.predecessors.get(start_node, None) == end_node
+            and start_node in self.distances
+        ):
+            self.__rebuild_subtree(start_node)
+
+    def __rebuild_subtree(self, root: object) -> None:
+        affected_nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            affected_nodes.append(node)
+            stack.extend(self.children[node])
+        affected = set(affected_nodes)
+        # The subtree is detached from the tree before being rebuilt
+        for node in affected_nodes:
+            predecessor = self.predecessors.pop(node)
+            if predecessor not in affected:
+                self.children[predecessor].discard(node)
+            del self.distances[node]
+            self.children[node] = set()
+
+        # Each affected node is seeded with its best path through a node outside the subtree
+        heap = MinHeap()
+        for node in affected_nodes:
+            for incoming_node, weight in self.__get_incoming_nodes_and_weights(node):
+                if incoming_node in affected or incoming_node not in self.distances:
+                    continue
+                new_distance = self.distances[incoming_node] + weight
+                if new_distance < self.distances.get(node, math.inf):
+                    self.__set_predecessor(node, incoming_node, new_distance)
+                    if heap.contains(node):
+                        heap.decrease_key(node, new_distance)
+                    else:
+                        heap.insert(node, new_distance)
+        self.__propagate(heap)
+
+    def __get_incoming_nodes_and_weights(self, node: object) -> list[tuple]:
+        if type(self.graph) == DirectedGraph:
+            return self.graph.get_incoming_nodes_and_weights(node)
+        return self.graph.get_adjacent_nodes_and_weights(node)
+
+    def __set_predecessor(
+        self, node: object, predecessor: object, distance: Union[int, float]
+    ) -> None:
+        old_predecessor = self.predecessors.get(node, None)
+        if old_predecessor is not None:
+            self.children[old_predecessor].discard(node)
+        self.predecessors[node] = predecessor
+        self.children.setdefault(predecessor, set()).add(node)
+        self.children.setdefault(node, set())
+        self.distances[node] = distance
+
+    def __propagate(self, heap: MinHeap) -> None:
+        """Run Dijkstra from the nodes stored in the heap, whose distances are already set, improving the distances they lead to."""
+        while heap.get_number_nodes() != 0:
+            node, distance = heap.extract_min()
+            for adjacent_node, weight in self.graph.get_adjacent_nodes_and_weights(
+                node
+            ):
+                new_distance = distance + weight
+                if new_distance < self.distances.get(adjacent_node, math.inf):
+                    self.__set_predecessor(adjacent_node, node, new_distance)
+                    if heap.contains(adjacent_node):
+                        heap.decrease_key(adjacent_node, new_distance)
+                    else:
+                        heap.insert(adjacent_node, new_distance)
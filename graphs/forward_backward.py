@@ -0,0 +1,273 @@
+from concurrent.futures import ProcessPoolExecutor
+from graphs.datastructures import DirectedGraph, CSRGraph
+from graphs.shared_memory import share_arrays, attach_arrays, release_blocks
+from graphs.tarjan import tarjan_strongly_connected_components
+import numpy as np
+
+# Subproblems with fewer nodes are decomposed by the process that produced them as the inter-process overhead dominates
+PARALLEL_SUBPROBLEM_SIZE = 1024
+# Subproblems with fewer nodes are handed to Tarjan's algorithm, as each BFS level costs a few NumPy calls whatever its size
+TARJAN_SUBPROBLEM_SIZE = 256
+# A BFS whose frontier stays below CHAIN_FRONTIER_SIZE nodes for CHAIN_LEVELS levels in a row is exploring long chains,
+# on which a level-synchronous BFS degrades to a few NumPy calls per node, so its subproblem is handed to Tarjan's algorithm
+CHAIN_FRONTIER_SIZE = 16
+CHAIN_LEVELS = 64
+
+
+def forward_backward_strongly_connected_components(
+    graph: DirectedGraph | CSRGraph, workers: int = 1
+) -> tuple[np.ndarray, dict]:
+    """Find the strongly connected components of a graph with the forward-backward (FW-BW) algorithm.
+    Nodes without incoming or outgoing edges inside their subproblem are first trimmed away as singleton components.
+    Then the nodes reachable both forward and backward from a pivot form its component, and the nodes reached only forward,
+    only backward or not at all form three independent subproblems, as no component spans two of them.
+    Large subproblems are dispatched to a process pool whose workers read the CSR arrays of the graph from shared memory.
+    Small subproblems, and those made of long chains where the BFS would advance a few nodes per level, are solved with Tarjan's algorithm,
+    so graphs with a large diameter don't cost one round of NumPy calls per level.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The graph for which the components should be found
+        workers (int): The number of worker processes. 1 decomposes the whole graph in the current process.
+
+    Returns:
+        tuple[np.ndarray, dict]: The component id of each node id as an int32 array and the mapping from each node to its node id.
+                                 Components are numbered from 0 in no particular order.
+    """
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph or not graph.directed:
+        raise TypeError(
+            "Please provide an input graph of type DirectedGraph or a directed CSRGraph"
+        )
+    number_nodes = graph.get_number_nodes()
+    transposed_graph = graph.transpose()
+    arrays = {
+        "indptr": graph.indptr,
+        "indices": graph.indices,
+        "reverse_indptr": transposed_graph.indptr,
+        "reverse_indices": transposed_graph.indices,
+    }
+    components = np.full(number_nodes, -1, dtype=np.int32)
+    number_components = 0
+    all_nodes = np.arange(number_nodes, dtype=np.int64)
+
+    if workers == 1:
+        component_groups, singletons, _ = _decompose(
+            _with_scratch(arrays, number_nodes), all_nodes, None
+        )
+        results = [(component_groups, singletons)]
+    else:
+        descriptor, blocks = share_arrays(arrays)
+        results = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_graph_arrays,
+                initargs=(descriptor, number_nodes),
+            ) as executor:
+                subproblems = [all_nodes]
+                # Each round decomposes the pending subproblems concurrently, the large subproblems they split into form the next round
+                while subproblems:
+                    next_subproblems = []
+                    for component_groups, singletons, large_subproblems in executor.map(
+                        _decompose_worker_subproblem, subproblems
+                    ):
+                        results.append((component_groups, singletons))
+                        next_subproblems += large_subproblems
+                    subproblems = next_subproblems
+        finally:
+            release_blocks(blocks)
+
+    for component_groups, singletons in results:
+        for component in component_groups:
+            components[component] = number_components
+            number_components += 1
+        for trimmed_nodes in singletons:
+            components[trimmed_nodes] = np.arange(
+                number_components, number_components + len(trimmed_nodes)
+            )
+            number_components += len(trimmed_nodes)
+    return components, graph.node_ids
+
+
+def _with_scratch(arrays: dict, number_nodes: int) -> dict:
+    # Per node marks reused by every subproblem. Only the entries of the nodes of a subproblem are set, and they are reset
+    # before the next one, so that a subproblem costs time proportional to its size rather than to the size of the graph
+    state = dict(arrays)
+    state["in_subproblem"] = np.zeros(number_nodes, dtype=bool)
+    state["forward"] = np.zeros(number_nodes, dtype=bool)
+    state["backward"] = np.zeros(number_nodes, dtype=bool)
+    state["in_degree"] = np.zeros(number_nodes, dtype=np.int64)
+    state["out_degree"] = np.zeros(number_nodes, dtype=np.int64)
+    # Id of each node in the subgraph induced by the subproblem handed to Tarjan's algorithm
+    state["local_ids"] = np.zeros(number_nodes, dtype=np.int64)
+    return state
+
+
+def _edges_of(
+    indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Gather the end nodes of all edges leaving a set of nodes, along with the position in nodes of their start node."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    # Positions of all edges of the nodes, built without a Python loop over the nodes
+    offsets = np.cumsum(counts) - counts
+    positions = np.repeat(starts - offsets, counts) + np.arange(counts.sum())
+    return indices[positions].astype(np.int64), np.repeat(np.arange(len(nodes)), counts)
+
+
+def _trim(state: dict, subproblem: np.ndarray) -> tuple[np.ndarray, list]:
+    """Repeatedly remove the nodes without incoming or outgoing edges inside the subproblem. Each of them is a singleton component."""
+    in_subproblem = state["in_subproblem"]
+    in_degree = state["in_degree"]
+    out_degree = state["out_degree"]
+    for degree, indptr, indices in (
+        (out_degree, state["indptr"], state["indices"]),
+        (in_degree, state["reverse_indptr"], state["reverse_indices"]),
+    ):
+        end_nodes, start_positions = _edges_of(indptr, indices, subproblem)
+        degree[subproblem] = np.bincount(
+            start_positions[in_subproblem[end_nodes]], minlength=len(subproblem)
+        )
+    trimmed = []
+    candidates = subproblem[
+        (in_degree[subproblem] == 0) | (out_degree[subproblem] == 0)
+    ]
+    while len(candidates):
+        in_subproblem[candidates] = False
+        trimmed.append(candidates)
+        # Only the remaining neighbours of the trimmed nodes lose an edge and may become trimmable
+        successors, _ = _edges_of(state["indptr"], state["indices"], candidates)
+        successors = successors[in_subproblem[successors]]
+        predecessors, _ = _edges_of(
+            state["reverse_indptr"], state["reverse_indices"], candidates
+        )
+        predecessors = predecessors[in_subproblem[predecessors]]
+        np.subtract.at(in_degree, successors, 1)
+        np.subtract.at(out_degree, predecessors, 1)
+        touched = np.unique(np.concatenate((successors, predecessors)))
+        candidates = touched[(in_degree[touched] == 0) | (out_degree[touched] == 0)]
+    return subproblem[in_subproblem[subproblem]], trimmed
+
+
+def _reach(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    pivot: int,
+    in_subproblem: np.ndarray,
+    reached: np.ndarray,
+) -> bool:
+    """Mark in reached the nodes of the subproblem reachable from the pivot, with a level-synchronous BFS.
+    Returns False, leaving the marks partial, if the frontier stayed below CHAIN_FRONTIER_SIZE nodes for CHAIN_LEVELS levels in a row.
+    """
+    reached[pivot] = True
+    frontier = np.array([pivot], dtype=np.int64)
+    narrow_levels = 0
+    while len(frontier):
+        narrow_levels = narrow_levels + 1 if len(frontier) < CHAIN_FRONTIER_SIZE else 0
+        if narrow_levels > CHAIN_LEVELS:
+            return False
+        end_nodes, _ = _edges_of(indptr, indices, frontier)
+        end_nodes = end_nodes[in_subproblem[end_nodes] & ~reached[end_nodes]]
+        frontier = np.unique(end_nodes)
+        reached[frontier] = True
+    return True
+
+
+def _tarjan_subproblem(state: dict, subproblem: np.ndarray) -> tuple[list, np.ndarray]:
+    """Find the components of a subproblem with Tarjan's algorithm on the subgraph it induces.
+    Returns the components of several nodes and the nodes forming a component on their own.
+    """
+    in_subproblem = state["in_subproblem"]
+    local_ids = state["local_ids"]
+    local_ids[subproblem] = np.arange(len(subproblem))
+    end_nodes, start_positions = _edges_of(
+        state["indptr"], state["indices"], subproblem
+    )
+    inside = in_subproblem[end_nodes]
+    indptr = np.zeros(len(subproblem) + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(start_positions[inside], minlength=len(subproblem)),
+        out=indptr[1:],
+    )
+    subgraph = CSRGraph(
+        range(len(subproblem)), indptr, local_ids[end_nodes[inside]], directed=True
+    )
+    components, _ = tarjan_strongly_connected_components(subgraph)
+    order = np.argsort(components, kind="stable")
+    sizes = np.bincount(components)
+    groups = np.split(subproblem[order], np.cumsum(sizes)[:-1])
+    return [group for group in groups if len(group) > 1], subproblem[
+        (sizes == 1)[components]
+    ]
+
+
+def _decompose(
+    state: dict, subproblem: np.ndarray, parallel_size: int | None
+) -> tuple[list, list, list]:
+    """Decompose a subproblem. The subproblems it splits into with at least parallel_size nodes are returned instead of being decomposed."""
+    component_groups = []
+    singletons = []
+    large_subproblems = []
+    in_subproblem = state["in_subproblem"]
+    forward = state["forward"]
+    backward = state["backward"]
+    subproblems = [subproblem]
+    while subproblems:
+        subproblem = subproblems.pop()
+        in_subproblem[subproblem] = True
+        subproblem, trimmed = _trim(state, subproblem)
+        singletons += trimmed
+        if len(subproblem) == 0:
+            continue
+        pivot = subproblem[0]
+        if (
+            len(subproblem) < TARJAN_SUBPROBLEM_SIZE
+            or not _reach(
+                state["indptr"], state["indices"], pivot, in_subproblem, forward
+            )
+            or not _reach(
+                state["reverse_indptr"],
+                state["reverse_indices"],
+                pivot,
+                in_subproblem,
+                backward,
+            )
+        ):
+            groups, single_nodes = _tarjan_subproblem(state, subproblem)
+            component_groups += groups
+            singletons.append(single_nodes)
+            in_subproblem[subproblem] = False
+            forward[subproblem] = False
+            backward[subproblem] = False
+            continue
+        in_forward = forward[subproblem]
+        in_backward = backward[subproblem]
+        component_groups.append(subproblem[in_forward & in_backward])
+        in_subproblem[subproblem] = False
+        forward[subproblem] = False
+        backward[subproblem] = False
+        for part in (
+            subproblem[in_forward & ~in_backward],
+            subproblem[~in_forward & in_backward],
+            subproblem[~in_forward & ~in_backward],
+        ):
+            if parallel_size is not None and len(part) >= parallel_size:
+                large_subproblems.append(part)
+            elif len(part):
+                subproblems.append(part)
+    return component_groups, singletons, large_subproblems
+
+
+# Graph arrays attached from shared memory, and the scratch marks, of each worker process of forward_backward_strongly_connected_components
+_worker_state = {}
+
+
+def _attach_graph_arrays(descriptor: dict, number_nodes: int) -> None:
+    arrays, blocks = attach_arrays(descriptor)
+    _worker_state.update(_with_scratch(arrays, number_nodes))
+    _worker_state["blocks"] = blocks
+
+
+def _decompose_worker_subproblem(subproblem: np.ndarray) -> tuple[list, list, list]:
+    return _decompose(_worker_state, subproblem, PARALLEL_SUBPROBLEM_SIZE)
@@ -1,17 +1,18 @@
-from graphs.datastructures import DirectedGraph
+from graphs.datastructures import DirectedGraph, CSRGraph
 from graphs.topology import topological_sort
 
 
-def find_strongly_connected_components(graph: DirectedGraph) -> dict:
-    """Find the strongly connected components of a graph using the kosaraju algorithm with recursive DFS.
+def find_strongly_connected_components(graph: DirectedGraph | CSRGraph) -> dict:
+    """Find the strongly connected components of a graph using the kosaraju algorithm with iterative DFS.
 
     Args:
-        graph (DirectedGraph): The graph for which the components should be found
+        graph (DirectedGraph | CSRGraph): The graph for which the components should be found
 
     Returns:
         dict: A dictionnary containing the nodes as keys and the strongly connected component number as value. If two nodes have the same value they are in the same SCC
     """
-    reversed_graph = reverse_graph(graph)
+    # The transpose is only read, so it can be a view on the incoming-edge index of the graph when there is one
+    reversed_graph = graph.transpose()
     reverse_ordered_nodes = topological_sort(reversed_graph)
     explored_nodes = set()
     number_scc = 0
@@ -29,14 +30,14 @@ def find_strongly_connected_components(graph: DirectedGraph) -> dict:
 
 
 def strongly_connected_component_dfs(
-    graph: DirectedGraph,
+    graph: DirectedGraph | CSRGraph,
     start: object,
     number_scc: int,
     strongly_connected_components: dict,
     explored_nodes: set,
 ) -> tuple[dict, set]:
     """Helper function for the master find_strongly_connected_components function. This function implements the second pass of the kosaraju algorithm for finding nodes in the same current SCC.
-    Uses recursive DFS.
+    Uses DFS with an explicit stack, so it isn't limited by the recursion depth.
 
     Args:
         graph (DirectedGraph): The graph for which the SCCs should be found.
@@ -51,36 +52,61 @@ def strongly_connected_component_dfs(
 
     strongly_connected_components[start] = number_scc
     explored_nodes.add(start)
-    for node in graph.get_adjacent_nodes(start):
-        if node not in explored_nodes:
-            (
-                strongly_connected_components,
-                explored_nodes,
-            ) = strongly_connected_component_dfs(
-                graph, node, number_scc, strongly_connected_components, explored_nodes
-            )
+    nodes_to_explore = [start]
+    while nodes_to_explore:
+        for node in graph.get_adjacent_nodes(nodes_to_explore.pop()):
+            if node not in explored_nodes:
+                strongly_connected_components[node] = number_scc
+                explored_nodes.add(node)
+                nodes_to_explore.append(node)
 
     return strongly_connected_components, explored_nodes
 
 
-def reverse_graph(graph: DirectedGraph) -> DirectedGraph:
+def condensation_graph(graph: DirectedGraph | CSRGraph) -> tuple[DirectedGraph, dict]:
+    """Build the condensation of a graph: the directed acyclic graph with one node per strongly connected component and an edge
+    between two components whenever an edge of the graph goes from a node of the first one to a node of the second one.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The graph to condense.
+
+    Returns:
+        tuple[DirectedGraph, dict]: The condensation, whose nodes are the SCC numbers, and the dictionnary of the SCC number of each node
+                                    as returned by find_strongly_connected_components.
+    """
+    strongly_connected_components = find_strongly_connected_components(graph)
+    condensation = DirectedGraph()
+    for number_scc in sorted(set(strongly_connected_components.values())):
+        condensation.add_node(number_scc)
+    added_edges = set()
+    for node in graph.get_nodes():
+        for adjacent_node in graph.get_adjacent_nodes(node):
+            edge = (
+                strongly_connected_components[node],
+                strongly_connected_components[adjacent_node],
+            )
+            # Edges inside a component and parallel edges between two components are dropped
+            if edge[0] != edge[1] and edge not in added_edges:
+                added_edges.add(edge)
+                condensation.add_edge(*edge)
+    return condensation, strongly_connected_components
+
+
+def reverse_graph(graph: DirectedGraph | CSRGraph) -> DirectedGraph | CSRGraph:
     """Reverse a directed input graph. The edges incoming edges are transformed into outgoing edges and vice-versa.
+    The reversed graph is built in bulk by the transpose method of the graph, and is always independent of the input graph:
+    a DirectedGraph is copied even when it carries an incoming-edge index, and a CSRGraph is frozen so its arrays can be shared.
 
     Args:
-        graph (DirectedGraph): The graph that should be reversed.
+        graph (DirectedGraph | CSRGraph): The graph that should be reversed.
 
     Returns:
-        Graph: A reversed version of the input graph.
+        DirectedGraph | CSRGraph: A reversed version of the input graph, of the same type.
     """
-    reverse_graph = DirectedGraph()
-    added_nodes = set()
-    for starting_node in graph.get_nodes():
-        if starting_node not in added_nodes:
-            reverse_graph.add_node(starting_node)
-            added_nodes.add(starting_node)
-        for adjacent_node in graph.get_adjacent_nodes(starting_node):
-            if adjacent_node not in added_nodes:
-                reverse_graph.add_node(adjacent_node)
-                added_nodes.add(adjacent_node)
-            reverse_graph.add_edge(adjacent_node, starting_node)
-    return reverse_graph
+    if type(graph) == DirectedGraph:
+        return graph.transpose(copy=True)
+    if type(graph) != CSRGraph:
+        raise TypeError(
+            "Please provide an input graph of type DirectedGraph or CSRGraph"
+        )
+    return graph.transpose()
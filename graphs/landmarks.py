@@ -0,0 +1,139 @@
+from graphs.datastructures import UndirectedGraph, CSRGraph
+from graphs.dijkstra import dijkstra_heap, a_star
+import numpy as np
+
+
+class LandmarkIndex:
+    """Class holding the preprocessed tables of the ALT (A*, landmarks, triangle inequality) algorithm.
+    The distances from a few landmark nodes to every node are stored in a (number of nodes x number of landmarks) array.
+    By the triangle inequality |d(landmark, target) - d(landmark, node)| is a lower bound of d(node, target) which A* uses as heuristic.
+    """
+
+    def __init__(
+        self, nodes: list, landmarks: np.ndarray, distances: np.ndarray
+    ) -> None:
+        """Build an index directly from its tables. Use LandmarkIndex.from_graph to preprocess a graph.
+
+        Args:
+            nodes (list): The nodes of the graph. The position of a node in this list is its row in the distances array.
+            landmarks (np.ndarray): The node ids of the landmarks.
+            distances (np.ndarray): The (number of nodes x number of landmarks) array of distances. Unreachable nodes are at an infinite distance.
+        """
+        if distances.shape != (len(nodes), len(landmarks)):
+            raise Exception(
+                "The distances array should have one row per node and one column per landmark."
+            )
+        self.nodes = list(nodes)
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.landmarks = landmarks
+        self.distances = distances
+
+    @classmethod
+    def from_graph(
+        cls, graph: UndirectedGraph | CSRGraph, number_landmarks: int
+    ) -> "LandmarkIndex":
+        """Select landmarks and compute their distance tables with one single-source pass per landmark.
+        Landmarks are selected greedily as the node farthest from the landmarks already selected, which spreads them
+        on the border of the graph where they give the tightest bounds. Nodes that can't be reached are the farthest,
+        so every connected component gets a landmark before a second one is placed in the same component.
+
+        Args:
+            graph (UndirectedGraph | CSRGraph): The undirected graph to preprocess.
+            number_landmarks (int): The number of landmarks to select.
+
+        Returns:
+            LandmarkIndex: The index holding the distance tables.
+        """
+        if type(graph) == CSRGraph and graph.directed:
+            raise TypeError("Please provide an undirected CSRGraph")
+        if type(graph) not in (UndirectedGraph, CSRGraph):
+            raise TypeError(
+                "Please provide an input graph of type UndirectedGraph or CSRGraph"
+            )
+        nodes = graph.get_nodes()
+        number_landmarks = min(number_landmarks, len(nodes))
+        distances = np.empty((len(nodes), number_landmarks), dtype=np.float64)
+        landmarks = np.empty(number_landmarks, dtype=np.int64)
+        # The first landmark is the node farthest from an arbitrary node
+        closest_landmark_distances = cls.__distances_from(graph, nodes, nodes[0])
+        for landmark_number in range(number_landmarks):
+            landmark_id = int(np.argmax(closest_landmark_distances))
+            landmarks[landmark_number] = landmark_id
+            distances[:, landmark_number] = cls.__distances_from(
+                graph, nodes, nodes[landmark_id]
+            )
+            if landmark_number == 0:
+                closest_landmark_distances = distances[:, 0].copy()
+            else:
+                np.minimum(
+                    closest_landmark_distances,
+                    distances[:, landmark_number],
+                    out=closest_landmark_distances,
+                )
+            # A node that already is a landmark is never selected again
+            closest_landmark_distances[landmarks[: landmark_number + 1]] = -1
+        return cls(nodes, landmarks, distances)
+
+    @staticmethod
+    def __distances_from(
+        graph: UndirectedGraph | CSRGraph, nodes: list, source: object
+    ) -> np.ndarray:
+        distances = dijkstra_heap(graph, source)
+        return np.array([distances[node] for node in nodes], dtype=np.float64)
+
+    def lower_bound(self, node: object, target: object) -> float:
+        """Compute the landmark lower bound of the distance between a node and the target. Can be used as an A* heuristic.
+
+        Args:
+            node (object): The node from which the distance is estimated.
+            target (object): The node to which the distance is estimated.
+
+        Returns:
+            float: The lower bound. Infinite if exactly one of the two nodes is reachable from a landmark.
+        """
+        # A landmark reaching neither node gives an undefined (nan) difference which is ignored by fmax
+        with np.errstate(invalid="ignore"):
+            differences = np.abs(
+                self.distances[self.node_ids[target]]
+                - self.distances[self.node_ids[node]]
+            )
+        return float(np.fmax.reduce(differences, initial=0.0))
+
+    def query(
+        self, graph: UndirectedGraph | CSRGraph, source: object, target: object
+    ) -> tuple[float, list, int]:
+        """Find the shortest path between two nodes with A* guided by the landmark lower bounds.
+
+        Args:
+            graph (UndirectedGraph | CSRGraph): The graph that was preprocessed.
+            source (object): The node from which the path starts
+            target (object): The node at which the path ends
+
+        Returns:
+            tuple[float, list, int]: The length of the shortest path, the list of nodes on it and the number of expanded nodes.
+        """
+        return a_star(graph, source, target, self.lower_bound)
+
+    def save(self, path: str) -> None:
+        """Save the index to disk in the NumPy .npz format.
+
+        Args:
+            path (str): The file to which the index is saved.
+        """
+        nodes = np.empty(len(self.nodes), dtype=object)
+        for node_id, node in enumerate(self.nodes):
+            nodes[node_id] = node
+        np.savez(path, nodes=nodes, landmarks=self.landmarks, distances=self.distances)
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkIndex":
+        """Load an index previously saved with save. Only load files from a trusted source as the nodes are unpickled.
+
+        Args:
+            path (str): The file from which the index is loaded.
+
+        Returns:
+            LandmarkIndex: The loaded index.
+        """
+        with np.load(path, allow_pickle=True) as data:
+            return cls(data["nodes"].tolist(), data["landmarks"], data["distances"])
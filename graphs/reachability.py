@@ -0,0 +1,243 @@
+from graphs.datastructures import DirectedGraph, CSRGraph
+from graphs.kosaraju import condensation_graph
+from graphs.topology import topological_sort
+import numpy as np
+
+# Above this number of (chain, position) entries from_graph raises instead of building the index, each entry taking 8 bytes
+MAX_INDEX_ENTRIES = 10**8
+
+
+class ReachabilityIndex:
+    """Class holding the transitive closure of the condensation of a graph, compressed with a chain decomposition.
+    The components of the condensation are split into chains, paths of the DAG in which every component reaches all those after it.
+    A component then only stores, for each chain it can reach, the first position it reaches in that chain, as it reaches all the following ones.
+    A reachability query is a binary search among the chains reached by the start component, in O(log number of chains) time.
+    """
+
+    def __init__(
+        self,
+        nodes: list,
+        components: np.ndarray,
+        chains: np.ndarray,
+        positions: np.ndarray,
+        indptr: np.ndarray,
+        reached_chains: np.ndarray,
+        reached_positions: np.ndarray,
+    ) -> None:
+        """Build an index directly from its tables. Use ReachabilityIndex.from_graph to index a graph.
+
+        Args:
+            nodes (list): The nodes of the graph. The position of a node in this list is its entry in the components array.
+            components (np.ndarray): The component id, from 0, of each node.
+            chains (np.ndarray): The chain of each component.
+            positions (np.ndarray): The position of each component in its chain.
+            indptr (np.ndarray): Offsets of the entries of each component in the reached_chains and reached_positions arrays.
+            reached_chains (np.ndarray): The chains reached by each component, sorted for each component.
+            reached_positions (np.ndarray): The first position reached by each component in each of its reached chains.
+        """
+        if len(components) != len(nodes):
+            raise Exception("The components array should have one entry per node.")
+        self.nodes = list(nodes)
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.components = components
+        self.chains = chains
+        self.positions = positions
+        self.indptr = indptr
+        self.reached_chains = reached_chains
+        self.reached_positions = reached_positions
+
+    @classmethod
+    def from_graph(
+        cls, graph: DirectedGraph | CSRGraph, max_entries: int = MAX_INDEX_ENTRIES
+    ) -> "ReachabilityIndex":
+        """Index a graph. The chains are built greedily in topological order: a component extends the chain of one of its predecessors
+        if that predecessor is still the last component of its chain, and starts a new chain otherwise. The reached chains of a component
+        are then its own entry merged with the entries of its successors, visited in reverse topological order so they are already complete.
+
+        Args:
+            graph (DirectedGraph | CSRGraph): The graph to index.
+            max_entries (int): The maximum number of (chain, position) entries of the index. Wide DAGs can reach up to
+                               (number of components) x (number of chains) entries, above this limit an exception is raised.
+
+        Returns:
+            ReachabilityIndex: The index of the graph.
+        """
+        if type(graph) not in (DirectedGraph, CSRGraph):
+            raise TypeError(
+                "Please provide an input graph of type DirectedGraph or CSRGraph"
+            )
+        condensation, strongly_connected_components = condensation_graph(graph)
+        condensation.enable_incoming_index()
+        component_ids = {
+            number_scc: component_id
+            for component_id, number_scc in enumerate(condensation.get_nodes())
+        }
+        number_components = len(component_ids)
+        topological_order = topological_sort(condensation)
+
+        chains = np.empty(number_components, dtype=np.int32)
+        positions = np.empty(number_components, dtype=np.int32)
+        # Chain of each component that is currently the last one of its chain
+        chain_tails = {}
+        number_chains = 0
+        for number_scc in topological_order:
+            component_id = component_ids[number_scc]
+            for predecessor in condensation.get_incoming_nodes(number_scc):
+                predecessor_id = component_ids[predecessor]
+                if predecessor_id in chain_tails:
+                    chains[component_id] = chain_tails.pop(predecessor_id)
+                    positions[component_id] = positions[predecessor_id] + 1
+                    break
+            else:
+                chains[component_id] = number_chains
+                positions[component_id] = 0
+                number_chains += 1
+            chain_tails[component_id] = chains[component_id]
+
+        reached = [None] * number_components
+        number_entries = 0
+        for number_scc in reversed(topological_order):
+            component_id = component_ids[number_scc]
+            successor_ids = [
+                component_ids[successor]
+                for successor in condensation.get_adjacent_nodes(number_scc)
+            ]
+            reached_chains = np.concatenate(
+                [chains[component_id : component_id + 1]]
+                + [reached[successor_id][0] for successor_id in successor_ids]
+            )
+            reached_positions = np.concatenate(
+                [positions[component_id : component_id + 1]]
+                + [reached[successor_id][1] for successor_id in successor_ids]
+            )
+            if successor_ids:
+                # Only the first position reached in each chain is kept
+                order = np.lexsort((reached_positions, reached_chains))
+                reached_chains = reached_chains[order]
+                reached_positions = reached_positions[order]
+                first = np.ones(len(reached_chains), dtype=bool)
+                first[1:] = reached_chains[1:] != reached_chains[:-1]
+                reached_chains = reached_chains[first]
+                reached_positions = reached_positions[first]
+            number_entries += len(reached_chains)
+            if number_entries > max_entries:
+                raise Exception(
+                    f"The reachability index needs more than {max_entries} entries for {number_components} components and {number_chains} chains !"
+                )
+            reached[component_id] = (reached_chains, reached_positions)
+
+        indptr = np.zeros(number_components + 1, dtype=np.int64)
+        np.cumsum(
+            [len(reached_chains) for reached_chains, _ in reached], out=indptr[1:]
+        )
+        nodes = graph.get_nodes()
+        components = np.array(
+            [component_ids[strongly_connected_components[node]] for node in nodes],
+            dtype=np.int64,
+        )
+        return cls(
+            nodes,
+            components,
+            chains,
+            positions,
+            indptr,
+            np.concatenate(
+                [np.empty(0, dtype=np.int32)]
+                + [reached_chains for reached_chains, _ in reached]
+            ),
+            np.concatenate(
+                [np.empty(0, dtype=np.int32)]
+                + [reached_positions for _, reached_positions in reached]
+            ),
+        )
+
+    def get_nbytes(self) -> int:
+        """Returns the number of bytes used by the arrays of the index."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.components,
+                self.chains,
+                self.positions,
+                self.indptr,
+                self.reached_chains,
+                self.reached_positions,
+            )
+        )
+
+    def can_reach(self, start_node: object, end_node: object) -> bool:
+        """Check if there is a path from a node to another one. Every node reaches itself.
+
+        Args:
+            start_node (object): The node from which the path starts.
+            end_node (object): The node at which the path ends.
+
+        Returns:
+            bool: Whether end_node can be reached from start_node.
+        """
+        start_component = self.components[self.node_ids[start_node]]
+        end_component = self.components[self.node_ids[end_node]]
+        end_chain = self.chains[end_component]
+        start, end = self.indptr[start_component], self.indptr[start_component + 1]
+        entry = start + np.searchsorted(self.reached_chains[start:end], end_chain)
+        return bool(
+            entry < end
+            and self.reached_chains[entry] == end_chain
+            and self.reached_positions[entry] <= self.positions[end_component]
+        )
+
+    def same_component(self, node1: object, node2: object) -> bool:
+        """Check if two nodes are in the same strongly connected component.
+
+        Args:
+            node1 (object): The first node.
+            node2 (object): The second node.
+
+        Returns:
+            bool: Whether the nodes reach each other.
+        """
+        return (
+            self.components[self.node_ids[node1]]
+            == self.components[self.node_ids[node2]]
+        )
+
+    def save(self, path: str) -> None:
+        """Save the index to disk in the NumPy .npz format, so that it can be reused between runs.
+
+        Args:
+            path (str): The file to which the index is saved.
+        """
+        nodes = np.empty(len(self.nodes), dtype=object)
+        for node_id, node in enumerate(self.nodes):
+            nodes[node_id] = node
+        np.savez(
+            path,
+            nodes=nodes,
+            components=self.components,
+            chains=self.chains,
+            positions=self.positions,
+            indptr=self.indptr,
+            reached_chains=self.reached_chains,
+            reached_positions=self.reached_positions,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ReachabilityIndex":
+        """Load an index previously saved with save. Only load files from a trusted source as the nodes are unpickled.
+
+        Args:
+            path (str): The file from which the index is loaded.
+
+        Returns:
+            ReachabilityIndex: The loaded index.
+        """
+        with np.load(path, allow_pickle=True) as data:
+            return cls(
+                data["nodes"].tolist(),
+                data["components"],
+                data["chains"],
+                data["positions"],
+                data["indptr"],
+                data["reached_chains"],
+                data["reached_positions"],
+            )
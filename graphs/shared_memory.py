@@ -0,0 +1,59 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+
+def share_arrays(
+    arrays: dict[str, np.ndarray],
+) -> tuple[dict, list[shared_memory.SharedMemory]]:
+    """Copy NumPy arrays into shared memory blocks so that worker processes can read them without receiving a copy.
+
+    Args:
+        arrays (dict[str, np.ndarray]): The arrays to share, by name.
+
+    Returns:
+        tuple[dict, list[shared_memory.SharedMemory]]: A picklable descriptor to pass to attach_arrays in the workers and the
+                                                       shared memory blocks. The caller has to close and unlink the blocks once the workers are done.
+    """
+    descriptor = {}
+    blocks = []
+    for name, array in arrays.items():
+        # A block can't be empty so at least one byte is allocated
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        shared_array[...] = array
+        descriptor[name] = (block.name, array.shape, array.dtype.str)
+        blocks.append(block)
+    return descriptor, blocks
+
+
+def attach_arrays(
+    descriptor: dict,
+) -> tuple[dict[str, np.ndarray], list[shared_memory.SharedMemory]]:
+    """Map the arrays described by a descriptor from share_arrays into the current process.
+    It is meant for the worker processes of a pool started by the process that shared the arrays, which owns the blocks.
+
+    Args:
+        descriptor (dict): The descriptor returned by share_arrays.
+
+    Returns:
+        tuple[dict[str, np.ndarray], list[shared_memory.SharedMemory]]: The arrays by name and the attached blocks.
+                                                                        The blocks have to be kept referenced as long as the arrays are used.
+    """
+    arrays = {}
+    blocks = []
+    for name, (block_name, shape, dtype) in descriptor.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        blocks.append(block)
+    return arrays, blocks
+
+
+def release_blocks(blocks: list[shared_memory.SharedMemory]) -> None:
+    """Close and unlink shared memory blocks created by share_arrays.
+
+    Args:
+        blocks (list[shared_memory.SharedMemory]): The blocks to release.
+    """
+    for block in blocks:
+        block.close()
+        block.unlink()
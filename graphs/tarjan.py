@@ -0,0 +1,81 @@
+from array import array
+from graphs.datastructures import DirectedGraph, CSRGraph
+import numpy as np
+
+
+def tarjan_strongly_connected_components(
+    graph: DirectedGraph | CSRGraph,
+) -> tuple[np.ndarray, dict]:
+    """Find the strongly connected components of a graph in a single DFS pass with Tarjan's algorithm.
+    The DFS keeps an explicit stack over the CSR arrays of the graph instead of recursing, so it handles paths of any depth,
+    and its state is stored in typed arrays of 8 bytes per node, so graphs with millions of nodes fit in memory.
+
+    Args:
+        graph (DirectedGraph | CSRGraph): The graph for which the components should be found
+
+    Returns:
+        tuple[np.ndarray, dict]: The component id of each node id as an int32 array and the mapping from each node to its node id.
+                                 Components are numbered from 0 in reverse topological order: edges between two components always
+                                 go from the greater component id to the smaller one.
+    """
+    if type(graph) == DirectedGraph:
+        graph = CSRGraph.from_graph(graph)
+    if type(graph) != CSRGraph:
+        raise TypeError(
+            "Please provide an input graph of type DirectedGraph or CSRGraph"
+        )
+    number_nodes = graph.get_number_nodes()
+    indptr = memoryview(np.ascontiguousarray(graph.indptr))
+    indices = memoryview(np.ascontiguousarray(graph.indices))
+    # Discovery index of each node, -1 for the nodes that haven't been discovered yet
+    discovery_index = array("q", [-1]) * number_nodes
+    # Smallest discovery index reachable from the subtree of each node through nodes still on the component stack
+    low_link = array("q", bytes(8 * number_nodes))
+    # Position of the next edge to explore for each node on the DFS stack
+    next_edge = array("q", bytes(8 * number_nodes))
+    components = np.full(number_nodes, -1, dtype=np.int32)
+    component_ids = memoryview(components)
+    component_stack = []
+    number_components = 0
+    counter = 0
+
+    for root in range(number_nodes):
+        if discovery_index[root] != -1:
+            continue
+        discovery_index[root] = low_link[root] = counter
+        counter += 1
+        next_edge[root] = indptr[root]
+        component_stack.append(root)
+        dfs_stack = [root]
+        while dfs_stack:
+            node = dfs_stack[-1]
+            position = next_edge[node]
+            if position < indptr[node + 1]:
+                next_edge[node] = position + 1
+                adjacent_node = indices[position]
+                if discovery_index[adjacent_node] == -1:
+                    discovery_index[adjacent_node] = low_link[adjacent_node] = counter
+                    counter += 1
+                    next_edge[adjacent_node] = indptr[adjacent_node]
+                    component_stack.append(adjacent_node)
+                    dfs_stack.append(adjacent_node)
+                # A discovered node without a component is still on the component stack
+                elif (
+                    component_ids[adjacent_node] == -1
+                    and discovery_index[adjacent_node] < low_link[node]
+                ):
+                    low_link[node] = discovery_index[adjacent_node]
+                continue
+            # All edges of the node have been explored, its low link is passed to its parent in the DFS tree
+            dfs_stack.pop()
+            if dfs_stack and low_link[node] < low_link[dfs_stack[-1]]:
+                low_link[dfs_stack[-1]] = low_link[node]
+            # The node is the root of a component, made of the nodes above it on the component stack
+            if low_link[node] == discovery_index[node]:
+                while True:
+                    component_node = component_stack.pop()
+                    component_ids[component_node] = number_components
+                    if component_node == node:
+                        break
+                number_components += 1
+    return components, graph.node_ids
@@ -1,8 +1,8 @@
-from graphs.datastructures import DirectedGraph
+from graphs.datastructures import DirectedGraph, CSRGraph
 
 
-def topological_sort(graph: DirectedGraph) -> list:
-    """Topologically sort a graph. This topological sort uses recursive DFS.
+def topological_sort(graph: DirectedGraph | CSRGraph) -> list:
+    """Topologically sort a graph. This topological sort uses DFS with an explicit stack, so it isn't limited by the recursion depth.
 
     Args:
         graph: The graph to be topologically sorted.
@@ -22,10 +22,14 @@ def topological_sort(graph: DirectedGraph) -> list:
 
 
 def recursive_topological_dfs(
-    graph: DirectedGraph, start: object, explored_nodes: list, ordered_nodes: list
+    graph: DirectedGraph | CSRGraph,
+    start: object,
+    explored_nodes: list,
+    ordered_nodes: list,
 ) -> tuple[list, list]:
-    """Helper function for the topological sort of a graph. Handles the recursive DFS part.
+    """Helper function for the topological sort of a graph. Handles the DFS part.
     Orders nodes starting from a specific start node and adds these to the preexisting ordered nodes list.
+    The DFS visits the nodes in the same order as a recursive DFS but keeps its own stack, so it works on paths of any depth.
 
     Args:
         graph: The graph on which to order on.
@@ -37,10 +41,19 @@ def recursive_topological_dfs(
         tuple[list, list]: The updated explored_nodes and ordered_nodes lists.
     """
     explored_nodes.add(start)
-    for node in graph.get_adjacent_nodes(start):
-        if node not in explored_nodes:
-            explored_nodes, ordered_nodes = recursive_topological_dfs(
-                graph, node, explored_nodes, ordered_nodes
-            )
-    ordered_nodes.append(start)
+    # Each stack entry holds a node and an iterator over its adjacent nodes, which resumes where the exploration of the node stopped
+    stack = [(start, iter(graph.get_adjacent_nodes(start)))]
+    while stack:
+        node, adjacent_nodes = stack[-1]
+        for adjacent_node in adjacent_nodes:
+            if adjacent_node not in explored_nodes:
+                explored_nodes.add(adjacent_node)
+                stack.append(
+                    (adjacent_node, iter(graph.get_adjacent_nodes(adjacent_node)))
+                )
+                break
+        else:
+            # All adjacent nodes have been explored so the node is finished
+            stack.pop()
+            ordered_nodes.append(node)
     return explored_nodes, ordered_nodes
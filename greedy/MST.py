@@ -1,5 +1,6 @@
-from graphs.datastructures import UndirectedGraph, MinHeap
+from graphs.datastructures import UndirectedGraph, CSRGraph, MinHeap
 import random
+from typing import Callable
 import copy
 
 
@@ -54,17 +55,25 @@ def prim(input_graph: UndirectedGraph) -> UndirectedGraph:
     return minimum_spanning_tree
 
 
-def prim_heap(input_graph: UndirectedGraph) -> UndirectedGraph:
+def prim_heap(
+    input_graph: UndirectedGraph | CSRGraph,
+    heap_factory: Callable[[], MinHeap] = MinHeap,
+) -> UndirectedGraph:
     """Compute a minimum spanning tree thanks to Prim's algorithm and leveraging the heap data structure for minimum computational overhead.
 
     Args:
-        input_graph (UndirectedGraph): The input graph for which a minimum spanning tree should be computed
+        input_graph (UndirectedGraph | CSRGraph): The input graph for which a minimum spanning tree should be computed
+        heap_factory (Callable[[], MinHeap]): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap
 
     Returns:
         UndirectedGraph: The minimum spanning tree.
     """
-    if type(input_graph) != UndirectedGraph:
-        raise TypeError("Please provide an input graph of type UndirectedGraph")
+    if type(input_graph) == CSRGraph and input_graph.directed:
+        raise TypeError("Please provide an undirected CSRGraph")
+    if type(input_graph) not in (UndirectedGraph, CSRGraph):
+        raise TypeError(
+            "Please provide an input graph of type UndirectedGraph or CSRGraph"
+        )
     # Initializing the minimum spanning tree with a randomly chosen node
     input_graph_nodes = input_graph.get_nodes()
     number_nodes = len(input_graph_nodes)
@@ -73,51 +82,54 @@ def prim_heap(input_graph: UndirectedGraph) -> UndirectedGraph:
     minimum_spanning_tree = UndirectedGraph(weighted=True)
     minimum_spanning_tree.add_node(starting_node)
 
-    # Initializing accessible edges. These are stored in a heap so that the min value can be kept track of.
-    accessible_edges = MinHeap()
-    for adjacent_node, weight in input_graph.get_adjacent_nodes_and_weights(
-        starting_node
-    ):
-        # The edges are always stored as tuples (starting_node, ending_node)
-        accessible_edges.insert((starting_node, adjacent_node), weight)
-
-    # While there are edges going from explored to unexplored edges there are paths that exist
-    while accessible_edges.get_number_nodes() != 0:
-        # Extracting the node with the shortest path stored in the heap
-        edge, distance = accessible_edges.extract_min()
-        # If the adjacent edge is already in the minimum spanning tree it doesn't need to be added.
-        if edge[1] in nodes_in_mst:
-            continue
-        nodes_in_mst.add(edge[1])
-        minimum_spanning_tree.add_node(edge[1])
-        minimum_spanning_tree.add_edge(edge[0], edge[1], distance)
-        # Updating the heap with the new distances after having explored a new node.
-        for adjacent_node, weight in input_graph.get_adjacent_nodes_and_weights(
-            edge[1]
-        ):
-            if adjacent_node not in nodes_in_mst:
-                accessible_edges.insert((edge[1], adjacent_node), weight)
+    # Initializing accessible nodes. These are stored in a heap keyed by the weight of the cheapest edge linking them to the tree,
+    # so that the min value can be kept track of. The cheapest edges dict stores the tree node at the other end of that edge.
+    accessible_nodes = heap_factory()
+    cheapest_edges = {}
+    node = starting_node
+
+    while True:
+        # Updating the heap with the edges leaving the node that was just added to the tree.
+        for adjacent_node, weight in input_graph.get_adjacent_nodes_and_weights(node):
+            if adjacent_node in nodes_in_mst:
+                continue
+            if not accessible_nodes.contains(adjacent_node):
+                cheapest_edges[adjacent_node] = node
+                accessible_nodes.insert(adjacent_node, weight)
+            elif weight < accessible_nodes.get_key(adjacent_node):
+                cheapest_edges[adjacent_node] = node
+                accessible_nodes.decrease_key(adjacent_node, weight)
+
+        # When no node is accessible anymore the tree spans the whole connected component
+        if accessible_nodes.get_number_nodes() == 0:
+            break
+        # Extracting the node with the cheapest edge to the tree stored in the heap
+        node, distance = accessible_nodes.extract_min()
+        nodes_in_mst.add(node)
+        minimum_spanning_tree.add_node(node)
+        minimum_spanning_tree.add_edge(cheapest_edges.pop(node), node, distance)
 
     return minimum_spanning_tree
 
 
-def kruskal(input_graph: UndirectedGraph) -> UndirectedGraph:
+def kruskal(input_graph: UndirectedGraph | CSRGraph) -> UndirectedGraph:
     """Compute a minimum spanning tree using Kruskal's algorithm.
 
     Args:
-        input_graph (UndirectedGraph): The input graph for which a minimum spanning tree should be computed
+        input_graph (UndirectedGraph | CSRGraph): The input graph for which a minimum spanning tree should be computed
 
     Returns:
         UndirectedGraph: The minimum spanning tree.
     """
     minimum_spanning_tree = UndirectedGraph(weighted=True)
     nodes_in_mst = set()
-    shortest_edges = MinHeap()
     # Build the min heap containing all edges ordered by increasing weight.
-    # Runs in E x V time.
-    for node in input_graph.get_nodes():
-        for edge in input_graph.get_adjacent_nodes_and_weights(node):
-            shortest_edges.add_node((node, edge[0]), edge[1])
+    # The heap is built in bulk which runs in linear time.
+    shortest_edges = MinHeap.from_items(
+        ((node, edge[0]), edge[1])
+        for node in input_graph.get_nodes()
+        for edge in input_graph.get_adjacent_nodes_and_weights(node)
+    )
 
     # Iterate over edges with increasing weight
     for _ in range(shortest_edges.get_number_nodes()):
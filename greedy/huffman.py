@@ -1,15 +1,18 @@
 from graphs.datastructures import SigmaTreeNode, MinHeap
-from typing import Hashable
+from typing import Hashable, Callable
 
 
 def huffman_code(
-    alphabet: list[Hashable], frequencies: list[float | int]
+    alphabet: list[Hashable],
+    frequencies: list[float | int],
+    heap_factory: Callable[[], MinHeap] = MinHeap,
 ) -> list[SigmaTreeNode]:
     """Generate a huffman encoding for a given alphabet and associated symbol frequencies.
 
     Args:
         alphabet (list): The list of symbols to encode. The symbols need to be hashable
         frequencies (list): the list of assciated symbol frequencies
+        heap_factory (Callable[[], MinHeap]): Callable returning an empty heap, e.g. MinHeap, DaryMinHeap or PairingHeap
 
     Raises:
         ValueError: If the lists are of different lengths an exception is raised
@@ -25,10 +28,13 @@ def huffman_code(
     # Initialise helper data structures.
     # The final node list is the final list of nodes that will be returned.
     # A min heap is used to keep track of the current sub tree frequencies and extracting the min values.
+    # The initial heap holding all leaves is built in bulk in linear time.
     final_nodes = []
-    min_heap = MinHeap()
-    for i, symbol in enumerate(alphabet):
-        min_heap.insert(SigmaTreeNode(symbol, frequencies[i]), frequencies[i])
+    min_heap = heap_factory()
+    min_heap.heapify(
+        (SigmaTreeNode(symbol, frequencies[i]), frequencies[i])
+        for i, symbol in enumerate(alphabet)
+    )
 
     # While there are elements in the heap, we keep on merging the subtrees (represented as nodes)
     while len(min_heap) != 0:
@@ -47,6 +53,6 @@ def huffman_code(
         merged_node = SigmaTreeNode(merged_symbol, merged_frequency)
         merged_node.left_child = min_node
         merged_node.right_child = second_min_node
-        min_heap.add_node(merged_node, merged_frequency)
+        min_heap.insert(merged_node, merged_frequency)
 
     return final_nodes
@@ -1,6 +1,9 @@
 
-from dynamic_programming.bellman_ford import bellman_ford
+from dynamic_programming.bellman_ford import bellman_ford, bellman_ford_queue, bellman_ford_vectorized
+from graphs.datastructures import CSRGraph, DirectedGraph
 import numpy as np
+import pytest
+import random
 
 
 def test_bellman_ford(test_directed_graph_weighted, test_directed_graph_weighted_2, test_negative_cycle_graph):
@@ -8,4 +11,47 @@ def test_bellman_ford(test_directed_graph_weighted, test_directed_graph_weighted
 
     assert {1: np.inf, 2: 0, 4: 3, 3: 5, 5: 9} == bellman_ford(test_directed_graph_weighted_2, 2)
 
-    assert {} == bellman_ford(test_negative_cycle_graph, "s")
\ No newline at end of file
+    assert {} == bellman_ford(test_negative_cycle_graph, "s")
+
+
+def test_bellman_ford_csr(test_directed_graph_weighted_2, test_negative_cycle_graph):
+    csr_graph = CSRGraph.from_graph(test_directed_graph_weighted_2)
+    assert {1: np.inf, 2: 0, 4: 3, 3: 5, 5: 9} == bellman_ford(csr_graph, 2)
+
+    assert {} == bellman_ford(CSRGraph.from_graph(test_negative_cycle_graph), "s")
+
+
+@pytest.mark.parametrize("strategy", ["fifo", "slf"])
+def test_bellman_ford_queue(test_directed_graph_weighted, test_directed_graph_weighted_2, test_negative_cycle_graph, strategy):
+    assert ({"s": 0, "v": 1, "w": 3, "t": 6}, []) == bellman_ford_queue(test_directed_graph_weighted, "s", strategy)
+
+    csr_graph = CSRGraph.from_graph(test_directed_graph_weighted_2)
+    assert ({1: np.inf, 2: 0, 4: 3, 3: 5, 5: 9}, []) == bellman_ford_queue(csr_graph, 2, strategy)
+
+    distances, negative_cycle = bellman_ford_queue(test_negative_cycle_graph, "s", strategy)
+    assert distances == {}
+    assert sorted(negative_cycle) == ["u", "v", "w", "x"]
+    cycle_weight = sum(test_negative_cycle_graph.get_distance(negative_cycle[i - 1], negative_cycle[i]) for i in range(len(negative_cycle)))
+    assert cycle_weight < 0
+
+
+def test_bellman_ford_queue_random():
+    random.seed(7)
+    graph = DirectedGraph(weighted=True)
+    for node in range(50):
+        graph.add_node(node)
+    for _ in range(200):
+        start_node, end_node = random.sample(range(50), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+    expected_distances = bellman_ford(graph, 0)
+    assert bellman_ford_queue(graph, 0, "fifo") == (expected_distances, [])
+    assert bellman_ford_queue(graph, 0, "slf") == (expected_distances, [])
+    assert bellman_ford_vectorized(graph, 0) == expected_distances
+
+
+def test_bellman_ford_vectorized(test_graph, test_directed_graph_weighted_2, test_negative_cycle_graph):
+    assert {1: np.inf, 2: 0, 4: 3, 3: 5, 5: 9} == bellman_ford_vectorized(test_directed_graph_weighted_2, 2)
+
+    assert {} == bellman_ford_vectorized(test_negative_cycle_graph, "s")
+
+    assert bellman_ford(test_graph, "v") == bellman_ford_vectorized(test_graph, "v")
@@ -1,6 +1,10 @@
 
-from dynamic_programming.floyd_warshall import floyd_warhsall
+from dynamic_programming.floyd_warshall import floyd_warhsall, floyd_warshall_blocked
+from dynamic_programming.bellman_ford import bellman_ford
+from graphs.datastructures import CSRGraph, DirectedGraph
 import numpy as np
+import pytest
+import random
 
 
 def test_bellman_ford(test_directed_graph_weighted, test_directed_graph_weighted_2, test_negative_cycle_graph):
@@ -9,4 +13,52 @@ def test_bellman_ford(test_directed_graph_weighted, test_directed_graph_weighted
             ("v","s"): np.inf, ("v","v"): 0, ("v","w"): 2, ("v","t"): 5,
             ("w","s"): np.inf, ("w","v"): np.inf, ("w","w"): 0, ("w","t"): 3,} == floyd_warhsall(test_directed_graph_weighted)
 
-    assert {} == floyd_warhsall(test_negative_cycle_graph)
\ No newline at end of file
+    assert {} == floyd_warhsall(test_negative_cycle_graph)
+
+def test_floyd_warshall_next_hops(test_directed_graph_weighted_2):
+    all_pairs_distances = floyd_warhsall(test_directed_graph_weighted_2, next_hops=True)
+    assert len(all_pairs_distances) == 25
+    assert all_pairs_distances[(1, 5)] == 11
+    assert all_pairs_distances[(5, 1)] == np.inf
+    assert all_pairs_distances.path(1, 5) == [1, 2, 4, 3, 5]
+    assert all_pairs_distances.path(2, 2) == [2]
+    assert all_pairs_distances.path(5, 1) == []
+
+    with pytest.raises(Exception, match="The next hops were not computed"):
+        floyd_warhsall(test_directed_graph_weighted_2).path(1, 5)
+
+
+def test_floyd_warshall_random():
+    random.seed(9)
+    graph = DirectedGraph(weighted=True)
+    for node in range(30):
+        graph.add_node(node)
+    for _ in range(120):
+        start_node, end_node = random.sample(range(30), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+    all_pairs_distances = floyd_warhsall(CSRGraph.from_graph(graph), next_hops=True)
+    for node1 in range(30):
+        distances = bellman_ford(graph, node1)
+        for node2 in range(30):
+            assert all_pairs_distances[(node1, node2)] == distances[node2]
+            path = all_pairs_distances.path(node1, node2)
+            if distances[node2] != np.inf:
+                assert sum(graph.get_distance(path[i], path[i + 1]) for i in range(len(path) - 1)) == distances[node2]
+
+
+def test_floyd_warshall_blocked(tmp_path, test_negative_cycle_graph):
+    random.seed(10)
+    graph = DirectedGraph(weighted=True)
+    for node in range(45):
+        graph.add_node(node)
+    for _ in range(200):
+        start_node, end_node = random.sample(range(45), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+    expected_distances = floyd_warhsall(graph).distances
+    assert (floyd_warshall_blocked(graph, block_size=8).distances == expected_distances).all()
+    assert (floyd_warshall_blocked(graph, block_size=16, workers=2).distances == expected_distances).all()
+    memmap_distances = floyd_warshall_blocked(graph, block_size=10, workers=2, path=tmp_path / "distances.npy")
+    assert (memmap_distances.distances == expected_distances).all()
+    assert (np.load(tmp_path / "distances.npy") == expected_distances).all()
+
+    assert {} == floyd_warshall_blocked(test_negative_cycle_graph, block_size=2)
@@ -0,0 +1,35 @@
+from dynamic_programming.johnson import johnson, johnson_to_memmap
+from dynamic_programming.floyd_warshall import floyd_warhsall
+from graphs.datastructures import DirectedGraph
+import numpy as np
+import pytest
+import random
+
+
+def test_johnson(test_directed_graph_weighted, test_negative_cycle_graph):
+    expected_distances = floyd_warhsall(test_directed_graph_weighted)
+    nodes = test_directed_graph_weighted.get_nodes()
+    for node1, distances in johnson(test_directed_graph_weighted):
+        assert {(node1, node2): distances[column] for column, node2 in enumerate(nodes)} == {(node1, node2): expected_distances[(node1, node2)] for node2 in nodes}
+
+    with pytest.raises(Exception, match="The graph contains a negative cycle !"):
+        johnson(test_negative_cycle_graph)
+
+
+def test_johnson_negative_weights(tmp_path):
+    random.seed(8)
+    graph = DirectedGraph(weighted=True)
+    for node in range(25):
+        graph.add_node(node)
+    # Weights of the form c + p(u) - p(v) with c > 0 can be negative but every cycle has a positive weight
+    potentials = [random.randint(0, 15) for _ in range(25)]
+    for _ in range(80):
+        start_node, end_node = random.sample(range(25), 2)
+        weight = random.randint(1, 10) + potentials[start_node] - potentials[end_node]
+        graph.add_edge(start_node, end_node, weight)
+    expected_distances = floyd_warhsall(graph)
+    expected_matrix = np.array([[expected_distances[(node1, node2)] for node2 in range(25)] for node1 in range(25)])
+
+    distance_matrix = johnson_to_memmap(graph, tmp_path / "distances.npy", workers=2)
+    assert np.allclose(distance_matrix, expected_matrix)
+    assert np.allclose(np.load(tmp_path / "distances.npy", mmap_mode="r"), expected_matrix)
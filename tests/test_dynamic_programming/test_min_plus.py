@@ -0,0 +1,33 @@
+from dynamic_programming.min_plus import min_plus_product, min_plus_power, hop_bounded_distances
+from dynamic_programming.floyd_warshall import floyd_warhsall
+from graphs.dijkstra import dijkstra_heap
+import numpy as np
+
+
+def test_min_plus_product():
+    generator = np.random.default_rng(0)
+    left = generator.integers(0, 50, (70, 30)).astype(np.float64)
+    right = generator.integers(0, 50, (30, 45)).astype(np.float64)
+    right[3, :] = np.inf
+    expected_product = (left[:, :, None] + right[None, :, :]).min(axis=1)
+    assert (min_plus_product(left, right, block_size=8) == expected_product).all()
+
+    identity = min_plus_power(left[:30], 0)
+    assert (min_plus_product(identity, right) == right).all()
+    assert (min_plus_power(left[:30], 5, block_size=4) == min_plus_product(min_plus_product(min_plus_power(left[:30], 2), min_plus_power(left[:30], 2)), left[:30])).all()
+
+
+def test_hop_bounded_distances(test_directed_graph_weighted_2, test_graph_weighted_2, test_negative_cycle_graph):
+    distances = hop_bounded_distances(test_directed_graph_weighted_2, 2)
+    assert distances[(2, 3)] == 5
+    assert distances[(1, 3)] == 8
+    assert distances[(1, 5)] == np.inf
+    assert hop_bounded_distances(test_directed_graph_weighted_2, 4)[(1, 5)] == 11
+    assert dict(hop_bounded_distances(test_directed_graph_weighted_2, 100)) == dict(floyd_warhsall(test_directed_graph_weighted_2))
+
+    assert dict(hop_bounded_distances(test_graph_weighted_2, 100)) == {(node1, node2): distance for node1 in test_graph_weighted_2.get_nodes() for node2, distance in dijkstra_heap(test_graph_weighted_2, node1).items()}
+
+    # Going around the negative cycle once more shortens the path
+    assert hop_bounded_distances(test_negative_cycle_graph, 6)[("s", "v")] == 8
+    assert hop_bounded_distances(test_negative_cycle_graph, 3)[("s", "v")] == 10
+
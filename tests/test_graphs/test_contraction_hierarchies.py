@@ -0,0 +1,41 @@
+from graphs.contraction_hierarchies import ContractionHierarchy
+from graphs.dijkstra import dijkstra_heap
+from graphs.datastructures import UndirectedGraph
+import math
+import random
+
+
+def test_contraction_hierarchy(test_graph_weighted_2, tmp_path):
+    contraction_hierarchy = ContractionHierarchy.from_graph(test_graph_weighted_2)
+    assert sorted(contraction_hierarchy.ranks.tolist()) == [0, 1, 2, 3, 4]
+    assert (11, [1, 2, 4, 3, 5]) == contraction_hierarchy.query(1, 5)
+    assert (0, [3]) == contraction_hierarchy.query(3, 3)
+
+    random.seed(3)
+    graph = UndirectedGraph(weighted=True)
+    for node in range(150):
+        graph.add_node(node)
+    for node in range(1, 140):
+        graph.add_edge(
+            node, random.randint(max(0, node - 10), node - 1), random.randint(1, 20)
+        )
+    for _ in range(150):
+        start_node, end_node = random.sample(range(140), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+
+    contraction_hierarchy = ContractionHierarchy.from_graph(graph)
+    contraction_hierarchy.save(tmp_path / "hierarchy")
+    loaded_hierarchy = ContractionHierarchy.load(tmp_path / "hierarchy")
+    for source in range(0, 150, 13):
+        distances = dijkstra_heap(graph, source)
+        for target in range(150):
+            distance, path = loaded_hierarchy.query(source, target)
+            assert distance == distances[target]
+            if distance != math.inf:
+                assert path[0] == source and path[-1] == target
+                assert distance == sum(
+                    graph.get_distance(path[i], path[i + 1])
+                    for i in range(len(path) - 1)
+                )
+            else:
+                assert path == []
@@ -1,6 +1,14 @@
+import numpy as np
+import pytest
+import random
 from graphs.datastructures import (
     MinHeap,
     BinaryTreeNode,
+    CSRGraph,
+    DaryMinHeap,
+    PairingHeap,
+    ArrayMinHeap,
+    BucketQueue,
     DirectedGraph,
     UndirectedGraph,
 )
@@ -28,6 +36,153 @@ def test_MinHeap():
     assert heap.nodes == ["b", "f", "c", "a"]
 
 
+def test_MinHeapIndexed():
+    heap = MinHeap()
+    heap.insert("a", 10)
+    heap.insert("b", 3)
+    heap.insert("c", 6)
+    heap.insert("d", 5)
+    heap.insert("e", 2)
+    heap.insert("f", 7)
+    for node in heap.nodes:
+        assert heap.nodes[heap.get_node_index(node) - 1] == node
+
+    assert heap.contains("a")
+    heap.decrease_key("a", 1)
+    assert heap.get_node(1) == ("a", 1)
+
+    heap.increase_key("a", 8)
+    assert heap.keys == [2, 3, 6, 8, 5, 7]
+    assert heap.nodes == ["e", "b", "c", "a", "d", "f"]
+
+    # Removing from the middle of the heap moves the last element into the freed position
+    heap.remove("a")
+    assert "a" not in heap
+    assert heap.keys == [2, 3, 6, 7, 5]
+    assert heap.nodes == ["e", "b", "c", "f", "d"]
+    for node in heap.nodes:
+        assert heap.nodes[heap.get_node_index(node) - 1] == node
+
+    assert [heap.extract_min()[1] for _ in range(len(heap))] == [2, 3, 5, 6, 7]
+    assert heap.node_positions == {}
+
+    with pytest.raises(Exception, match="The new key is greater than the current key !"):
+        heap.insert("a", 1)
+        heap.decrease_key("a", 2)
+    with pytest.raises(Exception, match="Node a is already in the heap !"):
+        heap.insert("a", 1)
+
+
+def test_MinHeapFromItems():
+    heap = MinHeap.from_items(
+        [("a", 10), ("b", 3), ("c", 6), ("d", 5), ("e", 2), ("f", 7), ("g", 1)]
+    )
+    assert heap.keys == [1, 2, 6, 5, 3, 7, 10]
+    assert heap.nodes == ["g", "e", "c", "d", "b", "f", "a"]
+    for node in heap.nodes:
+        assert heap.nodes[heap.get_node_index(node) - 1] == node
+
+    # The last element (a, 10) replaces (e, 2) and is sifted down from index 2
+    heap.bubble_down(2)
+    assert heap.keys == [1, 3, 6, 5, 10, 7]
+    assert heap.nodes == ["g", "b", "c", "d", "a", "f"]
+
+    assert [heap.extract_min()[1] for _ in range(len(heap))] == [1, 3, 5, 6, 7, 10]
+
+
+def test_MinHeapBubbleDownSiftUp():
+    heap = MinHeap.from_items(
+        [("a", 1), ("b", 10), ("c", 2), ("d", 11), ("e", 12), ("f", 3), ("g", 4)]
+    )
+    # The last element (g, 4) replaces (d, 11) and has to move up above (b, 10)
+    heap.bubble_down(4)
+    assert heap.keys == [1, 4, 2, 10, 12, 3]
+    assert heap.nodes == ["a", "g", "c", "b", "e", "f"]
+    for node in heap.nodes:
+        assert heap.nodes[heap.get_node_index(node) - 1] == node
+
+
+@pytest.mark.parametrize(
+    "heap_factory",
+    [
+        MinHeap,
+        DaryMinHeap,
+        lambda: DaryMinHeap(arity=8),
+        PairingHeap,
+        lambda: ArrayMinHeap(200),
+    ],
+)
+def test_heap_variants(heap_factory):
+    random.seed(0)
+    keys = {node: random.randint(0, 1000) for node in range(200)}
+    heap = heap_factory()
+    heap.heapify(list(keys.items())[:100])
+    for node, key in list(keys.items())[100:]:
+        heap.insert(node, key)
+    assert len(heap) == heap.get_number_nodes() == 200
+
+    for node in range(0, 200, 3):
+        keys[node] -= random.randint(0, 100)
+        heap.decrease_key(node, keys[node])
+    for node in range(1, 200, 7):
+        keys[node] += random.randint(0, 100)
+        heap.increase_key(node, keys[node])
+    for node in range(2, 200, 11):
+        heap.remove(node)
+        del keys[node]
+    assert heap.get_key(3) == keys[3]
+    assert 2 not in heap and heap.contains(3)
+
+    extracted_keys = [heap.extract_min()[1] for _ in range(len(heap))]
+    assert extracted_keys == sorted(keys.values())
+
+
+def test_BucketQueue():
+    random.seed(0)
+    queue = BucketQueue.from_items([(node, 10 + node % 7) for node in range(20)], 10)
+    assert queue.current_key == 10 and len(queue) == 20
+    queue.decrease_key(15, 10)
+    queue.increase_key(3, 20)
+    queue.remove(6)
+    assert queue.get_key(3) == 20 and 6 not in queue
+
+    # Keys inserted while extracting stay within max_weight of the last extracted key, as in Dijkstra
+    extracted_keys = []
+    next_node = 20
+    while len(queue) != 0:
+        node, key = queue.extract_min()
+        extracted_keys.append(key)
+        if next_node < 60:
+            queue.insert(next_node, key + random.randint(0, 10))
+            next_node += 1
+    assert extracted_keys == sorted(extracted_keys) and len(extracted_keys) == 59
+
+    with pytest.raises(Exception, match="The key 12 is out of the bucket range"):
+        queue = BucketQueue(5)
+        queue.insert(0, 0)
+        queue.insert(1, 12)
+
+
+def test_ArrayMinHeap():
+    heap = ArrayMinHeap.from_items([(3, 10.0), (1, 3.0), (4, 6.0), (0, 5.0)], 5)
+    assert list(heap.heap[: len(heap)]) == [1, 0, 4, 3]
+    assert list(heap.keys[: len(heap)]) == [3.0, 5.0, 6.0, 10.0]
+    assert list(heap.positions) == [1, 0, -1, 3, 2]
+
+    heap.insert(2, 1.5)
+    assert heap.extract_min() == (2, 1.5)
+    assert heap.positions[2] == -1
+
+    with pytest.raises(IndexError, match="Node id 5 is out of the heap capacity 5 !"):
+        heap.insert(5, 1.0)
+    with pytest.raises(Exception, match="Node 3 is already in the heap !"):
+        heap.insert(3, 1.0)
+
+    assert heap.get_key(4) == 6.0
+    with pytest.raises(KeyError):
+        heap.get_key(2)
+
+
 def test_GraphWeighted(test_graph_weighted):
     assert test_graph_weighted.get_distance("s", "w") == 4
 
@@ -57,6 +212,70 @@ def test_DirectedGraphNoCycle():
     assert graph.is_cyclical() == False
 
 
+def test_DirectedGraphIncomingIndex(test_directed_graph_weighted):
+    graph = DirectedGraph(track_incoming=True)
+    graph.add_node(1)
+    graph.add_node(2)
+    graph.add_node(3)
+
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 3)
+    assert graph.get_incoming_nodes(3) == [1, 2]
+
+    graph.set_node_and_adjacent_nodes(1, [2])
+    assert graph.get_incoming_nodes(3) == [2]
+    assert graph.get_incoming_nodes(2) == [1]
+
+    assert test_directed_graph_weighted.incoming_list is None
+    test_directed_graph_weighted.enable_incoming_index()
+    test_directed_graph_weighted.add_node("u")
+    test_directed_graph_weighted.add_edge("u", "w", 5)
+    assert test_directed_graph_weighted.get_incoming_nodes_and_weights("w") == [
+        ("s", 4),
+        ("v", 2),
+        ("u", 5),
+    ]
+
+    test_directed_graph_weighted.remove_edge("v", "w")
+    assert test_directed_graph_weighted.get_incoming_nodes_and_weights("w") == [
+        ("s", 4),
+        ("u", 5),
+    ]
+    assert test_directed_graph_weighted.get_distance("v", "w") == np.inf
+
+    test_directed_graph_weighted.set_node_and_adjacent_nodes("s", {"t": 6})
+    assert test_directed_graph_weighted.get_incoming_nodes_and_weights("w") == [("u", 5)]
+    assert test_directed_graph_weighted.get_incoming_nodes_and_weights("t") == [("w", 3), ("s", 6)]
+    # The transposed view shares the index, so setting its adjacency updates the graph
+    transposed_graph = test_directed_graph_weighted.transpose()
+    transposed_graph.set_node_and_adjacent_nodes("t", {"w": 1})
+    assert test_directed_graph_weighted.get_adjacent_nodes_and_weights("w") == [("t", 1)]
+    assert test_directed_graph_weighted.get_adjacent_nodes_and_weights("s") == []
+    with pytest.raises(Exception, match="Please provide an element of type dict as adjacent nodes."):
+        test_directed_graph_weighted.set_node_and_adjacent_nodes("s", ["t"])
+
+
+def test_DirectedGraphTranspose():
+    """GIVEN a weighted directed graph, test that its transpose reverses the edges and keeps their weights."""
+    graph = DirectedGraph(weighted=True)
+    for node in ["a", "b", "c"]:
+        graph.add_node(node)
+    graph.add_edge("a", "b", 2)
+    graph.add_edge("b", "c", 3)
+    graph.add_edge("a", "c", 7)
+    transposed_graph = graph.transpose()
+    assert transposed_graph.get_adjacent_nodes_and_weights("c") == [("a", 7), ("b", 3)]
+    assert transposed_graph.get_adjacent_nodes("a") == []
+    assert transposed_graph.transpose() == graph
+
+def test_UndirectedGraphRemoveEdge(test_graph_weighted_2):
+    test_graph_weighted_2.remove_edge(2, 4)
+    assert 4 not in test_graph_weighted_2.get_adjacent_nodes(2)
+    assert 2 not in test_graph_weighted_2.get_adjacent_nodes(4)
+    with pytest.raises(Exception, match=r"Edge \(4, 2\) doesn't exist !"):
+        test_graph_weighted_2.remove_edge(4, 2)
+
+
 def test_UndirectedGraphCycle():
     graph = UndirectedGraph()
     graph.add_node(1)
@@ -97,6 +316,24 @@ def test_UndirectedGraphTour():
     
 
 
+def test_CSRGraph(test_graph, test_graph_weighted):
+    csr_graph = CSRGraph.from_graph(test_graph)
+    assert csr_graph.get_nodes() == ["v", "w", "s", "t"]
+    assert csr_graph.indptr.tolist() == [0, 1, 2, 4, 4]
+    assert csr_graph.get_adjacent_nodes("s") == ["v", "w"]
+    assert csr_graph.get_incoming_nodes("t") == ["v", "w"]
+    assert csr_graph.get_distance("s", "v") == 1
+    assert csr_graph.get_distance("v", "s") == np.inf
+
+    csr_graph = CSRGraph.from_graph(test_graph_weighted)
+    assert not csr_graph.directed
+    assert csr_graph.get_number_edges() == 8
+    assert csr_graph.get_adjacent_nodes_and_weights("w") == [("s", 4), ("v", 2), ("t", 3)]
+    assert csr_graph.get_incoming_nodes("w") == ["s", "v", "t"]
+    assert csr_graph.get_distance("s", "w") == 4
+    assert csr_graph.get_nbytes() == 5 * 8 + 8 * 4 + 8 * 8
+
+
 def test_BinaryTreeNode():
     root = BinaryTreeNode(10)
     root.insert(3)
@@ -0,0 +1,28 @@
+from graphs.delta_stepping import delta_stepping
+from graphs.dijkstra import dijkstra_heap
+from graphs.datastructures import CSRGraph, DirectedGraph
+import graphs.delta_stepping
+import random
+
+
+def test_delta_stepping(test_graph_weighted, test_graph_weighted_2):
+    for graph in [test_graph_weighted, test_graph_weighted_2]:
+        for node in graph.get_nodes():
+            expected_distances = dijkstra_heap(graph, node)
+            for delta in [None, 1, 3, 100]:
+                assert delta_stepping(graph, node, delta) == expected_distances
+
+
+def test_delta_stepping_workers(monkeypatch):
+    random.seed(5)
+    graph = DirectedGraph(weighted=True)
+    for node in range(300):
+        graph.add_node(node)
+    for _ in range(1500):
+        start_node, end_node = random.sample(range(290), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 50))
+    csr_graph = CSRGraph.from_graph(graph)
+    expected_distances = dijkstra_heap(csr_graph, 0)
+    # Every phase goes through the process pool
+    monkeypatch.setattr(graphs.delta_stepping, "PARALLEL_FRONTIER_SIZE", 1)
+    assert delta_stepping(csr_graph, 0, workers=2) == expected_distances
@@ -1,4 +1,22 @@
-from graphs.dijkstra import dijkstra, dijkstra_heap
+from graphs.dijkstra import (
+    dijkstra,
+    dijkstra_heap,
+    dijkstra_path,
+    a_star,
+    euclidean_heuristic,
+    haversine_heuristic,
+    dijkstra_many,
+    dijkstra_rows,
+    dijkstra_multi_source,
+    select_heap_factory,
+    integer_weight_bound,
+    reconstruct_path,
+)
+from graphs.datastructures import UndirectedGraph, DirectedGraph
+import math
+import pytest
+import random
+from graphs.datastructures import CSRGraph, DaryMinHeap, PairingHeap, MinHeap
 
 
 def test_dijkstra(test_graph_weighted, test_graph_weighted_2):
@@ -11,3 +29,208 @@ def test_dijkstra_heap(test_graph_weighted, test_graph_weighted_2):
     assert {"s": 0, "v": 1, "w": 3, "t": 6} == dijkstra_heap(test_graph_weighted, "s")
 
     assert {1: 2, 2: 0, 4: 3, 3: 5, 5: 9} == dijkstra_heap(test_graph_weighted_2, 2)
+
+
+def test_dijkstra_heap_directed(
+    test_directed_graph_weighted, test_directed_graph_weighted_2
+):
+    assert {"s": 0, "v": 1, "w": 3, "t": 6} == dijkstra_heap(
+        test_directed_graph_weighted, "s"
+    )
+    assert {1: math.inf, 2: 0, 4: 3, 3: 5, 5: 9} == dijkstra_heap(
+        test_directed_graph_weighted_2, 2
+    )
+
+    distances, predecessors = dijkstra_heap(
+        test_directed_graph_weighted_2, 1, return_predecessors=True
+    )
+    assert distances[5] == 11
+    assert predecessors == {1: None, 2: 1, 4: 2, 3: 4, 5: 3}
+    assert reconstruct_path(predecessors, 5) == [1, 2, 4, 3, 5]
+    assert dijkstra_path(test_directed_graph_weighted_2, 1, 5, True) == (
+        11,
+        [1, 2, 4, 3, 5],
+    )
+    assert dijkstra_path(test_directed_graph_weighted_2, 5, 1, True) == (math.inf, [])
+
+
+def test_dijkstra_heap_csr(test_graph_weighted, test_graph_weighted_2):
+    csr_graph = CSRGraph.from_graph(test_graph_weighted)
+    assert {"s": 0, "v": 1, "w": 3, "t": 6} == dijkstra_heap(csr_graph, "s")
+
+    csr_graph = CSRGraph.from_graph(test_graph_weighted_2)
+    assert {1: 2, 2: 0, 4: 3, 3: 5, 5: 9} == dijkstra_heap(csr_graph, 2)
+
+
+def test_dijkstra_heap_factory(test_graph_weighted_2):
+    expected_distances = {1: 2, 2: 0, 4: 3, 3: 5, 5: 9}
+    for heap_factory in [DaryMinHeap, lambda: DaryMinHeap(arity=8), PairingHeap]:
+        assert expected_distances == dijkstra_heap(
+            test_graph_weighted_2, 2, heap_factory
+        )
+
+
+def test_dijkstra_heap_bucket_queue():
+    random.seed(4)
+    graph = UndirectedGraph(weighted=True)
+    for node in range(80):
+        graph.add_node(node)
+    for _ in range(300):
+        start_node, end_node = random.sample(range(80), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 30))
+    csr_graph = CSRGraph.from_graph(graph)
+    assert type(select_heap_factory(graph)()).__name__ == "BucketQueue"
+    assert type(select_heap_factory(csr_graph)()).__name__ == "BucketQueue"
+    expected_distances = dijkstra_heap(graph, 0, MinHeap)
+    assert dijkstra_heap(graph, 0) == expected_distances
+    assert dijkstra_heap(csr_graph, 0) == expected_distances
+
+    # Fractional or large weights fall back to the binary heap
+    graph.add_edge(0, 1, 0.5)
+    assert select_heap_factory(graph) == MinHeap
+    graph.add_edge(0, 1, 5000)
+    assert select_heap_factory(graph) == MinHeap
+
+
+def test_integer_weight_bound(test_graph, test_graph_weighted_2):
+    """GIVEN infinite weights or an unweighted graph, test that the weight bound skips the former and rejects the latter."""
+    csr_graph = CSRGraph.from_graph(test_graph_weighted_2)
+    csr_graph.weights[0] = math.inf
+    assert integer_weight_bound(csr_graph) == 6
+    assert type(select_heap_factory(csr_graph)()).__name__ == "BucketQueue"
+    assert dijkstra_heap(csr_graph, 2) == dijkstra_heap(csr_graph, 2, MinHeap)
+
+    test_graph_weighted_2.add_edge(1, 5, math.inf)
+    assert integer_weight_bound(test_graph_weighted_2) == 6
+    with pytest.raises(
+        Exception, match="Graph is not weighted, cannot return a node,weight pair"
+    ):
+        dijkstra_heap(test_graph, "s")
+
+
+def test_dijkstra_path(test_graph_weighted, test_graph_weighted_2):
+    for bidirectional in [False, True]:
+        assert (6, ["s", "v", "w", "t"]) == dijkstra_path(
+            test_graph_weighted, "s", "t", bidirectional
+        )
+        assert (11, [1, 2, 4, 3, 5]) == dijkstra_path(
+            test_graph_weighted_2, 1, 5, bidirectional
+        )
+        assert (0, [3]) == dijkstra_path(test_graph_weighted_2, 3, 3, bidirectional)
+
+    test_graph_weighted_2.add_node(6)
+    assert (math.inf, []) == dijkstra_path(test_graph_weighted_2, 1, 6)
+    assert (math.inf, []) == dijkstra_path(test_graph_weighted_2, 1, 6, True)
+
+
+def test_bidirectional_dijkstra_path_random():
+    random.seed(1)
+    for graph_type in [UndirectedGraph, DirectedGraph]:
+        graph = graph_type(weighted=True)
+        for node in range(60):
+            graph.add_node(node)
+        for _ in range(200):
+            start_node, end_node = random.sample(range(60), 2)
+            graph.add_edge(start_node, end_node, random.randint(1, 20))
+        csr_graph = CSRGraph.from_graph(graph)
+        distances = dijkstra_heap(csr_graph, 0)
+        for target in range(60):
+            distance, path = dijkstra_path(csr_graph, 0, target)
+            bidirectional_distance, bidirectional_path = dijkstra_path(
+                csr_graph, 0, target, bidirectional=True
+            )
+            assert distance == bidirectional_distance == distances[target]
+            for found_path in [path, bidirectional_path]:
+                if distance != math.inf:
+                    assert found_path[0] == 0 and found_path[-1] == target
+                    assert distance == sum(
+                        csr_graph.get_distance(found_path[i], found_path[i + 1])
+                        for i in range(len(found_path) - 1)
+                    )
+
+
+def test_a_star():
+    # Grid graph where each node is linked to its right and upper neighbours by edges of length 1
+    size = 10
+    grid_graph = UndirectedGraph(weighted=True)
+    coordinates = {}
+    for x in range(size):
+        for y in range(size):
+            grid_graph.add_node((x, y))
+            coordinates[(x, y)] = (x, y)
+    for x in range(size):
+        for y in range(size):
+            if x + 1 < size:
+                grid_graph.add_edge((x, y), (x + 1, y), 1)
+            if y + 1 < size:
+                grid_graph.add_edge((x, y), (x, y + 1), 1)
+
+    distance, path, number_expanded_nodes = a_star(
+        grid_graph, (0, 0), (9, 0), euclidean_heuristic(coordinates)
+    )
+    assert distance == 9
+    assert path == [(x, 0) for x in range(10)]
+    _, _, number_expanded_nodes_dijkstra = a_star(
+        grid_graph, (0, 0), (9, 0), lambda node, target: 0
+    )
+    assert number_expanded_nodes < number_expanded_nodes_dijkstra
+
+    grid_graph.add_node("isolated")
+    coordinates["isolated"] = (20, 20)
+    assert (math.inf, []) == a_star(
+        grid_graph, (0, 0), "isolated", euclidean_heuristic(coordinates)
+    )[:2]
+
+
+def test_haversine_heuristic():
+    coordinates = {"paris": (48.8566, 2.3522), "london": (51.5072, -0.1276)}
+    heuristic = haversine_heuristic(coordinates)
+    assert 340 < heuristic("paris", "london") < 345
+    assert heuristic("paris", "paris") == 0
+
+
+def test_dijkstra_many():
+    random.seed(3)
+    graph = UndirectedGraph(weighted=True)
+    for node in range(50):
+        graph.add_node(node)
+    for _ in range(120):
+        start_node, end_node = random.sample(range(45), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+    sources = [0, 7, 13, 21, 48]
+    expected_matrix = [
+        [dijkstra_heap(graph, source)[node] for node in graph.get_nodes()]
+        for source in sources
+    ]
+    for workers in [1, 2]:
+        distance_matrix = dijkstra_many(graph, sources, workers=workers)
+        assert distance_matrix.shape == (5, 50)
+        assert distance_matrix.tolist() == expected_matrix
+
+
+def test_dijkstra_rows_bounded_chunks(monkeypatch):
+    """GIVEN a chunk budget of a single row, test that the rows are still streamed in the order of the sources."""
+    monkeypatch.setattr("graphs.dijkstra.ROWS_CHUNK_BYTES", 8 * 30)
+    random.seed(5)
+    graph = DirectedGraph(weighted=True)
+    for node in range(30):
+        graph.add_node(node)
+    for _ in range(90):
+        start_node, end_node = random.sample(range(30), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+    sources = graph.get_nodes()[::-1]
+    rows = list(dijkstra_rows(graph, sources, workers=2))
+    assert len(rows) == 30
+    for source, row in zip(sources, rows):
+        distances = dijkstra_heap(graph, source)
+        assert row.tolist() == [distances[node] for node in graph.get_nodes()]
+
+
+def test_dijkstra_multi_source(test_graph_weighted_2):
+    distances, nearest_sources = dijkstra_multi_source(test_graph_weighted_2, [1, 5])
+    distances_s = dijkstra_heap(test_graph_weighted_2, 1)
+    distances_t = dijkstra_heap(test_graph_weighted_2, 5)
+    for node in test_graph_weighted_2.get_nodes():
+        assert distances[node] == min(distances_s[node], distances_t[node])
+        nearest_distances = distances_s if nearest_sources[node] == 1 else distances_t
+        assert nearest_distances[node] == distances[node]
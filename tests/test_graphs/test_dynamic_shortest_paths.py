@@ -0,0 +1,66 @@
+from graphs.dynamic_shortest_paths import DynamicShortestPaths
+from graphs.dijkstra import dijkstra_path
+from graphs.datastructures import CSRGraph, DirectedGraph, UndirectedGraph
+import math
+import pytest
+import random
+
+
+def test_dynamic_shortest_paths(test_graph_weighted_2):
+    shortest_paths = DynamicShortestPaths(test_graph_weighted_2, 2)
+    assert shortest_paths.get_distance(5) == 9
+    assert shortest_paths.get_path(3) == [2, 4, 3]
+
+    shortest_paths.update_edge(2, 3, 1)
+    assert shortest_paths.get_distance(3) == 1
+    assert shortest_paths.get_path(3) == [2, 3]
+
+    shortest_paths.delete_edge(2, 3)
+    assert shortest_paths.get_distance(3) == 5
+    assert shortest_paths.get_path(3) == [2, 4, 3]
+
+    with pytest.raises(Exception, match=r"Edge \(2, 3\) doesn't exist !"):
+        shortest_paths.delete_edge(2, 3)
+
+
+def test_dynamic_shortest_paths_zero_weight(test_graph_weighted_2):
+    """GIVEN an edge updated to a weight of 0, test that it is stored as a weighted edge and used by the shortest paths."""
+    shortest_paths = DynamicShortestPaths(test_graph_weighted_2, 2)
+    shortest_paths.update_edge(2, 3, 0)
+    assert test_graph_weighted_2.get_distance(2, 3) == 0
+    assert shortest_paths.get_distance(3) == 0
+    assert shortest_paths.get_path(3) == [2, 3]
+
+
+@pytest.mark.parametrize("graph_type", [DirectedGraph, UndirectedGraph])
+def test_dynamic_shortest_paths_random_updates(graph_type):
+    random.seed(6)
+    graph = graph_type(weighted=True)
+    for node in range(40):
+        graph.add_node(node)
+    edges = set()
+    for _ in range(120):
+        start_node, end_node = random.sample(range(40), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 20))
+        edges.add((start_node, end_node))
+    shortest_paths = DynamicShortestPaths(graph, 0)
+
+    for _ in range(100):
+        start_node, end_node = random.choice(sorted(edges))
+        if random.random() < 0.2:
+            shortest_paths.delete_edge(start_node, end_node)
+            edges.discard((start_node, end_node))
+        else:
+            shortest_paths.update_edge(start_node, end_node, random.randint(0, 20))
+        csr_graph = CSRGraph.from_graph(graph)
+        for target in range(0, 40, 3):
+            distance, _ = dijkstra_path(csr_graph, 0, target)
+            assert shortest_paths.get_distance(target) == distance
+            path = shortest_paths.get_path(target)
+            if distance == math.inf:
+                assert path == []
+            else:
+                assert distance == sum(
+                    graph.get_distance(path[i], path[i + 1])
+                    for i in range(len(path) - 1)
+                )
@@ -0,0 +1,85 @@
+from graphs import forward_backward
+from graphs.forward_backward import forward_backward_strongly_connected_components
+from graphs.kosaraju import find_strongly_connected_components
+from graphs.datastructures import CSRGraph, DirectedGraph
+import pytest
+import random
+
+
+def assert_same_components(graph, components, node_ids):
+    kosaraju_components = find_strongly_connected_components(graph)
+    assert components.dtype == "int32"
+    assert (components >= 0).all()
+    for node1 in graph.get_nodes():
+        for node2 in graph.get_nodes():
+            assert (components[node_ids[node1]] == components[node_ids[node2]]) == (
+                kosaraju_components[node1] == kosaraju_components[node2]
+            )
+
+
+def random_graph(number_nodes, number_edges, seed):
+    random.seed(seed)
+    graph = DirectedGraph()
+    for node in range(number_nodes):
+        graph.add_node(node)
+    for _ in range(number_edges):
+        start_node, end_node = random.sample(range(number_nodes), 2)
+        if end_node not in graph.get_adjacent_nodes(start_node):
+            graph.add_edge(start_node, end_node)
+    return graph
+
+
+def test_forward_backward_strongly_connected_components(test_graph, test_graph_2):
+    for graph in [test_graph, test_graph_2, CSRGraph.from_graph(test_graph_2)]:
+        components, node_ids = forward_backward_strongly_connected_components(graph)
+        assert_same_components(graph, components, node_ids)
+
+
+@pytest.mark.parametrize("tarjan_subproblem_size", [0, 256])
+def test_forward_backward_random(monkeypatch, tarjan_subproblem_size):
+    """GIVEN random graphs, test the components found by the forward-backward splits alone and with small subproblems handed to Tarjan."""
+    monkeypatch.setattr(
+        forward_backward, "TARJAN_SUBPROBLEM_SIZE", tarjan_subproblem_size
+    )
+    for seed in range(5):
+        graph = random_graph(120, 180, seed)
+        components, node_ids = forward_backward_strongly_connected_components(graph)
+        assert_same_components(graph, components, node_ids)
+
+
+def test_forward_backward_high_diameter(monkeypatch):
+    """GIVEN a ring of rings much longer than the chain threshold, test that the long chains are handed to Tarjan and give the right components."""
+    monkeypatch.setattr(forward_backward, "TARJAN_SUBPROBLEM_SIZE", 0)
+    completed_searches = []
+    reach = forward_backward._reach
+
+    def recording_reach(*arguments):
+        completed_searches.append(reach(*arguments))
+        return completed_searches[-1]
+
+    monkeypatch.setattr(forward_backward, "_reach", recording_reach)
+    graph = DirectedGraph()
+    for node in range(20000):
+        graph.add_node(node)
+    # Ten rings of 2000 nodes, each linked to the next one by a single edge
+    for node in range(20000):
+        ring_start = node - node % 2000
+        graph.add_edge(node, ring_start + (node + 1) % 2000)
+        if node % 2000 == 0 and node + 2000 < 20000:
+            graph.add_edge(node, node + 2000)
+    components, _ = forward_backward_strongly_connected_components(graph)
+    assert False in completed_searches
+    assert len(set(components.tolist())) == 10
+    for node in range(20000):
+        assert components[node] == components[node - node % 2000]
+
+
+def test_forward_backward_workers(monkeypatch):
+    """GIVEN a small parallel threshold, test that the subproblems dispatched to the pool give the same components."""
+    monkeypatch.setattr(forward_backward, "PARALLEL_SUBPROBLEM_SIZE", 8)
+    monkeypatch.setattr(forward_backward, "TARJAN_SUBPROBLEM_SIZE", 4)
+    graph = random_graph(150, 220, 3)
+    components, node_ids = forward_backward_strongly_connected_components(
+        graph, workers=2
+    )
+    assert_same_components(graph, components, node_ids)
@@ -2,7 +2,9 @@ from graphs.kosaraju import (
     strongly_connected_component_dfs,
     find_strongly_connected_components,
     reverse_graph,
+    condensation_graph,
 )
+from graphs.datastructures import CSRGraph
 
 
 def test_find_strongly_connected_components(test_graph, test_graph_2):
@@ -15,6 +17,13 @@ def test_find_strongly_connected_components(test_graph, test_graph_2):
     assert len(set(scc_test_graph_2.values())) == 4
 
 
+def test_find_strongly_connected_components_csr(test_graph_2):
+    scc_test_graph_2 = find_strongly_connected_components(
+        CSRGraph.from_graph(test_graph_2)
+    )
+    assert scc_test_graph_2 == find_strongly_connected_components(test_graph_2)
+
+
 def test_strongly_connected_component_dfs(test_graph, test_graph_2):
     """GIVEN an input graph, test that the current SCC is correctly explored when calling strongly_connected_component_dfs."""
     (
@@ -37,3 +46,48 @@ def test_strongly_connected_component_dfs(test_graph, test_graph_2):
 def test_reverse_graph(test_graph, reverse_test_graph):
     """GIVEN an input graph test that it is correctly reversed when calling reverse_graph."""
     assert reverse_graph(test_graph) == reverse_test_graph
+
+
+def test_condensation_graph(test_graph_2):
+    condensation, strongly_connected_components = condensation_graph(test_graph_2)
+    assert len(condensation.get_nodes()) == 4
+    assert not condensation.is_cyclical()
+    for node in test_graph_2.get_nodes():
+        for adjacent_node in test_graph_2.get_adjacent_nodes(node):
+            start, end = (
+                strongly_connected_components[node],
+                strongly_connected_components[adjacent_node],
+            )
+            assert start == end or end in condensation.get_adjacent_nodes(start)
+
+
+def test_reverse_graph_transpose(test_graph_2):
+    """GIVEN graphs with and without an incoming-edge index or in CSR form, test that the transpose reverses every edge."""
+    expected_edges = {
+        (end_node, start_node)
+        for start_node in test_graph_2.get_nodes()
+        for end_node in test_graph_2.get_adjacent_nodes(start_node)
+    }
+    csr_graph = CSRGraph.from_graph(test_graph_2)
+    for graph in [test_graph_2, csr_graph]:
+        reversed_graph = reverse_graph(graph)
+        assert type(reversed_graph) == type(graph)
+        assert {
+            (start_node, end_node)
+            for start_node in reversed_graph.get_nodes()
+            for end_node in reversed_graph.get_adjacent_nodes(start_node)
+        } == expected_edges
+    assert csr_graph.transpose().transpose().indices is csr_graph.indices
+
+    # With an incoming-edge index, transpose returns a view while reverse_graph still returns an independent graph
+    test_graph_2.enable_incoming_index()
+    transposed_graph = test_graph_2.transpose()
+    assert transposed_graph.adjacency_list is test_graph_2.incoming_list
+    assert transposed_graph.get_incoming_nodes(1) == test_graph_2.get_adjacent_nodes(1)
+    reversed_graph = reverse_graph(test_graph_2)
+    assert reversed_graph == transposed_graph
+    reversed_graph.add_edge(2, 6)
+    assert 2 not in test_graph_2.get_adjacent_nodes(6)
+    assert find_strongly_connected_components(
+        test_graph_2
+    ) == find_strongly_connected_components(CSRGraph.from_graph(test_graph_2))
@@ -0,0 +1,38 @@
+from graphs.landmarks import LandmarkIndex
+from graphs.dijkstra import dijkstra_heap
+from graphs.datastructures import UndirectedGraph
+import math
+import random
+
+
+def test_landmark_index(tmp_path):
+    random.seed(2)
+    graph = UndirectedGraph(weighted=True)
+    for node in range(100):
+        graph.add_node(node)
+    for node in range(1, 90):
+        graph.add_edge(node, random.randint(0, node - 1), random.randint(1, 10))
+    for _ in range(100):
+        start_node, end_node = random.sample(range(90), 2)
+        graph.add_edge(start_node, end_node, random.randint(1, 10))
+    # Nodes 90 to 99 are a second connected component
+    for node in range(91, 100):
+        graph.add_edge(node, node - 1, 1)
+
+    landmark_index = LandmarkIndex.from_graph(graph, 4)
+    assert landmark_index.distances.shape == (100, 4)
+    assert any(landmark >= 90 for landmark in landmark_index.landmarks)
+
+    distances = dijkstra_heap(graph, 0)
+    for target in range(0, 100, 7):
+        distance, path, _ = landmark_index.query(graph, 0, target)
+        assert distance == distances[target]
+        assert landmark_index.lower_bound(0, target) <= distances[target]
+        if distance != math.inf:
+            assert path[0] == 0 and path[-1] == target
+
+    landmark_index.save(tmp_path / "landmarks.npz")
+    loaded_index = LandmarkIndex.load(tmp_path / "landmarks.npz")
+    assert loaded_index.nodes == landmark_index.nodes
+    assert (loaded_index.distances == landmark_index.distances).all()
+    assert loaded_index.query(graph, 0, 42) == landmark_index.query(graph, 0, 42)
@@ -0,0 +1,68 @@
+from graphs.reachability import ReachabilityIndex
+from graphs.datastructures import CSRGraph, DirectedGraph
+import pytest
+import random
+
+
+def reachable_nodes(graph, start_node):
+    reached = {start_node}
+    nodes_to_explore = [start_node]
+    while nodes_to_explore:
+        for node in graph.get_adjacent_nodes(nodes_to_explore.pop()):
+            if node not in reached:
+                reached.add(node)
+                nodes_to_explore.append(node)
+    return reached
+
+
+def test_reachability_index(test_graph_2, tmp_path):
+    reachability_index = ReachabilityIndex.from_graph(test_graph_2)
+    assert reachability_index.same_component(1, 3)
+    for node1 in test_graph_2.get_nodes():
+        reached = reachable_nodes(test_graph_2, node1)
+        for node2 in test_graph_2.get_nodes():
+            assert reachability_index.can_reach(node1, node2) == (node2 in reached)
+
+    reachability_index.save(tmp_path / "reachability.npz")
+    loaded_index = ReachabilityIndex.load(tmp_path / "reachability.npz")
+    assert (loaded_index.reached_chains == reachability_index.reached_chains).all()
+    assert loaded_index.can_reach(1, 6)
+
+
+def test_reachability_index_random():
+    random.seed(11)
+    graph = DirectedGraph()
+    for node in range(150):
+        graph.add_node(node)
+    for _ in range(180):
+        start_node, end_node = random.sample(range(150), 2)
+        if end_node not in graph.get_adjacent_nodes(start_node):
+            graph.add_edge(start_node, end_node)
+    reachability_index = ReachabilityIndex.from_graph(CSRGraph.from_graph(graph))
+    for node1 in range(0, 150, 7):
+        reached = reachable_nodes(graph, node1)
+        for node2 in range(150):
+            assert reachability_index.can_reach(node1, node2) == (node2 in reached)
+
+
+def test_reachability_index_size_limit():
+    """GIVEN a wide DAG, test that the chains compress the closure and that an index above the size limit is refused."""
+    graph = DirectedGraph()
+    for node in range(200):
+        graph.add_node(node)
+    # Every node of the first half reaches every node of the second half, which makes 100 chains of 2 components
+    for start_node in range(100):
+        for end_node in range(100, 200):
+            graph.add_edge(start_node, end_node)
+    reachability_index = ReachabilityIndex.from_graph(graph)
+    assert len(set(reachability_index.chains.tolist())) == 100
+    assert len(reachability_index.reached_chains) == 100 * 100 + 100
+    assert reachability_index.can_reach(0, 150) and not reachability_index.can_reach(
+        150, 0
+    )
+    assert not reachability_index.can_reach(0, 1)
+
+    with pytest.raises(
+        Exception, match="The reachability index needs more than 1000 entries"
+    ):
+        ReachabilityIndex.from_graph(graph, max_entries=1000)
@@ -0,0 +1,31 @@
+from graphs.tarjan import tarjan_strongly_connected_components
+from graphs.kosaraju import find_strongly_connected_components
+from graphs.datastructures import CSRGraph, DirectedGraph
+
+
+def test_tarjan_strongly_connected_components(test_graph, test_graph_2):
+    for graph in [test_graph, test_graph_2, CSRGraph.from_graph(test_graph_2)]:
+        components, node_ids = tarjan_strongly_connected_components(graph)
+        kosaraju_components = find_strongly_connected_components(graph)
+        assert components.dtype == "int32"
+        for node1 in graph.get_nodes():
+            for node2 in graph.get_nodes():
+                assert (components[node_ids[node1]] == components[node_ids[node2]]) == (
+                    kosaraju_components[node1] == kosaraju_components[node2]
+                )
+            # Components are numbered in reverse topological order
+            for node2 in graph.get_adjacent_nodes(node1):
+                assert components[node_ids[node1]] >= components[node_ids[node2]]
+
+
+def test_tarjan_deep_graph():
+    """GIVEN a cycle much longer than the recursion limit, test that it is found as a single component."""
+    graph = DirectedGraph()
+    for node in range(50000):
+        graph.add_node(node)
+    for node in range(49999):
+        graph.add_edge(node, node + 1)
+    graph.add_edge(49999, 0)
+    components, _ = tarjan_strongly_connected_components(graph)
+    assert (components == 0).all()
+    assert len(set(find_strongly_connected_components(graph).values())) == 1
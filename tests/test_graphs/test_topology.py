@@ -1,4 +1,5 @@
 from graphs.topology import topological_sort, recursive_topological_dfs
+from graphs.datastructures import CSRGraph, DirectedGraph
 
 
 def test_recursive_topological_dfs(test_graph, test_graph_2):
@@ -24,3 +25,17 @@ def test_recursive_topological_dfs(test_graph, test_graph_2):
 def test_topological_sort(test_graph, test_graph_2):
     assert topological_sort(test_graph) == ["s", "w", "v", "t"]
     assert topological_sort(test_graph_2) == [1, 3, 5, 2, 4, 6]
+
+
+def test_topological_sort_csr(test_graph, test_graph_2):
+    assert topological_sort(CSRGraph.from_graph(test_graph)) == ["s", "w", "v", "t"]
+    assert topological_sort(CSRGraph.from_graph(test_graph_2)) == [1, 3, 5, 2, 4, 6]
+
+
+def test_topological_sort_deep_graph():
+    graph = DirectedGraph()
+    for node in range(50000):
+        graph.add_node(node)
+    for node in range(49999):
+        graph.add_edge(49999 - node, 49998 - node)
+    assert topological_sort(graph) == list(range(49999, -1, -1))
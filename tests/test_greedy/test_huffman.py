@@ -1,29 +1,54 @@
 from greedy.huffman import huffman_code
-from graphs.datastructures import SigmaTreeNode
+from graphs.datastructures import SigmaTreeNode, DaryMinHeap, PairingHeap
 
 
 def test_huffman_code():
     # Create a very basic alphabet
     # final tree will be
-    #         O
-    #       /   \
-    #      b     O
-    #           /  \
-    #           c   a
+    #           O
+    #         /   \
+    #        O     b
+    #      /  \
+    #      c   a
     alphabet = ["a", "b", "c"]
     frequencies = [3, 6, 1]
-    root = SigmaTreeNode("bca", 10)
-    right_node = SigmaTreeNode("ca", 4)
+    root = SigmaTreeNode("cab", 10)
+    left_node = SigmaTreeNode("ca", 4)
     a_node = SigmaTreeNode("a", 3)
     b_node = SigmaTreeNode("b", 6)
     c_node = SigmaTreeNode("c", 1)
-    root.left_child = b_node
-    root.right_child = right_node
-    right_node.left_child = c_node
-    right_node.right_child = a_node
+    root.left_child = left_node
+    root.right_child = b_node
+    left_node.left_child = c_node
+    left_node.right_child = a_node
 
-    encoded_alphabet = [root, right_node, a_node, b_node, c_node]
+    encoded_alphabet = [root, left_node, a_node, b_node, c_node]
     nodes = huffman_code(alphabet, frequencies)
     # Check that the nodes outputted by the huffman encoding are contained in the encoded alphabet built by hand.
     for node in nodes:
         assert node in encoded_alphabet
+
+
+def test_huffman_code_heap_factory():
+    alphabet = ["a", "b", "c", "d"]
+    frequencies = [3, 6, 1, 2]
+    for heap_factory in [DaryMinHeap, PairingHeap]:
+        nodes = huffman_code(alphabet, frequencies, heap_factory)
+        # The last node is the root of the tree which holds all symbols
+        assert nodes[-1].frequency == 12
+        assert sorted(nodes[-1].symbol) == alphabet
+        assert len(nodes) == 2 * len(alphabet) - 1
+
+
+def test_huffman_code_merged_node_order():
+    # The merged node of frequency 2 must be extracted before both nodes of frequency 10
+    alphabet = ["a", "b", "c", "d"]
+    frequencies = [1, 1, 10, 10]
+    for heap_factory in [None, DaryMinHeap, PairingHeap]:
+        if heap_factory is None:
+            nodes = huffman_code(alphabet, frequencies)
+        else:
+            nodes = huffman_code(alphabet, frequencies, heap_factory)
+        extracted_frequencies = [node.frequency for node in nodes]
+        assert extracted_frequencies == sorted(extracted_frequencies)
+        assert nodes[-1].frequency == 22
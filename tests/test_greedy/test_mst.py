@@ -1,5 +1,5 @@
 from greedy.MST import prim, prim_heap, kruskal
-from graphs.datastructures import UndirectedGraph
+from graphs.datastructures import UndirectedGraph, CSRGraph, DaryMinHeap, PairingHeap
 
 
 def test_prim(test_graph_weighted_2):
@@ -48,3 +48,15 @@ def test_kruskal(test_graph_weighted_2):
     miniminum_spanning_tree.add_edge(3, 5, 4)
 
     assert miniminum_spanning_tree == kruskal(test_graph_weighted_2)
+
+
+def test_mst_csr(test_graph_weighted_2):
+    csr_graph = CSRGraph.from_graph(test_graph_weighted_2)
+    assert prim_heap(test_graph_weighted_2) == prim_heap(csr_graph)
+    assert kruskal(test_graph_weighted_2) == kruskal(csr_graph)
+
+
+def test_prim_heap_factory(test_graph_weighted_2):
+    minimum_spanning_tree = prim_heap(test_graph_weighted_2)
+    assert minimum_spanning_tree == prim_heap(test_graph_weighted_2, DaryMinHeap)
+    assert minimum_spanning_tree == prim_heap(test_graph_weighted_2, PairingHeap)